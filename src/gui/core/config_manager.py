@@ -4,10 +4,45 @@
 
 import os
 import json
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from constants import CONFIG_DIR
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+# 已解析的規範設定快取：絕對路徑 -> (修改時間 ns, 檔案大小, 內容)
+# 規範內容載入後只供讀取，快取直接回傳同一份 dict
+_CONFIG_CACHE: Dict[str, Tuple[int, int, Dict]] = {}
+
+
+def _read_config_json(path: str) -> Dict:
+    """讀取規範 JSON (檔案未變更時直接回傳上次解析結果)"""
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    if HAS_ORJSON:
+        # orjson 不接受 BOM，先去除 (規範檔可能由 Windows 編輯器存成 UTF-8 with BOM)
+        # 格式錯誤時拋出的 orjson.JSONDecodeError 為 json.JSONDecodeError 子類別
+        with open(key, "rb") as f:
+            raw = f.read()
+        if raw.startswith(_UTF8_BOM):
+            raw = raw[len(_UTF8_BOM):]
+        data = orjson.loads(raw)
+    else:
+        with open(key, "r", encoding="utf-8-sig") as f:
+            data = json.load(f)
+    _CONFIG_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
 
 class ConfigManager:
     """規範設定管理器 - 負責載入和驗證規範設定檔"""
@@ -32,14 +67,13 @@ class ConfigManager:
                 full_path = os.path.join(self.config_dir, filename)
                 display_name = filename
                 try:
-                    with open(full_path, "r", encoding="utf-8-sig") as f:
-                        data = json.load(f)
-                        if "standard_name" in data:
-                            display_name = data["standard_name"]
-                        elif "standard_version" in data:
-                            display_name = (
-                                f"規範版本 {data['standard_version']} ({filename})"
-                            )
+                    data = _read_config_json(full_path)
+                    if "standard_name" in data:
+                        display_name = data["standard_name"]
+                    elif "standard_version" in data:
+                        display_name = (
+                            f"規範版本 {data['standard_version']} ({filename})"
+                        )
                 except Exception as e:
                     display_name = f"{filename} (讀取錯誤)"
                 configs.append({"name": display_name, "path": full_path})
@@ -61,8 +95,7 @@ class ConfigManager:
     def load_config(self, path: str) -> Dict:
         filename = os.path.basename(path)
         try:
-            with open(path, "r", encoding="utf-8-sig") as f:
-                data = json.load(f)
+            data = _read_config_json(path)
             self._validate_config_integrity(data, filename)
             return data
         except json.JSONDecodeError as e:
@@ -5,10 +5,19 @@
 import os
 import json
 import shutil
-from datetime import datetime
+import time
+from dataclasses import dataclass
+from functools import partial
 from typing import Dict, List, Optional, Tuple
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import (
+    QObject,
+    Signal,
+    QTimer,
+    QCoreApplication,
+    QRunnable,
+    QThreadPool,
+)
 
 from constants import (
     PROJECT_SETTINGS_FILENAME,
@@ -36,22 +45,172 @@ from constants import (
 )
 from infrastructure.photo_server import PhotoServer
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _dump_json_bytes(data) -> bytes:
+    """序列化專案資料為 UTF-8 JSON (有 orjson 時使用較快的實作)"""
+    if HAS_ORJSON:
+        # orjson 只支援 2 格縮排
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=4).encode("utf-8")
+
+
+def _load_json_file(path: str):
+    """讀取 UTF-8 JSON 檔 (有 orjson 時直接解析整個檔案的位元組)"""
+    if HAS_ORJSON:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# 判定下拉選單的固定選項 -> 顯示狀態 (精確比對，一次查表)
+_RESULT_STATUS = {
+    STATUS_UNCHECKED: STATUS_NOT_TESTED,
+    STATUS_PASS: "Pass",
+    STATUS_FAIL: "Fail",
+    STATUS_NA: "N/A",
+}
+
+# 查無測項資料時共用的唯讀預設值 (避免每次建立新 dict)
+_EMPTY_DICT: Dict = {}
+
+
+def _classify_result(res: str) -> str:
+    """將判定結果轉為顯示狀態 (非固定選項的舊資料才退回逐一子字串比對)"""
+    status = _RESULT_STATUS.get(res)
+    if status is not None:
+        return status
+    if STATUS_UNCHECKED in res:
+        return STATUS_NOT_TESTED
+    if STATUS_PASS in res:
+        return "Pass"
+    if STATUS_FAIL in res:
+        return "Fail"
+    if STATUS_NA in res:
+        return "N/A"
+    return STATUS_UNKNOWN
+
+
+class _FileCopySignals(QObject):
+    """FileCopyTask 的信號 (QRunnable 本身不是 QObject)"""
+
+    # (已完成複製的目的路徑列表, 錯誤訊息；全部成功時為空字串)
+    finished = Signal(list, str)
+
+
+class FileCopyTask(QRunnable):
+    """在背景執行緒複製檔案，避免大型佐證檔凍結介面"""
+
+    def __init__(self, pairs: List[Tuple[str, str]], keep_stat: bool = False):
+        super().__init__()
+        self.pairs = pairs
+        self.keep_stat = keep_stat
+        self.signals = _FileCopySignals()
+
+    def run(self):
+        # copyfile 在 Linux/macOS 由核心直接複製 (sendfile/fcopyfile)；
+        # 需保留原修改時間時才用 copy2
+        copy = shutil.copy2 if self.keep_stat else shutil.copyfile
+        done = []
+        errors = []
+        for src, dst in self.pairs:
+            try:
+                copy(src, dst)
+                done.append(dst)
+            except OSError as e:
+                errors.append(f"{os.path.basename(src)}: {e}")
+        self.signals.finished.emit(done, "\n".join(errors))
+
+
+@dataclass(slots=True, frozen=True)
+class ItemSpec:
+    """測項設定摘要 (載入規範時建立一次，狀態計算改用屬性存取而非 dict 查找)"""
+
+    uid: str
+    targets: Tuple[str, ...]
+    multi_target: bool
+    allow_share: bool
+
+    @classmethod
+    def from_config(cls, item_config: dict) -> "ItemSpec":
+        targets = tuple(item_config.get("targets", (TARGET_GCS,)))
+        return cls(
+            uid=item_config.get("uid", item_config.get("id")),
+            targets=targets,
+            multi_target=len(targets) > 1,
+            allow_share=bool(item_config.get("allow_share", False)),
+        )
+
 
 class ProjectManager(QObject):
     """專案管理器 - 負責專案的建立、載入、儲存和資料管理"""
 
     data_changed = Signal()
+    # 只有單一測項的結果或 meta 變更 (uid)，介面只需更新該列
+    test_updated = Signal(str)
     photo_received = Signal(str, str, str, str)  # item_uid, target, path, title
 
+    # 測項結果變更後延遲寫檔的時間 (毫秒)，連續變更只寫入一次
+    SAVE_DELAY_MS = 500
+
     def __init__(self):
         super().__init__()
         self.current_project_path: Optional[str] = None
         self.project_data: Dict = {}
         self.settings_filename = PROJECT_SETTINGS_FILENAME
         self.std_config: Dict = {}
+        # 測項 UID -> ItemSpec (隨規範設定更新)
+        self._item_specs: Dict[str, ItemSpec] = {}
+        # 規範索引：測項 ID/UID -> section_id、section_id -> 測項列表 / UID 集合
+        self._item_to_section: Dict[str, str] = {}
+        self._section_items: Dict[str, List[Dict]] = {}
+        self._section_uids: Dict[str, frozenset] = {}
+        # 可見範圍快取 (is_adhoc, 集合或 None)，資料版本變更時重建
+        self._scope: Tuple[bool, Optional[frozenset]] = (False, None)
+        self._scope_revision = -1
+        # 測項狀態快取：uid -> 狀態表，資料版本變更時整批清除
+        self._status_cache: Dict[str, Tuple[Dict[str, str], bool]] = {}
+        self._completed_cache: Dict[str, bool] = {}
+        self._status_cache_revision = -1
         self.server = PhotoServer(port=8000)
         self.server.photo_received.connect(self.handle_mobile_photo)
 
+        # 延遲儲存：高頻率的編輯只標記為已修改，由計時器合併寫檔
+        self._dirty = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.flush)
+
+        # data_changed 合併發送：同一輪事件迴圈內的多次變更只通知一次
+        self._emit_pending = False
+        # 本輪是否有全面性變更 (發 data_changed)，否則只發送變更測項的 test_updated
+        self._full_change = False
+        self._changed_tests: set = set()
+        # 資料版本號：每次變更立即遞增 (供快取判斷是否過期，不必等信號)
+        self._revision = 0
+
+        # 上次寫入的 (檔案路徑, 內容雜湊)，內容未變時略過寫檔
+        self._last_saved: Optional[Tuple[str, int]] = None
+        # 記憶體中 project_data 對應的設定檔狀態 (絕對路徑, 修改時間 ns, 大小)；
+        # 重新開啟同一個未變更的專案時不必再解析
+        self._disk_signature: Optional[Tuple[str, int, int]] = None
+
+        # 背景複製中的附件目的路徑 (尚未落地，產生檔名時視為已存在)
+        self._reserved_paths: set = set()
+
+        # 程式結束前寫入尚未儲存的變更
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
+
     def stop_server(self):
         """停止手機上傳伺服器"""
         if self.server and self.server.is_running():
@@ -113,6 +272,39 @@ class ProjectManager(QObject):
 
     def set_standard_config(self, config):
         self.std_config = config
+        specs = {}
+        item_to_section = {}
+        section_items = {}
+        section_uids = {}
+        for section in config.get("test_standards", []):
+            sec_id = str(section["section_id"])
+            items = section.get("items", [])
+            # 重複的 ID 以第一個出現者為準 (與原本的線性搜尋一致)
+            section_items.setdefault(sec_id, items)
+            section_uids.setdefault(
+                sec_id, frozenset(item.get("uid") for item in items)
+            )
+            for item in items:
+                spec = ItemSpec.from_config(item)
+                specs[spec.uid] = spec
+                for ident in (item.get("id"), item.get("uid")):
+                    if ident is not None:
+                        item_to_section.setdefault(ident, sec_id)
+        self._item_specs = specs
+        self._status_cache = {}
+        self._completed_cache = {}
+        self._item_to_section = item_to_section
+        self._section_items = section_items
+        self._section_uids = section_uids
+
+    def item_spec(self, item) -> ItemSpec:
+        """取得測項摘要 (可傳入 ItemSpec 或原始設定 dict；不在目前規範中時臨時建立)"""
+        if isinstance(item, ItemSpec):
+            return item
+        spec = self._item_specs.get(item.get("uid", item.get("id")))
+        if spec is None:
+            spec = ItemSpec.from_config(item)
+        return spec
 
     """
         # def save_snapshot(self, note="backup"):
@@ -301,54 +493,57 @@ class ProjectManager(QObject):
     def get_current_project_type(self) -> str:
         return self.project_data.get("info", {}).get("project_type", PROJECT_TYPE_FULL)
 
+    def _get_scope(self) -> Tuple[bool, Optional[frozenset]]:
+        """
+        取得目前專案的可見範圍 (依資料版本快取)
+
+        Returns:
+            (是否為臨時專案, 白名單 UID 或 section_id 集合；None 表示全部可見)
+        """
+        if self._scope_revision != self._revision:
+            info = self.project_data.get("info", {})
+            p_type = info.get("project_type", PROJECT_TYPE_FULL)
+            if p_type == PROJECT_TYPE_ADHOC:
+                self._scope = (True, frozenset(info.get("target_items", [])))
+            else:
+                scope = info.get("test_scope", [])
+                if not scope and "test_scope" not in info:
+                    self._scope = (False, None)
+                else:
+                    self._scope = (False, frozenset(scope))
+            self._scope_revision = self._revision
+        return self._scope
+
     def is_item_visible(self, item_id) -> bool:
         if not self.current_project_path:
             return False
-        info = self.project_data.get("info", {})
-        p_type = info.get("project_type", PROJECT_TYPE_FULL)
-        if p_type == PROJECT_TYPE_ADHOC:
-            whitelist = info.get("target_items", [])
-            return item_id in whitelist
-        else:
-            scope = info.get("test_scope", [])
-            if not scope and "test_scope" not in info:
-                return True
-            section_id = self._find_section_id_by_item(item_id)
-            return section_id in scope
+        is_adhoc, scope = self._get_scope()
+        if is_adhoc:
+            return item_id in scope
+        if scope is None:
+            return True
+        return self._find_section_id_by_item(item_id) in scope
 
     def is_section_visible(self, section_id) -> bool:
         if not self.current_project_path:
             return False
-        info = self.project_data.get("info", {})
-        p_type = info.get("project_type", PROJECT_TYPE_FULL)
-        if p_type == PROJECT_TYPE_ADHOC:
-            whitelist = info.get("target_items", [])
-            section_items = self._get_items_in_section(section_id)
-            return any(item.get("uid") in whitelist for item in section_items)
-        else:
-            scope = info.get("test_scope", [])
-            if not scope and "test_scope" not in info:
-                return True
-            return str(section_id) in scope
+        is_adhoc, scope = self._get_scope()
+        if is_adhoc:
+            section_uids = self._section_uids.get(str(section_id), frozenset())
+            return not scope.isdisjoint(section_uids)
+        if scope is None:
+            return True
+        return str(section_id) in scope
 
     def _find_section_id_by_item(self, item_identifier) -> str:
         """根據 ID 或 UID 查找該項目所屬的 section_id"""
-        for sec in self.std_config.get("test_standards", []):
-            for item in sec["items"]:
-                if (
-                    item.get("id") == item_identifier
-                    or item.get("uid") == item_identifier
-                ):
-                    return str(sec["section_id"])
-        return ""
+        return self._item_to_section.get(item_identifier, "")
 
     def _get_items_in_section(self, section_id) -> List[Dict]:
-        for sec in self.std_config.get("test_standards", []):
-            if str(sec["section_id"]) == str(section_id):
-                return sec["items"]
-        return []
+        return self._section_items.get(str(section_id), [])
 
     def create_project(self, form_data: dict) -> Tuple[bool, str]:
+        self.flush()
         raw_base_path = form_data.get("save_path")
         project_name = form_data.get("project_name")
         if not raw_base_path or not project_name:
@@ -371,7 +566,8 @@ class ProjectManager(QObject):
     def create_ad_hoc_project(
         self, selected_items: list, save_base_path: str
     ) -> Tuple[bool, str]:
-        ts_str = datetime.now().strftime(DATE_FMT_PY_FILENAME_SHORT)
+        self.flush()
+        ts_str = time.strftime(DATE_FMT_PY_FILENAME_SHORT)
         folder_name = f"QuickTest_{ts_str}"
         target_folder = os.path.join(save_base_path, folder_name)
         final_path = self._get_unique_path(target_folder)
@@ -384,7 +580,7 @@ class ProjectManager(QObject):
                 info_data[key] = os.path.basename(final_path)
                 continue
             if f_type == "date":
-                info_data[key] = datetime.now().strftime(DATE_FMT_PY_DATE)
+                info_data[key] = time.strftime(DATE_FMT_PY_DATE)
             elif f_type == "checkbox_group":
                 info_data[key] = []
             elif f_type == "path_selector":
@@ -417,6 +613,7 @@ class ProjectManager(QObject):
         """另存新檔並升級規範版本"""
         if not self.current_project_path:
             return False, "未開啟專案"
+        self.flush()
 
         parent_dir = os.path.dirname(self.current_project_path)
         new_project_path = os.path.join(parent_dir, new_project_name)
@@ -499,8 +696,8 @@ class ProjectManager(QObject):
 
             # 寫入新的 json 檔案
             new_json_path = os.path.join(new_project_path, self.settings_filename)
-            with open(new_json_path, "w", encoding="utf-8") as f:
-                json.dump(new_data, f, ensure_ascii=False, indent=4)
+            with open(new_json_path, "wb") as f:
+                f.write(_dump_json_bytes(new_data))
 
             return True, new_project_path
 
@@ -509,7 +706,33 @@ class ProjectManager(QObject):
                 shutil.rmtree(new_project_path)
             return False, str(e)
 
+    @staticmethod
+    def _file_signature(path: str) -> Optional[Tuple[str, int, int]]:
+        """取得檔案識別 (絕對路徑, 修改時間 ns, 大小)，檔案不存在時為 None"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return os.path.abspath(path), st.st_mtime_ns, st.st_size
+
     def _get_unique_path(self, target_folder) -> str:
+        # 先列出上層資料夾一次，在記憶體中找出第一個未使用的編號
+        parent, base = os.path.split(target_folder)
+        try:
+            siblings = {os.path.normcase(n) for n in os.listdir(parent or ".")}
+        except OSError:
+            siblings = None
+        if siblings is not None:
+            name = base
+            i = 0
+            while os.path.normcase(name) in siblings:
+                i += 1
+                name = f"{base}_{i}"
+            candidate = os.path.join(parent, name)
+            # 再確認一次 (例如大小寫不敏感的檔案系統)，不符時改用逐一檢查
+            if not os.path.exists(candidate):
+                return candidate
+
         final_path = target_folder
         if os.path.exists(final_path):
             i = 1
@@ -526,6 +749,8 @@ class ProjectManager(QObject):
             os.makedirs(path, exist_ok=True)
             os.makedirs(os.path.join(path, DIR_IMAGES), exist_ok=True)
             os.makedirs(os.path.join(path, DIR_REPORTS), exist_ok=True)
+            # 專案資料已整份替換，讓依版本號的快取失效
+            self._revision += 1
             self.current_project_path = path
             self.current_project_path = path
             self.save_all()
@@ -539,23 +764,29 @@ class ProjectManager(QObject):
         if not os.path.exists(json_path):
             return None
         try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return data.get("standard_name")
+            data = _load_json_file(json_path)
+            return data.get("standard_name")
         except:
             return None
 
     def load_project(self, folder_path: str) -> Tuple[bool, str]:
+        self.flush()
         json_path = os.path.join(folder_path, self.settings_filename)
         if not os.path.exists(json_path):
             return False, "找不到專案設定檔"
         try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                self.project_data = json.load(f)
-            self.current_project_path = folder_path
+            # flush 後記憶體與檔案一致；檔案未被外部修改就直接沿用目前資料
+            signature = self._file_signature(json_path)
+            if (
+                signature is None
+                or signature != self._disk_signature
+                or not self.current_project_path
+            ):
+                self.project_data = _load_json_file(json_path)
+                self._disk_signature = signature
             self.current_project_path = folder_path
             self._sync_server_data()
-            self.data_changed.emit()
+            self._schedule_emit()
             return True, "讀取成功"
         except Exception as e:
             return False, f"讀取失敗: {e}"
@@ -632,53 +863,122 @@ class ProjectManager(QObject):
         
         檔名格式：{yyyymmdd_hhmm}_{type}_{title}.{ext}
         """
-        if not self.current_project_path:
-            return None
-        
         try:
-            # 取得副檔名
-            _, ext = os.path.splitext(src_path)
-            ext = ext.lower()
-            
-            # 產生時間戳
-            ts = datetime.now().strftime(DATE_FMT_PY_FILENAME_SHORT)
-            
-            # 處理標題 (如果沒有標題，使用原檔名)
-            if not title:
-                title = os.path.splitext(os.path.basename(src_path))[0]
-            safe_title = sanitize_filename(title)
-            
-            # 組合檔名
-            new_filename = f"{ts}_{file_type}_{safe_title}{ext}"
-            
-            # 取得目標資料夾（支援多目標）
-            item_folder = self.get_item_folder(
-                item_id, item_name, targets=targets, target=target, is_shared=is_shared
+            planned = self._prepare_attachment(
+                src_path, item_id, item_name, file_type, title, targets, target, is_shared
             )
-            target_dir = os.path.join(self.current_project_path, item_folder)
-            
-            if not os.path.exists(target_dir):
-                os.makedirs(target_dir)
-            
-            dest_path = os.path.join(target_dir, new_filename)
-            
-            # 如果檔案已存在，加上秒數時間戳
-            if os.path.exists(dest_path):
-                ts_sec = datetime.now().strftime("%H%M%S")
-                base, ext = os.path.splitext(new_filename)
-                new_filename = f"{base}_{ts_sec}{ext}"
-                dest_path = os.path.join(target_dir, new_filename)
-            
-            shutil.copy2(src_path, dest_path)
-            
-            # 回傳相對路徑
-            rel_path = os.path.relpath(dest_path, self.current_project_path)
-            return rel_path.replace("\\", "/")
+            if planned is None:
+                return None
+            dest_path, rel_path = planned
+
+            # copyfile 在 Linux/macOS 由核心直接複製 (sendfile/fcopyfile)，
+            # 且不複製檔案屬性 (匯入的附件不需保留原修改時間)
+            shutil.copyfile(src_path, dest_path)
+            return rel_path
             
         except Exception as e:
             print(f"匯入附件失敗: {e}")
             return None
 
+    def import_attachment_async(
+        self,
+        src_path: str,
+        item_id: str,
+        item_name: str,
+        file_type: str = "img",
+        title: str = "",
+        targets: list = None,
+        target: str = None,
+        is_shared: bool = False,
+        on_done=None,
+    ) -> Optional[str]:
+        """
+        同 import_attachment，但檔案複製在背景執行緒進行
+
+        Args:
+            on_done: 複製完成後於主執行緒呼叫 on_done(已完成的目的路徑列表, 錯誤訊息)
+
+        Returns:
+            預定的相對路徑或 None (無法建立目的路徑時)
+        """
+        try:
+            planned = self._prepare_attachment(
+                src_path, item_id, item_name, file_type, title, targets, target, is_shared
+            )
+        except Exception as e:
+            print(f"匯入附件失敗: {e}")
+            return None
+        if planned is None:
+            return None
+        dest_path, rel_path = planned
+
+        self._reserved_paths.add(dest_path)
+        task = FileCopyTask([(src_path, dest_path)])
+        # 先釋放保留的檔名，再通知呼叫端
+        task.signals.finished.connect(partial(self._on_attachment_copied, dest_path))
+        if on_done is not None:
+            task.signals.finished.connect(on_done)
+        QThreadPool.globalInstance().start(task)
+        return rel_path
+
+    def _on_attachment_copied(self, dest_path: str, done: list, error: str):
+        # 成功或失敗都釋放保留的檔名
+        self._reserved_paths.discard(dest_path)
+        if error:
+            print(f"匯入附件失敗: {error}")
+
+    def _prepare_attachment(
+        self,
+        src_path: str,
+        item_id: str,
+        item_name: str,
+        file_type: str,
+        title: str,
+        targets: list,
+        target: str,
+        is_shared: bool,
+    ) -> Optional[Tuple[str, str]]:
+        """建立目的資料夾並產生不重複的附件檔名，回傳 (完整路徑, 相對路徑)"""
+        if not self.current_project_path:
+            return None
+
+        # 取得副檔名
+        _, ext = os.path.splitext(src_path)
+        ext = ext.lower()
+        
+        # 產生時間戳
+        ts = time.strftime(DATE_FMT_PY_FILENAME_SHORT)
+        
+        # 處理標題 (如果沒有標題，使用原檔名)
+        if not title:
+            title = os.path.splitext(os.path.basename(src_path))[0]
+        safe_title = sanitize_filename(title)
+        
+        # 組合檔名
+        new_filename = f"{ts}_{file_type}_{safe_title}{ext}"
+        
+        # 取得目標資料夾（支援多目標）
+        item_folder = self.get_item_folder(
+            item_id, item_name, targets=targets, target=target, is_shared=is_shared
+        )
+        target_dir = os.path.join(self.current_project_path, item_folder)
+        
+        if not os.path.exists(target_dir):
+            os.makedirs(target_dir)
+        
+        dest_path = os.path.join(target_dir, new_filename)
+        
+        # 如果檔案已存在 (或正在背景複製)，加上秒數時間戳
+        if dest_path in self._reserved_paths or os.path.exists(dest_path):
+            ts_sec = time.strftime("%H%M%S")
+            base, ext = os.path.splitext(new_filename)
+            new_filename = f"{base}_{ts_sec}{ext}"
+            dest_path = os.path.join(target_dir, new_filename)
+        
+        # 回傳相對路徑
+        rel_path = os.path.relpath(dest_path, self.current_project_path)
+        return dest_path, rel_path.replace("\\", "/")
+
     def move_to_trash(self, file_path: str) -> bool:
         """
         將檔案移動到同層的 trash 資料夾
@@ -714,7 +1014,7 @@ class ProjectManager(QObject):
             
             # 如果 trash 中已有同名檔案，加上時間戳
             if os.path.exists(dest_path):
-                ts = datetime.now().strftime(DATE_FMT_PY_FILENAME_SHORT)
+                ts = time.strftime(DATE_FMT_PY_FILENAME_SHORT)
                 base, ext = os.path.splitext(filename)
                 dest_path = os.path.join(trash_dir, f"{base}_{ts}{ext}")
             
@@ -764,7 +1064,7 @@ class ProjectManager(QObject):
                 file_type = parts[1] if len(parts) > 1 else "img"
             else:
                 # 沒有標準格式，使用當前時間
-                timestamp = datetime.now().strftime(DATE_FMT_PY_FILENAME_SHORT)
+                timestamp = time.strftime(DATE_FMT_PY_FILENAME_SHORT)
                 file_type = "img"
             
             # 產生新檔名
@@ -778,7 +1078,7 @@ class ProjectManager(QObject):
             
             # 如果新檔名已存在，加上秒數時間戳
             if os.path.exists(new_path):
-                ts_sec = datetime.now().strftime("%H%M%S")
+                ts_sec = time.strftime("%H%M%S")
                 new_filename = f"{timestamp}_{file_type}_{safe_title}_{ts_sec}{ext}"
                 new_path = os.path.join(file_dir, new_filename)
             
@@ -801,8 +1101,7 @@ class ProjectManager(QObject):
             return False, "來源無效 (找不到 project_settings.json)"
 
         try:
-            with open(source_json_path, "r", encoding="utf-8") as f:
-                source_data = json.load(f)
+            source_data = _load_json_file(source_json_path)
 
             # 檢查類型
             if source_data.get("info", {}).get("project_type") != PROJECT_TYPE_ADHOC:
@@ -818,22 +1117,28 @@ class ProjectManager(QObject):
                     f"規範版本不符，無法合併！\n\n主專案規範: {curr_std}\n來源檔規範: {src_std}",
                 )
 
-            # 複製檔案
+            # 收集要複製的檔案 (實際複製交給背景執行緒)
+            copy_pairs = []
             for sub in [DIR_IMAGES, DIR_REPORTS]:
                 src_sub_dir = os.path.join(source_folder, sub)
                 if not os.path.exists(src_sub_dir):
                     continue
                 dest_sub_dir = os.path.join(self.current_project_path, sub)
-                if not os.path.exists(dest_sub_dir):
-                    os.makedirs(dest_sub_dir)
-
-                for filename in os.listdir(src_sub_dir):
-                    s_file = os.path.join(src_sub_dir, filename)
-                    d_file = os.path.join(dest_sub_dir, filename)
-                    if os.path.exists(d_file):
-                        d_file = os.path.join(dest_sub_dir, f"merged_{filename}")
-                    if os.path.isfile(s_file):
-                        shutil.copy2(s_file, d_file)
+                os.makedirs(dest_sub_dir, exist_ok=True)
+
+                # 目的資料夾既有檔名只列一次，逐檔以集合判斷是否重名
+                dest_existing = set(os.listdir(dest_sub_dir))
+                # scandir 的 DirEntry 已帶檔案類型，不必逐檔 stat
+                with os.scandir(src_sub_dir) as it:
+                    for entry in it:
+                        if not entry.is_file():
+                            continue
+                        filename = entry.name
+                        if filename in dest_existing:
+                            filename = f"merged_{filename}"
+                        copy_pairs.append(
+                            (entry.path, os.path.join(dest_sub_dir, filename))
+                        )
 
             # 合併測試數據
             source_tests = source_data.get("tests", {})
@@ -849,19 +1154,32 @@ class ProjectManager(QObject):
 
             self.save_all()
             self._sync_server_data()
-            self.data_changed.emit()
-            return True, f"成功合併 {merged_count} 筆測項資料"
+            self._schedule_emit()
+
+            msg = f"成功合併 {merged_count} 筆測項資料"
+            if copy_pairs:
+                task = FileCopyTask(copy_pairs, keep_stat=True)
+                task.signals.finished.connect(self._on_merge_files_copied)
+                QThreadPool.globalInstance().start(task)
+                msg += f"\n{len(copy_pairs)} 個佐證檔案正在背景複製"
+            return True, msg
 
         except Exception as e:
             return False, f"合併失敗: {str(e)}"
 
+    def _on_merge_files_copied(self, done: list, error: str):
+        if error:
+            print(f"合併檔案複製失敗: {error}")
+        # 佐證檔案到齊後再通知介面更新 (縮圖、附件列表)
+        self._schedule_emit()
+
     def update_info(self, new_info):
         if not self.current_project_path:
             return False
         self.project_data.setdefault("info", {}).update(new_info)
-        self.save_all()
+        self.schedule_save()
         self._sync_server_data()
-        self.data_changed.emit()
+        self._schedule_emit()
         return True
 
     def update_test_result(self, test_uid, target, result_data, is_shared=False):
@@ -872,11 +1190,11 @@ class ProjectManager(QObject):
         self.project_data["tests"][test_uid][target] = result_data
         self.project_data["tests"][test_uid][target][
             "last_updated"
-        ] = datetime.now().strftime(DATE_FMT_PY_DATETIME)
+        ] = time.strftime(DATE_FMT_PY_DATETIME)
         meta = self.project_data["tests"][test_uid].setdefault("__meta__", {})
         meta["is_shared"] = is_shared
-        self.save_all()
-        self.data_changed.emit()
+        self.schedule_save()
+        self._schedule_test_emit(test_uid)
 
     def get_test_result(self, test_uid, target, is_shared=False):
         """取得測項結果"""
@@ -901,7 +1219,7 @@ class ProjectManager(QObject):
 
         self.save_all()
         self._sync_server_data()
-        self.data_changed.emit()
+        self._schedule_emit()
 
     def get_project_name(self) -> str:
         """取得專案名稱"""
@@ -931,58 +1249,129 @@ class ProjectManager(QObject):
             self.project_data["tests"][test_uid]["__meta__"] = {}
         
         self.project_data["tests"][test_uid]["__meta__"].update(meta_update)
-        self.save_all()
-        self.data_changed.emit()
+        self.schedule_save()
+        self._schedule_test_emit(test_uid)
+
+    @property
+    def data_revision(self) -> int:
+        """資料版本號 (任何變更都會遞增)"""
+        return self._revision
+
+    def _schedule_emit(self):
+        """標記資料已變更，並在回到事件迴圈時發送一次 data_changed"""
+        self._full_change = True
+        self._queue_emit()
+
+    def _schedule_test_emit(self, test_uid: str):
+        """標記單一測項已變更，回到事件迴圈時只發送該測項的 test_updated"""
+        self._changed_tests.add(test_uid)
+        self._queue_emit()
+
+    def _queue_emit(self):
+        self._revision += 1
+        if not self._emit_pending:
+            self._emit_pending = True
+            QTimer.singleShot(0, self._emit_data_changed)
+
+    def _emit_data_changed(self):
+        self._emit_pending = False
+        changed_tests = self._changed_tests
+        self._changed_tests = set()
+        # 全面性變更已涵蓋個別測項，不再逐一通知
+        if self._full_change:
+            self._full_change = False
+            self.data_changed.emit()
+            return
+        for test_uid in changed_tests:
+            self.test_updated.emit(test_uid)
+
+    def schedule_save(self):
+        """標記資料已修改，並在 SAVE_DELAY_MS 內無新變更時寫檔"""
+        self._dirty = True
+        self._save_timer.start()
+
+    def flush(self):
+        """立即寫入尚未儲存的變更 (切換專案與程式結束前呼叫)"""
+        if not self._dirty:
+            return True, "Clean"
+        return self.save_all()
 
     def save_all(self):
+        # 完整寫檔已包含所有待儲存的變更
+        self._save_timer.stop()
+        self._dirty = False
         if not self.current_project_path:
             return False, "No Path"
         path = os.path.join(self.current_project_path, self.settings_filename)
         temp_path = path + ".tmp"
         try:
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(self.project_data, f, ensure_ascii=False, indent=4)
+            payload = _dump_json_bytes(self.project_data)
+            # 內容與上次寫入相同則不重寫檔案
+            saved = (path, hash(payload))
+            if saved == self._last_saved and os.path.exists(path):
+                return True, "Unchanged"
+
+            # 先寫入暫存檔再原子替換，寫到一半當機也不會損毀設定檔
+            with open(temp_path, "wb") as f:
+                f.write(payload)
                 f.flush()
                 os.fsync(f.fileno())
+            os.replace(temp_path, path)
 
-            if os.path.exists(path):
-                os.replace(temp_path, path)
-            else:
-                os.rename(temp_path, path)
-
+            self._last_saved = saved
+            self._disk_signature = self._file_signature(path)
             return True, "Saved"
         except Exception as e:
             if os.path.exists(temp_path):
                 os.remove(temp_path)
+            # 寫檔失敗時保留修改標記，結束前會再嘗試一次
+            self._dirty = True
             return False, str(e)
 
-    def get_test_status_detail(self, item_config) -> Dict[str, str]:
-        uid = item_config.get("uid", item_config.get("id"))
-        targets = item_config.get("targets", [TARGET_GCS])
-        item_data = self.project_data.get("tests", {}).get(uid, {})
+    def get_test_status_detail(self, item) -> Dict[str, str]:
+        """取得測項各目標的狀態 (依資料版本快取，回傳值請勿修改)"""
+        return self.get_test_status_summary(item)[0]
+
+    def get_test_status_summary(self, item) -> Tuple[Dict[str, str], bool]:
+        """
+        取得測項各目標狀態與是否全部目標皆已檢測
+
+        Returns:
+            (status_map, all_tested)；與狀態表同一趟計算並依資料版本快取
+        """
+        spec = self.item_spec(item)
+        self._check_status_cache()
+        cached = self._status_cache.get(spec.uid)
+        if cached is None:
+            cached = self._status_cache[spec.uid] = self._build_status_detail(spec)
+        return cached
+
+    def _check_status_cache(self):
+        """資料版本變動時清空狀態與完成度快取"""
+        if self._status_cache_revision != self._revision:
+            self._status_cache = {}
+            self._completed_cache = {}
+            self._status_cache_revision = self._revision
+
+    def _build_status_detail(self, spec: ItemSpec) -> Tuple[Dict[str, str], bool]:
+        targets = spec.targets
+        item_data = self.project_data.get("tests", {}).get(spec.uid, {})
         
         # 檢查是否為共用模式
         meta = item_data.get("__meta__", {})
         is_shared = meta.get("is_shared", False)
         
         status_map = {}
+        all_tested = True
         
-        if is_shared and len(targets) > 1:
+        if is_shared and spec.multi_target:
             # 共用模式：使用 Shared 的結果顯示各 target
             shared_data = item_data.get("Shared", {})
-            res = shared_data.get("result", STATUS_UNCHECKED)
-            
             # 判斷 Shared 的狀態
-            if STATUS_UNCHECKED in res:
-                shared_status = STATUS_NOT_TESTED
-            elif STATUS_PASS in res:
-                shared_status = "Pass"
-            elif STATUS_FAIL in res:
-                shared_status = "Fail"
-            elif STATUS_NA in res:
-                shared_status = "N/A"
-            else:
-                shared_status = STATUS_UNKNOWN
+            shared_status = _classify_result(
+                shared_data.get("result", STATUS_UNCHECKED)
+            )
+            all_tested = shared_status != STATUS_NOT_TESTED
             
             # 將同一狀態套用到所有 target
             for t in targets:
@@ -992,41 +1381,64 @@ class ProjectManager(QObject):
             for t in targets:
                 if t not in item_data:
                     status_map[t] = STATUS_NOT_TESTED
+                    all_tested = False
                 else:
-                    res = item_data[t].get("result", STATUS_UNCHECKED)
-                    if STATUS_UNCHECKED in res:
-                        status_map[t] = STATUS_NOT_TESTED
-                    elif STATUS_PASS in res:
-                        status_map[t] = "Pass"
-                    elif STATUS_FAIL in res:
-                        status_map[t] = "Fail"
-                    elif STATUS_NA in res:
-                        status_map[t] = "N/A"
-                    else:
-                        status_map[t] = STATUS_UNKNOWN
-        return status_map
-
-    def is_test_fully_completed(self, item_config) -> bool:
-        uid = item_config.get("uid", item_config.get("id"))
-        targets = item_config.get("targets", [TARGET_GCS])
-        saved = self.project_data.get("tests", {}).get(uid, {})
-        
+                    status = _classify_result(
+                        item_data[t].get("result", STATUS_UNCHECKED)
+                    )
+                    status_map[t] = status
+                    if status == STATUS_NOT_TESTED:
+                        all_tested = False
+        return status_map, all_tested
+
+    @staticmethod
+    def _is_item_completed(saved: dict, spec: ItemSpec) -> bool:
+        """依測項的已存資料判斷是否全部判定完成 (遇到第一個未判定即返回)"""
         # 檢查是否為共用模式
-        meta = saved.get("__meta__", {})
-        is_shared = meta.get("is_shared", False)
-        
-        if is_shared and len(targets) > 1:
-            # 共用模式：只檢查 Shared 的結果
-            if "Shared" not in saved:
-                return False
-            if STATUS_UNCHECKED in saved["Shared"].get("result", STATUS_UNCHECKED):
-                return False
-            return True
-        else:
-            # 分開模式：檢查每個 target
-            for t in targets:
-                if t not in saved:
-                    return False
-                if STATUS_UNCHECKED in saved[t].get("result", STATUS_UNCHECKED):
+        meta = saved.get("__meta__")
+        keys = (
+            ("Shared",)
+            if spec.multi_target and meta and meta.get("is_shared", False)
+            else spec.targets
+        )
+        # 與狀態顯示使用同一套判定，舊資料的非固定選項字串也能正確分類
+        try:
+            for t in keys:
+                res = saved[t].get("result", STATUS_UNCHECKED)
+                if _classify_result(res) == STATUS_NOT_TESTED:
                     return False
-            return True
+        except KeyError:
+            return False
+        return True
+
+    def is_test_fully_completed(self, item) -> bool:
+        spec = self.item_spec(item)
+        self._check_status_cache()
+        done = self._completed_cache.get(spec.uid)
+        if done is None:
+            saved = self.project_data.get("tests", {}).get(spec.uid, _EMPTY_DICT)
+            done = self._completed_cache[spec.uid] = self._is_item_completed(
+                saved, spec
+            )
+        return done
+
+    def compute_section_progress(self, section) -> Tuple[int, int]:
+        """
+        計算章節進度
+
+        Returns:
+            (已完成數, 可見測項總數)；tests 與可見範圍只查找一次
+        """
+        tests = self.project_data.get("tests", {})
+        is_completed = self._is_item_completed
+        is_visible = self.is_item_visible
+        item_spec = self.item_spec
+        done = total = 0
+        for item in section.get("items", []):
+            spec = item_spec(item)
+            if not is_visible(spec.uid):
+                continue
+            total += 1
+            if is_completed(tests.get(spec.uid, _EMPTY_DICT), spec):
+                done += 1
+        return done, total
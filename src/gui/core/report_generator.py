@@ -29,6 +29,12 @@ from constants import (
     DATE_FMT_PY_FILENAME_SHORT,
 )
 
+# 顯示狀態 -> 統計欄位 (未列出的狀態只計入總數)
+_STATUS_COUNT_KEY = {"Pass": "pass", "Fail": "fail", "N/A": "na"}
+
+# 顯示狀態 -> 報告判定文字
+_STATUS_RESULT_TEXT = {"Pass": "通過", "Fail": "不通過", "N/A": "不適用"}
+
 
 class ReportDataCollector:
     """
@@ -89,14 +95,9 @@ class ReportDataCollector:
                     target_counts[target]["total"] += 1
 
                     # 取得該 target 的狀態
-                    status = status_map.get(target, "未檢測")
-
-                    if status == "Pass":
-                        target_counts[target]["pass"] += 1
-                    elif status == "Fail":
-                        target_counts[target]["fail"] += 1
-                    elif status == "N/A":
-                        target_counts[target]["na"] += 1
+                    count_key = _STATUS_COUNT_KEY.get(status_map.get(target))
+                    if count_key is not None:
+                        target_counts[target][count_key] += 1
 
         # 轉換為報告格式
         summary = {}
@@ -469,14 +470,7 @@ class WordDocumentBuilder:
         target_status = status_map.get(target, "未檢測")
 
         # 轉換狀態文字
-        if target_status == "Pass":
-            result_text = "通過"
-        elif target_status == "Fail":
-            result_text = "不通過"
-        elif target_status == "N/A":
-            result_text = "不適用"
-        else:
-            result_text = "未檢測"
+        result_text = _STATUS_RESULT_TEXT.get(target_status, "未檢測")
 
         narrative = item.get("narrative", {})
         result_data = item.get("result_data", {})
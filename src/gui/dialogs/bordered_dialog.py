@@ -4,9 +4,9 @@
 """
 
 from PySide6.QtCore import Qt, QEvent, QSize
-from PySide6.QtGui import QColor, QCursor, QIcon, QPixmap, QPainter
-from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtGui import QColor, QCursor
 from PySide6.QtWidgets import (
+    QApplication,
     QDialog,
     QWidget,
     QVBoxLayout,
@@ -19,6 +19,7 @@ from PySide6.QtWidgets import (
 
 from styles import Styles, THEME
 from gui.constants import ICON_PATH, CLOSE_ICON_PATH
+from gui.title_bar_icons import get_app_icon_pixmap, get_button_icon
 
 
 class DialogTitleBar(QWidget):
@@ -41,24 +42,11 @@ class DialogTitleBar(QWidget):
         layout.setSpacing(0)
 
         # 應用程式圖標 (最左側) - 使用 QSvgRenderer 高品質渲染，支援高 DPI
-        from PySide6.QtWidgets import QApplication
-
         self.app_icon_label = QLabel(self)
         device_pixel_ratio = QApplication.primaryScreen().devicePixelRatio()
-        icon_size = 24
-        render_size = int(icon_size * device_pixel_ratio)
-
-        svg_renderer = QSvgRenderer(ICON_PATH)
-        app_icon_pixmap = QPixmap(render_size, render_size)
-        app_icon_pixmap.fill(Qt.transparent)
-        painter = QPainter(app_icon_pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-        svg_renderer.render(painter)
-        painter.end()
-        app_icon_pixmap.setDevicePixelRatio(device_pixel_ratio)
-
-        self.app_icon_label.setPixmap(app_icon_pixmap)
+        self.app_icon_label.setPixmap(
+            get_app_icon_pixmap(ICON_PATH, 24, device_pixel_ratio)
+        )
         self.app_icon_label.setFixedSize(28, 28)
         self.app_icon_label.setAlignment(Qt.AlignCenter)
         self.app_icon_label.setStyleSheet("background: transparent;")
@@ -69,7 +57,7 @@ class DialogTitleBar(QWidget):
 
         # 對話框只需要關閉按鈕 (使用 SVG 圖示)
         self.btn_close = QPushButton()
-        self.btn_close.setIcon(QIcon(CLOSE_ICON_PATH))
+        self.btn_close.setIcon(get_button_icon(CLOSE_ICON_PATH, 16, device_pixel_ratio))
         self.btn_close.setFixedSize(32, 32)
         self.btn_close.setIconSize(QSize(16, 16))
         self.btn_close.clicked.connect(parent_dialog.reject)  # 使用 reject 而非 close
@@ -298,7 +286,6 @@ class BorderedDialog(QDialog):
 if __name__ == "__main__":
     import sys
     from PySide6.QtWidgets import (
-        QApplication,
         QFormLayout,
         QLineEdit,
         QDateEdit,
@@ -16,7 +16,7 @@ if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
 from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtGui import QPalette, QColor
+from PySide6.QtGui import QPalette, QColor, QFont, QPixmapCache
 
 # 從新模組匯入
 from windows.main_app import MainApp
@@ -45,23 +45,30 @@ def create_light_theme_palette() -> QPalette:
     return palette
 
 
+def create_app_font() -> QFont:
+    """建立全域字型 (字型以 QApplication.setFont 設定，不寫在樣式表中，
+    調整字級時不需重新套用整份樣式表)"""
+    font = QFont()
+    font.setFamilies(["Microsoft JhengHei", "Segoe UI"])
+    font.setStyleHint(QFont.SansSerif)
+    font.setPointSize(10)
+    return font
+
+
 def get_global_stylesheet() -> str:
     """取得全域樣式表"""
-    font_family = '"Microsoft JhengHei", "Segoe UI", sans-serif'
-    return f"""
-        QWidget {{ 
-            font-family: {font_family}; 
-            font-size: 10pt; 
+    return """
+        QWidget { 
             color: #000000;
-        }}
-        QWidget:window {{
+        }
+        QWidget:window {
             background-color: #FFFFFF;
-        }}
-        QToolTip {{ 
+        }
+        QToolTip { 
             color: #000000; 
             background-color: #FFFFDC; 
             border: 1px solid black; 
-        }}
+        }
     """
 
 
@@ -75,8 +82,12 @@ def main():
 
     # 套用亮色主題
     app.setPalette(create_light_theme_palette())
+    app.setFont(create_app_font())
     app.setStyleSheet(get_global_stylesheet())
 
+    # 點陣快取 (照片縮圖、標題列圖示、浮動列外框) 上限 32 MB
+    QPixmapCache.setCacheLimit(32 * 1024)
+
     # 初始化設定管理器
     config_mgr = ConfigManager(config_dir=CONFIG_DIR)
 
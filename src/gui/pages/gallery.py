@@ -3,8 +3,10 @@
 """
 
 import os
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
+from typing import Optional
+
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable
+from PySide6.QtGui import QPixmap, QPixmapCache, QImage, QImageReader
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -17,6 +19,84 @@ from PySide6.QtWidgets import (
 from constants import PHOTO_ANGLES_ORDER, PHOTO_ANGLES_NAME
 
 
+def photo_preview_key(
+    full_path: str, width: int, height: int, dpr: float, mtime: Optional[float] = None
+) -> Optional[str]:
+    """
+    照片縮圖在 QPixmapCache 中的鍵值 (含修改時間，檔案更新後自動失效)；檔案不存在時回傳 None
+
+    呼叫端已 stat 過檔案時可直接傳入 mtime，省去重複查詢
+    """
+    if mtime is None:
+        try:
+            mtime = os.path.getmtime(full_path)
+        except OSError:
+            return None
+    return f"photo|{full_path}|{mtime}|{width}x{height}@{dpr}"
+
+
+def _decode_preview(full_path: str, width: int, height: int, dpr: float) -> QImage:
+    """直接以縮小尺寸解碼照片 (不解出整張原圖；QImage 可在背景執行緒使用)"""
+    reader = QImageReader(full_path)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if size.isValid():
+        target = size.scaled(int(width * dpr), int(height * dpr), Qt.KeepAspectRatio)
+        # 只縮小不放大
+        if target.width() < size.width():
+            reader.setScaledSize(target)
+    return reader.read()
+
+
+def cache_photo_preview(key: str, image: QImage, dpr: float) -> QPixmap:
+    """將解碼完成的縮圖轉為 QPixmap 並放入快取 (必須在主執行緒呼叫)"""
+    pixmap = QPixmap.fromImage(image)
+    pixmap.setDevicePixelRatio(dpr)
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def load_photo_preview(full_path: str, width: int, height: int, dpr: float) -> QPixmap:
+    """
+    載入符合顯示尺寸的照片縮圖 (同步版本，總覽與相簿共用快取)
+
+    結果以路徑與修改時間為鍵放入 QPixmapCache，重新整理或重開相簿時未變更的照片不再讀檔
+    """
+    key = photo_preview_key(full_path, width, height, dpr)
+    if key is None:
+        return QPixmap()
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = cache_photo_preview(
+            key, _decode_preview(full_path, width, height, dpr), dpr
+        )
+    return pixmap
+
+
+class _PhotoPreviewSignals(QObject):
+    """PhotoPreviewLoader 的信號 (QRunnable 本身不是 QObject)"""
+
+    # (快取鍵值, 縮圖)
+    loaded = Signal(str, QImage)
+
+
+class PhotoPreviewLoader(QRunnable):
+    """在背景執行緒解碼照片縮圖，主執行緒收到後再轉為 QPixmap"""
+
+    def __init__(self, key: str, full_path: str, width: int, height: int, dpr: float):
+        super().__init__()
+        self.key = key
+        self.full_path = full_path
+        self.width = width
+        self.height = height
+        self.dpr = dpr
+        self.signals = _PhotoPreviewSignals()
+
+    def run(self):
+        image = _decode_preview(self.full_path, self.width, self.height, self.dpr)
+        self.signals.loaded.emit(self.key, image)
+
+
 class GalleryWindow(QDialog):
     """六視角照片檢視視窗"""
 
@@ -64,10 +144,9 @@ class GalleryWindow(QDialog):
             if rel_path and self.pm.current_project_path:
                 full_path = os.path.join(self.pm.current_project_path, rel_path)
                 if os.path.exists(full_path):
-                    pixmap = QPixmap(full_path)
                     lbl_img.setPixmap(
-                        pixmap.scaled(
-                            320, 240, Qt.KeepAspectRatio, Qt.SmoothTransformation
+                        load_photo_preview(
+                            full_path, 320, 240, lbl_img.devicePixelRatioF()
                         )
                     )
                 else:
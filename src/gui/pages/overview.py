@@ -5,8 +5,8 @@
 import os
 from functools import partial
 
-from PySide6.QtCore import Qt, Slot
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import Qt, Slot, QThreadPool
+from PySide6.QtGui import QPixmapCache, QImage
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -29,7 +29,23 @@ from constants import (
     PHOTO_ANGLES_NAME,
     COLOR_BG_DEFAULT,
 )
-from .gallery import GalleryWindow
+from .gallery import (
+    GalleryWindow,
+    PhotoPreviewLoader,
+    photo_preview_key,
+    cache_photo_preview,
+)
+
+# 不在檢測範圍內的章節進度條樣式
+_OUT_OF_SCOPE_BAR_QSS = (
+    f"QProgressBar {{ color: gray; background-color: {COLOR_BG_DEFAULT}; }}"
+)
+
+# 照片狀態圓點：是否已上傳 -> (樣式, 提示文字)
+_PHOTO_STATUS_STYLE = {
+    True: ("color: green; font-size: 14pt;", "已上傳"),
+    False: ("color: red; font-size: 14pt;", "尚未上傳"),
+}
 
 
 class OverviewPage(QWidget):
@@ -39,9 +55,35 @@ class OverviewPage(QWidget):
         super().__init__()
         self.pm = pm
         self.config = config
+        # 章節進度快取：(專案路徑, 章節 ID) -> (已完成數, 總數)
+        # 以資料版本號判斷過期 (變更當下即遞增，不受 data_changed 延遲發送影響)
+        self._progress_cache = {}
+        self._progress_revision = None
+        # 背景解碼中的照片：快取鍵值 -> (照片 Label, 像素比例)
+        self._pending_previews = {}
+        # 各照片 Label 目前顯示的縮圖快取鍵值，相同時不重新 setPixmap
+        self._shown_previews = {}
+        # 照片狀態圓點上次套用的是否已上傳，相同時不重新 setStyleSheet
+        self._photo_status = {}
+        # 上次 refresh_data 之後資料是否有變更 (不在前景時只標記，不立即刷新)
+        self._dirty = True
         self._init_ui()
         self.pm.photo_received.connect(self.on_photo_received)
 
+    def _get_section_progress(self, section) -> tuple:
+        """取得章節進度 (相同專案與資料只計算一次)"""
+        revision = self.pm.data_revision
+        if revision != self._progress_revision:
+            self._progress_cache.clear()
+            self._progress_revision = revision
+        key = (self.pm.current_project_path, section["section_id"])
+        progress = self._progress_cache.get(key)
+        if progress is None:
+            progress = self._progress_cache[key] = self.pm.compute_section_progress(
+                section
+            )
+        return progress
+
     def _init_ui(self):
         main_layout = QVBoxLayout(self)
         scroll = QScrollArea()
@@ -63,12 +105,14 @@ class OverviewPage(QWidget):
         self.info_layout = QFormLayout()
         self.info_group.setLayout(self.info_layout)
         top_row_layout.addWidget(self.info_group, 1)
+        self._build_info_rows()
 
         # 檢測進度
         self.prog_g = QGroupBox("檢測進度")
         self.prog_l = QVBoxLayout()
         self.prog_g.setLayout(self.prog_l)
         top_row_layout.addWidget(self.prog_g, 1)
+        self._build_progress_rows()
 
         self.layout.addWidget(top_row)
 
@@ -133,36 +177,37 @@ class OverviewPage(QWidget):
         scroll.setWidget(content_widget)
         main_layout.addWidget(scroll)
 
+    def mark_dirty(self):
+        """標記資料已變更，下次顯示總覽時才重新整理"""
+        self._dirty = True
+
+    def refresh_if_dirty(self):
+        if self._dirty:
+            self.refresh_data()
+
     def refresh_data(self):
         if not self.pm.current_project_path:
             return
+        self._dirty = False
         info_data = self.pm.project_data.get("info", {})
-        schema = self.config.get("project_meta_schema", [])
-
-        while self.info_layout.count():
-            child = self.info_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-        for group in schema:
-            fields = group.get("fields", [])
-            for field in fields:
-                if field.get("show_in_overview", False):
-                    key = field["key"]
-                    label_text = field["label"]
-                    raw_value = info_data.get(key, "-")
-                    # 支援物件格式 {value, remark}
-                    if isinstance(raw_value, dict):
-                        value = raw_value.get("value", "-")
-                    else:
-                        value = raw_value
-                    if isinstance(value, list):
-                        value = ", ".join(value)
-                    val_label = QLabel(str(value))
-                    val_label.setStyleSheet("font-weight: bold; color: #333;")
-                    val_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-                    self.info_layout.addRow(f"{label_text}:", val_label)
 
+        # 資訊列已在 _init_ui 建立，這裡只更新文字
+        for key, val_label in self._info_rows.items():
+            raw_value = info_data.get(key, "-")
+            # 支援物件格式 {value, remark}
+            if isinstance(raw_value, dict):
+                value = raw_value.get("value", "-")
+            else:
+                value = raw_value
+            if isinstance(value, list):
+                value = ", ".join(value)
+            text = str(value)
+            if val_label.text() != text:
+                val_label.setText(text)
+
+        # 本次刷新已查詢過的檔案：完整路徑 -> 修改時間 (不存在為 None)
+        # 正面照片與其狀態圓點共用同一路徑，只 stat 一次
+        mtimes = {}
         for key, widget in self.photo_labels.items():
             # 判斷是否為狀態圓點（含 _status 後綴）
             if key.endswith("_status"):
@@ -174,57 +219,60 @@ class OverviewPage(QWidget):
                 path_key = f"{key}_path"
 
             rel_path = info_data.get(path_key)
-            has_file = False
             full_path = ""
+            mtime = None
             if rel_path:
                 full_path = os.path.join(self.pm.current_project_path, rel_path)
-                if os.path.exists(full_path):
-                    has_file = True
+                if full_path in mtimes:
+                    mtime = mtimes[full_path]
+                else:
+                    try:
+                        mtime = os.stat(full_path).st_mtime
+                    except OSError:
+                        pass
+                    mtimes[full_path] = mtime
+            has_file = mtime is not None
 
             if key.endswith("_status"):
-                # 狀態圓點的更新邏輯
-                if has_file:
-                    widget.setStyleSheet("color: green; font-size: 14pt;")
-                    widget.setToolTip("已上傳")
-                else:
-                    widget.setStyleSheet("color: red; font-size: 14pt;")
-                    widget.setToolTip("尚未上傳")
+                # 狀態圓點的更新邏輯 (狀態改變時才重新套用樣式)
+                if self._photo_status.get(key) != has_file:
+                    self._photo_status[key] = has_file
+                    qss, tip = _PHOTO_STATUS_STYLE[has_file]
+                    widget.setStyleSheet(qss)
+                    widget.setToolTip(tip)
             else:
                 # 照片 Label 的更新邏輯（只有正面照片）
                 if has_file:
-                    pix = QPixmap(full_path)
-                    if not pix.isNull():
-                        scaled_pix = pix.scaled(
-                            widget.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
-                        )
-                        widget.setPixmap(scaled_pix)
+                    self._show_preview(widget, full_path, mtime)
                 else:
+                    self._drop_pending_preview(widget)
+                    self._shown_previews.pop(widget, None)
                     widget.setText("正面照片 (Front)\n未上傳")
 
-        while self.prog_l.count():
-            child = self.prog_l.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        self.refresh_progress()
 
+    def refresh_progress(self):
+        """只更新各章節進度列 (測項結果變更時使用，不重建專案資訊)"""
+        if not self.pm.current_project_path:
+            return
+        # 進度列已在 _init_ui 建立，這裡只更新數值
         for section in self.config.get("test_standards", []):
             sec_id = section["section_id"]
-            sec_name = section["section_name"]
+            lbl, p = self._section_rows[sec_id]
             is_visible = self.pm.is_section_visible(sec_id)
-            h = QHBoxLayout()
-            lbl = QLabel(sec_name)
-            lbl.setFixedWidth(150)
-            p = QProgressBar()
+
+            # 範圍狀態改變時才切換灰色樣式 (setStyleSheet 會重新套用樣式)
+            if self._section_scope.get(sec_id) != is_visible:
+                self._section_scope[sec_id] = is_visible
+                if is_visible:
+                    p.setStyleSheet("")
+                    lbl.setStyleSheet("")
+                else:
+                    p.setStyleSheet(_OUT_OF_SCOPE_BAR_QSS)
+                    lbl.setStyleSheet("color: gray;")
+
             if is_visible:
-                items = section["items"]
-                active_items = []
-                for i in items:
-                    target_id = i.get("uid", i.get("id"))
-                    if self.pm.is_item_visible(target_id):
-                        active_items.append(i)
-                total = len(active_items)
-                done = sum(
-                    1 for i in active_items if self.pm.is_test_fully_completed(i)
-                )
+                done, total = self._get_section_progress(section)
                 if total > 0:
                     p.setRange(0, total)
                     p.setValue(done)
@@ -237,15 +285,86 @@ class OverviewPage(QWidget):
                 p.setRange(0, 100)
                 p.setValue(0)
                 p.setFormat("不適用 (N/A)")
-                p.setStyleSheet(
-                    f"QProgressBar {{ color: gray; background-color: {COLOR_BG_DEFAULT}; }}"
-                )
-                lbl.setStyleSheet("color: gray;")
+
+    def _build_info_rows(self):
+        """為總覽顯示的專案欄位建立資訊列 (只建立一次，重新整理時就地更新)"""
+        # 欄位 key -> 數值 Label
+        self._info_rows = {}
+        for group in self.config.get("project_meta_schema", []):
+            for field in group.get("fields", []):
+                if not field.get("show_in_overview", False):
+                    continue
+                key = field["key"]
+                if key in self._info_rows:
+                    continue
+                val_label = QLabel("-")
+                val_label.setStyleSheet("font-weight: bold; color: #333;")
+                val_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+                self.info_layout.addRow(f"{field['label']}:", val_label)
+                self._info_rows[key] = val_label
+
+    def _build_progress_rows(self):
+        """為每個章節建立一列進度條 (只建立一次，重新整理時就地更新)"""
+        # 章節 ID -> (名稱 Label, 進度條)
+        self._section_rows = {}
+        # 章節 ID -> 上次套用的是否在範圍內 (用於判斷是否需切換樣式)
+        self._section_scope = {}
+        for section in self.config.get("test_standards", []):
+            h = QHBoxLayout()
+            lbl = QLabel(section["section_name"])
+            lbl.setFixedWidth(150)
+            p = QProgressBar()
             h.addWidget(lbl)
             h.addWidget(p)
-            w = QWidget()
-            w.setLayout(h)
-            self.prog_l.addWidget(w)
+            # 進度列不需要自己的背景或顯示切換，直接加入版面，不另包一層 QWidget
+            self.prog_l.addLayout(h)
+            self._section_rows[section["section_id"]] = (lbl, p)
+
+    def _show_preview(self, widget, full_path, mtime=None):
+        """顯示照片縮圖：已快取則直接顯示，否則交給背景執行緒解碼"""
+        dpr = widget.devicePixelRatioF()
+        key = photo_preview_key(
+            full_path, widget.width(), widget.height(), dpr, mtime
+        )
+        if key is None or self._shown_previews.get(widget) == key:
+            return
+        pix = QPixmapCache.find(key)
+        if pix is not None and not pix.isNull():
+            self._drop_pending_preview(widget)
+            widget.setPixmap(pix)
+            self._shown_previews[widget] = key
+            return
+        if key in self._pending_previews:
+            return
+
+        # 同一 Label 只保留最新的請求
+        self._drop_pending_preview(widget)
+        self._pending_previews[key] = (widget, dpr)
+        if widget.pixmap().isNull():
+            widget.setText("載入中...")
+        loader = PhotoPreviewLoader(
+            key, full_path, widget.width(), widget.height(), dpr
+        )
+        loader.signals.loaded.connect(self._on_preview_loaded)
+        QThreadPool.globalInstance().start(loader)
+
+    def _drop_pending_preview(self, widget):
+        """忽略此 Label 尚未完成的縮圖請求"""
+        for key, (w, _) in list(self._pending_previews.items()):
+            if w is widget:
+                del self._pending_previews[key]
+
+    @Slot(str, QImage)
+    def _on_preview_loaded(self, key, image):
+        pending = self._pending_previews.pop(key, None)
+        if pending is None:
+            return
+        widget, dpr = pending
+        if image.isNull():
+            widget.setText("正面照片 (Front)\n無法讀取")
+            return
+        widget.setPixmap(cache_photo_preview(key, image, dpr))
+        self._shown_previews[widget] = key
 
     def open_gallery(self, target):
         if not self.pm.current_project_path:
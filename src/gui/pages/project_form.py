@@ -6,8 +6,8 @@ from PySide6.QtCore import Qt, QDate
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
-    QHBoxLayout,
-    QFormLayout,
+    QGridLayout,
+    QLabel,
     QLineEdit,
     QPlainTextEdit,
     QDateEdit,
@@ -25,6 +25,44 @@ from PySide6.QtWidgets import (
 from constants import DEFAULT_DESKTOP_PATH, DATE_FMT_QT
 from dialogs.bordered_dialog import BorderedDialog
 
+# 既有資料中沒有此欄位的標記
+_MISSING = object()
+
+# 群組表格欄位：標籤 | 輸入元件 | 附加按鈕 | 備註
+_COL_LABEL, _COL_FIELD, _COL_EXTRA, _COL_REMARK = range(4)
+_COL_COUNT = 4
+
+
+# 日期格式為 yyyy-MM-dd 時直接拆解數字，不經 Qt 的格式解析
+_ISO_DATE = DATE_FMT_QT == "yyyy-MM-dd"
+
+
+def _parse_date(text) -> QDate:
+    """字串轉 QDate (非預期格式時退回 QDate.fromString)"""
+    if _ISO_DATE:
+        try:
+            y, m, d = text.split("-")
+            return QDate(int(y), int(m), int(d))
+        except (ValueError, AttributeError):
+            pass
+    return QDate.fromString(text, DATE_FMT_QT)
+
+
+def _format_date(date: QDate) -> str:
+    """QDate 轉字串"""
+    if _ISO_DATE:
+        return f"{date.year():04d}-{date.month():02d}-{date.day():02d}"
+    return date.toString(DATE_FMT_QT)
+
+
+def _field_value(field_data, default):
+    """取得欄位值 (支援物件格式 {value, remark})"""
+    if field_data is _MISSING:
+        return default
+    if isinstance(field_data, dict):
+        return field_data.get("value", default)
+    return field_data
+
 
 class ProjectFormController:
     """專案資訊填寫表單控制器"""
@@ -32,14 +70,38 @@ class ProjectFormController:
     def __init__(self, parent_window, full_config, existing_data=None):
         self.full_config = full_config
         self.meta_schema = full_config.get("project_meta_schema", [])
-        self.existing_data = existing_data
-        self.is_edit_mode = existing_data is not None
+
+        # 欄位類型 -> (建立函式, 填值函式) (hidden 不在表中，直接略過)
+        self._builders = {
+            "text": (self._build_text, self._fill_text),
+            "date": (self._build_date, self._fill_date),
+            "textarea": (self._build_textarea, self._fill_textarea),
+            "path_selector": (self._build_path, self._fill_path),
+            "checkbox_group": (self._build_checkboxes, self._fill_checkboxes),
+        }
 
         self.dialog = BorderedDialog(parent_window)
-        self.dialog.setWindowTitle("編輯專案" if self.is_edit_mode else "新建專案")
         self.dialog.resize(500, 600)
         self.inputs = {}
         self._init_ui()
+        self.reset(existing_data)
+
+    def reset(self, existing_data=None):
+        """依既有資料 (None 表示新建) 重新填入所有欄位"""
+        self.existing_data = existing_data
+        self.is_edit_mode = existing_data is not None
+        self._existing = existing_data or {}
+        self.dialog.setWindowTitle("編輯專案" if self.is_edit_mode else "新建專案")
+
+        for key, inf in self.inputs.items():
+            # 既有資料只查找一次 (新建模式為空 dict，一律取得 _MISSING)
+            field_data = self._existing.get(key, _MISSING)
+            inf["fill"](inf, key, field_data)
+            remark_widget = inf["remark_widget"]
+            if remark_widget is not None:
+                # 支援物件格式 {value, remark}
+                remark = field_data.get("remark", "") if isinstance(field_data, dict) else ""
+                remark_widget.setText(str(remark))
 
     def _init_ui(self):
         # 取得 BorderedDialog 的內容區域佈局
@@ -63,15 +125,18 @@ class ProjectFormController:
             group_label = group.get("group_label", "")
             fields = group.get("fields", [])
 
-            # 建立群組框
+            # 建立群組框 (欄位元件直接放入表格，不另包容器)
             group_box = QGroupBox(group_label)
-            group_layout = QFormLayout(group_box)
+            group_layout = QGridLayout(group_box)
             group_layout.setContentsMargins(10, 15, 10, 10)
             group_layout.setSpacing(8)
+            group_layout.setColumnStretch(_COL_FIELD, 3)
+            group_layout.setColumnStretch(_COL_REMARK, 2)
 
             # 渲染群組內的欄位
+            row = 0
             for field in fields:
-                self._create_field_widget(field, group_layout)
+                row = self._create_field_widget(field, group_layout, row)
 
             main_layout.addWidget(group_box)
 
@@ -86,145 +151,144 @@ class ProjectFormController:
         btns.rejected.connect(self.dialog.reject)
         layout.addWidget(btns)
 
-    def _create_field_widget(self, field, parent_layout):
-        """根據欄位定義建立對應的 widget 並加入佈局"""
-        key = field["key"]
+    def _create_field_widget(self, field, grid, row):
+        """根據欄位定義建立對應的 widget 放入表格 (值由 reset 填入)，回傳下一個可用列"""
         f_type = field["type"]
-        label = field["label"]
-        desktop = DEFAULT_DESKTOP_PATH
-
-        if f_type == "hidden":
-            return
-
-        # 輔助函式：取得欄位值（支援物件格式 {value, remark}）
-        def get_value(key, default=None):
-            if key not in self.existing_data:
-                return default
-            field_data = self.existing_data[key]
-            if isinstance(field_data, dict):
-                return field_data.get("value", default)
-            return field_data
-
-        widget = None
-
-        if f_type == "text":
-            widget = QLineEdit()
-            if self.is_edit_mode and key in self.existing_data:
-                widget.setText(str(get_value(key, "")))
-                if key == "project_name":
-                    widget.setReadOnly(True)
-                    widget.setStyleSheet("background-color:#f0f0f0;")
-
-        elif f_type == "date":
-            widget = QDateEdit()
-            widget.setCalendarPopup(True)
-            widget.setDisplayFormat(DATE_FMT_QT)
-            if self.is_edit_mode and key in self.existing_data:
-                widget.setDate(QDate.fromString(get_value(key, ""), DATE_FMT_QT))
-            else:
-                widget.setDate(QDate.currentDate())
-
-        elif f_type == "textarea":
-            widget = QPlainTextEdit()
-            widget.setMaximumHeight(100)
-            if self.is_edit_mode and key in self.existing_data:
-                widget.setPlainText(str(get_value(key, "")))
-
-        elif f_type == "path_selector":
-            widget = QWidget()
-            h = QHBoxLayout(widget)
-            h.setContentsMargins(0, 0, 0, 0)
-            pe = QLineEdit()
-            btn = QToolButton()
-            btn.setText("...")
-
-            if self.is_edit_mode:
-                pe.setText(get_value(key, "") or "")
-                pe.setReadOnly(True)
-                btn.setEnabled(False)
-            else:
-                pe.setText(desktop)
-                btn.clicked.connect(lambda _, le=pe: self._browse(le))
-
-            h.addWidget(pe)
-            h.addWidget(btn)
-            widget.line_edit = pe
-
-        elif f_type == "checkbox_group":
-            widget = QGroupBox()
-            v = QVBoxLayout(widget)
-            v.setContentsMargins(5, 5, 5, 5)
-
-            opts = []
-            if key == "test_scope":
-                standards = self.full_config.get("test_standards", [])
-                for sec in standards:
-                    opts.append(
-                        {
-                            "value": sec["section_id"],
-                            "label": f"{sec['section_id']} {sec['section_name']}",
-                        }
-                    )
-            else:
-                opts = field.get("options", [])
-
-            vals = get_value(key, []) if self.is_edit_mode else []
-            widget.checkboxes = []
-            for o in opts:
-                chk = QCheckBox(o["label"])
-                chk.setProperty("val", o["value"])
-                if self.is_edit_mode and o["value"] in vals:
-                    chk.setChecked(True)
-                v.addWidget(chk)
-                widget.checkboxes.append(chk)
-
-        if widget:
-            # 處理備註功能
-            has_remark = field.get("remark", False)
-            remark_widget = None
-
-            if has_remark:
-                # 建立包含原欄位和備註的容器
-                container = QWidget()
-                h_layout = QHBoxLayout(container)
-                h_layout.setContentsMargins(0, 0, 0, 0)
-                h_layout.setSpacing(8)
-
-                # 原欄位佔較大空間
-                h_layout.addWidget(widget, stretch=3)
-
-                # 備註輸入框
-                remark_widget = QLineEdit()
-                remark_widget.setPlaceholderText("備註...")
-                if self.is_edit_mode and key in self.existing_data:
-                    # 支援物件格式 {value, remark}
-                    field_data = self.existing_data[key]
-                    if isinstance(field_data, dict):
-                        remark_widget.setText(str(field_data.get("remark", "")))
-                h_layout.addWidget(remark_widget, stretch=2)
-
-                parent_layout.addRow(label, container)
-            else:
-                parent_layout.addRow(label, widget)
+        handlers = self._builders.get(f_type)
+        if handlers is None:  # hidden 或未支援的類型
+            return row
+        build, fill = handlers
 
-            self.inputs[key] = {
-                "w": widget,
-                "t": f_type,
-                "label": label,
-                "required": field.get("required", False),
-                "has_remark": has_remark,
-                "remark_widget": remark_widget,
-            }
+        key = field["key"]
+        label = field["label"]
+        widget, extra = build(field, key)
+
+        # 核取方塊群組每個選項佔一列，其餘欄位佔一列
+        cells = widget if isinstance(widget, list) else [widget]
+        row_span = max(len(cells), 1)
+        label_align = Qt.AlignTop if row_span > 1 else Qt.AlignVCenter
+        grid.addWidget(QLabel(label), row, _COL_LABEL, row_span, 1, label_align)
+
+        # 處理備註功能：備註放在最後一欄，主欄位延伸到備註 (或表格尾端) 之前
+        has_remark = field.get("remark", False)
+        remark_widget = None
+        end_col = _COL_REMARK if has_remark else _COL_COUNT
+
+        if extra is not None:
+            grid.addWidget(extra, row, _COL_EXTRA, 1, end_col - _COL_EXTRA, Qt.AlignLeft)
+            field_span = _COL_EXTRA - _COL_FIELD
+        else:
+            field_span = end_col - _COL_FIELD
+        for i, cell in enumerate(cells):
+            grid.addWidget(cell, row + i, _COL_FIELD, 1, field_span)
+
+        if has_remark:
+            # 備註輸入框
+            remark_widget = QLineEdit()
+            remark_widget.setPlaceholderText("備註...")
+            grid.addWidget(remark_widget, row, _COL_REMARK)
+
+        self.inputs[key] = {
+            "w": widget,
+            "extra": extra,
+            "t": f_type,
+            "fill": fill,
+            "label": label,
+            "required": field.get("required", False),
+            "has_remark": has_remark,
+            "remark_widget": remark_widget,
+        }
+        return row + row_span
+
+    # ===== 各類型欄位建立函式 (field, key) -> (輸入元件, 附加按鈕) =====
+    # ===== 各類型欄位填值函式 (inf, key, field_data) =====
+
+    def _build_text(self, field, key):
+        return QLineEdit(), None
+
+    def _fill_text(self, inf, key, field_data):
+        widget = inf["w"]
+        has_value = field_data is not _MISSING
+        widget.setText(str(_field_value(field_data, "")) if has_value else "")
+        # 既有專案名稱不可修改
+        read_only = has_value and key == "project_name"
+        widget.setReadOnly(read_only)
+        widget.setStyleSheet("background-color:#f0f0f0;" if read_only else "")
+
+    def _build_date(self, field, key):
+        widget = QDateEdit()
+        widget.setCalendarPopup(True)
+        widget.setDisplayFormat(DATE_FMT_QT)
+        return widget, None
+
+    def _fill_date(self, inf, key, field_data):
+        widget = inf["w"]
+        if field_data is not _MISSING:
+            widget.setDate(_parse_date(_field_value(field_data, "")))
+        else:
+            widget.setDate(QDate.currentDate())
+
+    def _build_textarea(self, field, key):
+        widget = QPlainTextEdit()
+        widget.setMaximumHeight(100)
+        return widget, None
+
+    def _fill_textarea(self, inf, key, field_data):
+        inf["w"].setPlainText(
+            str(_field_value(field_data, "")) if field_data is not _MISSING else ""
+        )
+
+    def _build_path(self, field, key):
+        pe = QLineEdit()
+        btn = QToolButton()
+        btn.setText("...")
+        btn.clicked.connect(lambda _, le=pe: self._browse(le))
+        return pe, btn
+
+    def _fill_path(self, inf, key, field_data):
+        pe, btn = inf["w"], inf["extra"]
+        if self.is_edit_mode:
+            pe.setText(_field_value(field_data, "") or "")
+        else:
+            pe.setText(DEFAULT_DESKTOP_PATH)
+        # 既有專案的路徑不可變更
+        pe.setReadOnly(self.is_edit_mode)
+        btn.setEnabled(not self.is_edit_mode)
+
+    def _build_checkboxes(self, field, key):
+        if key == "test_scope":
+            standards = self.full_config.get("test_standards", [])
+            opts = [
+                {
+                    "value": sec["section_id"],
+                    "label": f"{sec['section_id']} {sec['section_name']}",
+                }
+                for sec in standards
+            ]
+        else:
+            opts = field.get("options", [])
+
+        checkboxes = []
+        for o in opts:
+            chk = QCheckBox(o["label"])
+            chk.setProperty("val", o["value"])
+            checkboxes.append(chk)
+        return checkboxes, None
+
+    def _fill_checkboxes(self, inf, key, field_data):
+        vals = _field_value(field_data, [])
+        for chk in inf["w"]:
+            chk.setChecked(chk.property("val") in vals)
 
     def _browse(self, le):
-        dialog = QFileDialog(self.dialog, "選擇資料夾")
-        dialog.setFileMode(QFileDialog.Directory)
-        dialog.setOption(QFileDialog.DontUseNativeDialog, True)
-        dialog.setWindowModality(Qt.ApplicationModal)
-        if dialog.exec() == QDialog.Accepted:
-            files = dialog.selectedFiles()
-            if files:
-                le.setText(files[0])
+        folder = QFileDialog.getExistingDirectory(
+            self.dialog,
+            "選擇資料夾",
+            "",
+            QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks,
+        )
+        if folder:
+            le.setText(folder)
 
     def run(self):
         while self.dialog.exec() == QDialog.Accepted:
@@ -251,14 +315,12 @@ class ProjectFormController:
             label = inf["label"]
             is_empty = False
 
-            if t == "text":
+            if t in ("text", "path_selector"):
                 is_empty = not w.text().strip()
             elif t == "textarea":
                 is_empty = not w.toPlainText().strip()
-            elif t == "path_selector":
-                is_empty = not w.line_edit.text().strip()
             elif t == "checkbox_group":
-                is_empty = not any(c.isChecked() for c in w.checkboxes)
+                is_empty = not any(c.isChecked() for c in w)
             # date 類型有預設值，不需要驗證
 
             if is_empty:
@@ -275,16 +337,14 @@ class ProjectFormController:
             remark_widget = inf.get("remark_widget")
 
             # 取得欄位值
-            if t == "text":
+            if t in ("text", "path_selector"):
                 value = w.text()
             elif t == "textarea":
                 value = w.toPlainText()
             elif t == "date":
-                value = w.date().toString(DATE_FMT_QT)
-            elif t == "path_selector":
-                value = w.line_edit.text()
+                value = _format_date(w.date())
             elif t == "checkbox_group":
-                value = [c.property("val") for c in w.checkboxes if c.isChecked()]
+                value = [c.property("val") for c in w if c.isChecked()]
             else:
                 value = None
 
@@ -34,16 +34,30 @@ class QuickTestSelector(QDialog):
         layout.addWidget(QLabel("請勾選本次要進行檢測的項目："))
 
         self.list_widget = QListWidget()
+        # 每列都是單行文字，高度一致時不必逐列量測
+        self.list_widget.setUniformItemSizes(True)
+
+        # 先建立所有列 (尚未加入清單)，再在暫停重繪與信號的期間一次加入
+        rows = []
         for section in self.config.get("test_standards", []):
             header = QListWidgetItem(f"--- {section['section_name']} ---")
             header.setFlags(Qt.NoItemFlags)
-            self.list_widget.addItem(header)
+            rows.append(header)
             for item in section["items"]:
                 li = QListWidgetItem(f"{item['id']} {item['name']}")
                 li.setFlags(li.flags() | Qt.ItemIsUserCheckable)
                 li.setCheckState(Qt.Unchecked)
                 li.setData(Qt.UserRole, item.get("uid", item.get("id")))
+                rows.append(li)
+
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.blockSignals(True)
+        try:
+            for li in rows:
                 self.list_widget.addItem(li)
+        finally:
+            self.list_widget.blockSignals(False)
+            self.list_widget.setUpdatesEnabled(True)
         layout.addWidget(self.list_widget)
 
         path_layout = QHBoxLayout()
@@ -10,12 +10,12 @@ from PySide6.QtWidgets import (
     QCheckBox,
     QStackedWidget,
     QTabWidget,
-    QMessageBox,
 )
 
 from constants import TARGET_UAV
 
 from test_tools.factory import ToolFactory
+from test_tools.base import notify_saved
 
 
 class UniversalTestPage(QWidget):
@@ -31,6 +31,10 @@ class UniversalTestPage(QWidget):
         self.targets = config.get("targets", "ERROR")
         self.allow_share = config.get("allow_share", False)
         self.tools = []  # 防止 Tool 被 Garbage Collection 回收
+        # 尚未建立內容的分頁：分頁索引 -> (佔位容器, target)
+        self._pending_tabs = {}
+        self.p_sep = None  # 分開頁面，第一次切換到分開模式時才建立
+        self.p_share = None  # 共用頁面，第一次切換到共用模式時才建立
         self.destroyed.connect(self.cleanup_tools)  # 清理資源
         self._init_ui()
         self._load_state()
@@ -61,28 +65,54 @@ class UniversalTestPage(QWidget):
             h.addStretch()
             h.addWidget(self.chk)
 
+        # 分開/共用頁面都在第一次顯示時才建立，共用模式開啟時不建立各 target 的工具
         self.stack = QStackedWidget()
         layout.addWidget(self.stack)
 
+    def _get_sep_page(self) -> QWidget:
+        """取得分開頁面 (第一次使用時建立)"""
+        if self.p_sep is not None:
+            return self.p_sep
         self.p_sep = QWidget()
         v = QVBoxLayout(self.p_sep)
         v.setContentsMargins(0, 0, 0, 0)
 
         if len(self.targets) > 1:
+            # 只建立第一個分頁的內容，其餘分頁在第一次切換時才建立
             tabs = QTabWidget()
-            for t in self.targets:
-                tabs.addTab(self._create_tool_widget(t), t)
+            for i, t in enumerate(self.targets):
+                if i == 0:
+                    tabs.addTab(self._create_tool_widget(t), t)
+                    continue
+                holder = QWidget()
+                holder_layout = QVBoxLayout(holder)
+                holder_layout.setContentsMargins(0, 0, 0, 0)
+                tabs.addTab(holder, t)
+                self._pending_tabs[i] = (holder, t)
+            tabs.currentChanged.connect(self._on_tab_changed)
             v.addWidget(tabs)
         else:
             v.addWidget(self._create_tool_widget(self.targets[0]))
 
         self.stack.addWidget(self.p_sep)
-
-        if len(self.targets) > 1:
+        return self.p_sep
+
+    def _on_tab_changed(self, index):
+        """切換到尚未建立的分頁時，才建立該 target 的測項 Widget"""
+        pending = self._pending_tabs.pop(index, None)
+        if pending is None:
+            return
+        holder, target = pending
+        holder.layout().addWidget(self._create_tool_widget(target))
+
+    def _get_share_page(self) -> QWidget:
+        """取得共用頁面 (第一次使用時建立)"""
+        if self.p_share is None:
             self.p_share = self._create_tool_widget(
                 "Shared", is_shared=True, save_cb=self.save_share
             )
             self.stack.addWidget(self.p_share)
+        return self.p_share
 
     def _create_tool_widget(self, target, is_shared=False, save_cb=None):
         """建立測項 Widget"""
@@ -119,10 +149,14 @@ class UniversalTestPage(QWidget):
         meta = self.pm.get_test_meta(uid)
         if self.chk and meta.get("is_shared"):
             self.chk.setChecked(True)
-            self.stack.setCurrentWidget(self.p_share)
+            self.stack.setCurrentWidget(self._get_share_page())
+        else:
+            self.stack.setCurrentWidget(self._get_sep_page())
 
     def on_share(self, checked):
-        self.stack.setCurrentWidget(self.p_share if checked else self.p_sep)
+        self.stack.setCurrentWidget(
+            self._get_share_page() if checked else self._get_sep_page()
+        )
 
     def save_share(self, data):
         uid = self.config.get("uid", self.config.get("id"))
@@ -134,4 +168,4 @@ class UniversalTestPage(QWidget):
         for t in self.targets:
             self.pm.update_test_meta(uid, t, {"is_shared": True})
         
-        QMessageBox.information(self, "成功", "共用儲存完成")
+        notify_saved(self, "共用儲存完成")
@@ -117,6 +117,13 @@ class Styles:
 
     TITLE_BTN_CLOSE = f"QPushButton:hover {{ background-color: {COLOR_BTN_CLOSE_HOVER}; color: white; }}"
 
+    # 標題列整體樣式 (設定在標題列上，以 objectName 指定標題文字與關閉按鈕)
+    TITLE_BAR = """
+        QWidget {{ background-color: transparent; }}
+        QLabel#TitleText {{ font-weight: bold; color: {title_text}; }}
+    """
+    TITLE_BAR_CLOSE = f"QPushButton#TitleClose:hover {{ background-color: {COLOR_BTN_CLOSE_HOVER}; color: white; }}"
+
     # 視窗框架
     FRAME_NORMAL = """
         QFrame#CentralFrame {{
@@ -162,6 +169,14 @@ class Styles:
         padding: 2px;
     """
 
+    # 附件列 (由清單統一套用，列元件只需設定 objectName)
+    ATTACHMENT_ROW_QSS = f"""
+        QLabel#handle {{ color: #aaa; font-size: 16pt; }}
+        QLabel#thumb {{ {THUMBNAIL} }}
+        QLabel#title, QLineEdit#title {{ {ATTACHMENT_TITLE} font-size: 9pt; }}
+        QPushButton#delete {{ {BTN_DANGER} }}
+    """
+
     # 狀態下拉選單 (依狀態變色)
     @staticmethod
     def combo_status(bg_color: str, text_color: str) -> str:
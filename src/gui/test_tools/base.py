@@ -6,7 +6,7 @@
 from typing import Dict, Optional, Tuple
 import os
 
-from PySide6.QtCore import Qt, Signal, QObject
+from PySide6.QtCore import Qt, Signal, Slot, QObject
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -14,6 +14,7 @@ from PySide6.QtWidgets import (
     QLabel,
     QCheckBox,
     QTextEdit,
+    QPlainTextEdit,
     QGroupBox,
     QComboBox,
     QPushButton,
@@ -21,6 +22,7 @@ from PySide6.QtWidgets import (
     QFileDialog,
     QMessageBox,
     QScrollArea,
+    QMainWindow,
 )
 
 from styles import Styles
@@ -40,6 +42,58 @@ from constants import (
 )
 
 
+# ==============================================================================
+# 判定結果樣式
+# ==============================================================================
+
+# 判定下拉選單選項 -> 樣式類別 (對應下方 QSS 的 result 屬性)
+_RESULT_KIND = {
+    STATUS_UNCHECKED: "",
+    STATUS_PASS: "pass",
+    STATUS_FAIL: "fail",
+    STATUS_NA: "na",
+}
+
+# 判定下拉選單樣式表 (建立時設定一次，之後只切換 result 屬性)
+_RESULT_COMBO_QSS = f"""
+QComboBox[result="pass"] {{ background-color: {COLOR_BG_PASS}; color: {COLOR_TEXT_PASS}; }}
+QComboBox[result="fail"] {{ background-color: {COLOR_BG_FAIL}; color: {COLOR_TEXT_FAIL}; }}
+QComboBox[result="na"] {{ background-color: {COLOR_BG_NA}; }}
+"""
+
+
+def _result_kind(status: str) -> str:
+    """取得判定結果的樣式類別 (非固定選項才退回子字串比對)"""
+    kind = _RESULT_KIND.get(status)
+    if kind is not None:
+        return kind
+    if STATUS_PASS in status:
+        return "pass"
+    if STATUS_FAIL in status:
+        return "fail"
+    if STATUS_NA in status:
+        return "na"
+    return ""
+
+
+# 儲存成功提示在狀態列顯示的時間 (毫秒)
+SAVE_NOTICE_MS = 1500
+
+
+def notify_saved(widget: QWidget, message: str):
+    """
+    顯示儲存成功提示
+
+    顯示在所在視窗的狀態列，不開啟模態對話框 (不中斷連續儲存的操作)；
+    所在視窗沒有狀態列時才退回訊息框
+    """
+    win = widget.window()
+    if isinstance(win, QMainWindow):
+        win.statusBar().showMessage(message, SAVE_NOTICE_MS)
+    else:
+        QMessageBox.information(widget, "成功", message)
+
+
 # ==============================================================================
 # 字串常數
 # ==============================================================================
@@ -136,11 +190,7 @@ class BaseTestToolView(QWidget):
         # h3.setContentsMargins(1, 1, 1, 1)
         # h3.addWidget(QLabel("結果:"))
 
-        self.result_combo = QComboBox()
-        self.result_combo.addItems(
-            [STATUS_UNCHECKED, STATUS_PASS, STATUS_FAIL, STATUS_NA]
-        )
-        self.result_combo.currentTextChanged.connect(self.result_changed)
+        self.result_combo = self._create_result_combo()
 
         h3.addWidget(self.result_combo)
         g3.setLayout(h3)
@@ -211,11 +261,7 @@ class BaseTestToolView(QWidget):
 
         # 最終判定
         bottom_bar.addWidget(QLabel("最終判定:"))  # 不 stretch，只佔文字寬度
-        self.result_combo = QComboBox()
-        self.result_combo.addItems(
-            [STATUS_UNCHECKED, STATUS_PASS, STATUS_FAIL, STATUS_NA]
-        )
-        self.result_combo.currentTextChanged.connect(self.result_changed)
+        self.result_combo = self._create_result_combo()
         bottom_bar.addWidget(self.result_combo, stretch=1)
 
         # 儲存按鈕
@@ -228,6 +274,28 @@ class BaseTestToolView(QWidget):
 
         main_layout.addLayout(bottom_bar)
 
+    def _create_result_combo(self) -> QComboBox:
+        """建立判定下拉選單 (樣式表只設定一次，顏色由 result 屬性切換)"""
+        combo = QComboBox()
+        combo.addItems([STATUS_UNCHECKED, STATUS_PASS, STATUS_FAIL, STATUS_NA])
+        combo.setProperty("result", "")
+        combo.setStyleSheet(_RESULT_COMBO_QSS)
+        combo.currentTextChanged.connect(self.result_changed)
+        return combo
+
+    def set_result_style(self, status: str):
+        """依判定結果切換下拉選單顏色 (屬性未變時不重新套用樣式)"""
+        combo = self.result_combo
+        if combo is None:
+            return
+        kind = _result_kind(status)
+        if combo.property("result") == kind:
+            return
+        combo.setProperty("result", kind)
+        style = combo.style()
+        style.unpolish(combo)
+        style.polish(combo)
+
     def _build_logic_hint(self, layout: QVBoxLayout):
         """建立判定邏輯提示"""
         S = BaseTestToolStrings
@@ -265,6 +333,8 @@ class BaseTestToolView(QWidget):
         )
 
         self.desc_edit = QTextEdit()
+        # 唯讀說明不需要復原紀錄
+        self.desc_edit.setUndoRedoEnabled(False)
         self.desc_edit.setHtml(display_html)
         self.desc_edit.setReadOnly(True)
         self.desc_edit.setStyleSheet(Styles.DESC_BOX)
@@ -337,7 +407,8 @@ class BaseTestToolView(QWidget):
         S = BaseTestToolStrings
         g3 = QGroupBox(S.GB_NOTE)
         v3 = QVBoxLayout()
-        self.user_note = QTextEdit()
+        # 備註只存純文字，使用 QPlainTextEdit (不做 rich text 解析與排版)
+        self.user_note = QPlainTextEdit()
         self.user_note.setPlaceholderText(S.HINT_NOTE)
         # self.user_note.setMinimumHeight(60)
         self.user_note.setMaximumHeight(150)
@@ -385,6 +456,27 @@ class BaseTestToolView(QWidget):
             widget.refresh_thumbnail()
 
 
+class _AttachmentImportReceiver(QObject):
+    """
+    背景匯入附件完成後加入附件列表
+
+    以附件列表為父物件：測項視窗在複製期間關閉時，
+    接收者隨列表一起釋放，Qt 自動解除連線，不會再操作已刪除的元件
+    """
+
+    def __init__(self, attachment_list, title: str, display_type: str):
+        super().__init__(attachment_list)
+        self._title = title
+        self._display_type = display_type
+
+    @Slot(list, str)
+    def on_done(self, done, error):
+        attachment_list = self.parent()
+        for full_path in done:
+            attachment_list.add_attachment(full_path, self._title, self._display_type)
+        self.deleteLater()
+
+
 # ==============================================================================
 # Tool 類別 (邏輯 + 控制層)
 # ==============================================================================
@@ -501,18 +593,11 @@ class BaseTestTool(QObject):
 
     def _update_result_ui(self, status, fail_reason=None):
         """更新結果 UI 樣式與備註"""
-        # 更新顏色
-        if STATUS_PASS in status:
-            s = f"background-color: {COLOR_BG_PASS}; color: {COLOR_TEXT_PASS};"
-        elif STATUS_FAIL in status:
-            s = f"background-color: {COLOR_BG_FAIL}; color: {COLOR_TEXT_FAIL};"
-        elif STATUS_NA in status:
-            s = f"background-color: {COLOR_BG_NA};"
-        else:
-            s = ""
+        # 判定結果只分類一次 (固定選項精確查表)
+        kind = _result_kind(status)
 
-        if self.view.result_combo:
-            self.view.result_combo.setStyleSheet(s)
+        # 更新顏色
+        self.view.set_result_style(status)
 
         # 自動更新備註
         current_note = self.view.get_note()
@@ -525,7 +610,7 @@ class BaseTestTool(QObject):
             if checked
         ]
 
-        if STATUS_PASS in status:
+        if kind == "pass":
             # 通過：列出所有符合的項目
             if checked_list:
                 items_text = "\n".join(f"  - {r}" for r in checked_list)
@@ -542,7 +627,7 @@ class BaseTestTool(QObject):
             ):
                 self.view.set_note(pass_reason)
 
-        elif STATUS_FAIL in status:
+        elif kind == "fail":
             # 未通過：先列出已符合的，再列出未符合的
             unchecked_list = [
                 self.item_content_map.get(cid, cid)
@@ -568,7 +653,7 @@ class BaseTestTool(QObject):
             ):
                 self.view.set_note(fail_note)
 
-        elif STATUS_NA in status:
+        elif kind == "na":
             if (
                 not current_note
                 or current_note.startswith("【判定結果】")
@@ -668,7 +753,7 @@ class BaseTestTool(QObject):
 
             self.load_data(saved_data)
 
-            QMessageBox.information(self.view, "成功", "已儲存")
+            notify_saved(self.view, "已儲存")
 
         self.save_completed.emit(True, "Saved")
 
@@ -708,8 +793,12 @@ class BaseTestTool(QObject):
                 # 使用原檔名 (去除副檔名) 作為標題
                 title = os.path.splitext(os.path.basename(f_path))[0]
 
-                # 使用新的 import_attachment 方法（支援多目標）
-                rel_path = self.pm.import_attachment(
+                # 檔案在背景複製，完成後才加入附件列表（支援多目標）
+                display_type = "image" if ftype == "img" else "file"
+                receiver = _AttachmentImportReceiver(
+                    self.view.attachment_list, title, display_type
+                )
+                rel_path = self.pm.import_attachment_async(
                     f_path,
                     self.item_id,
                     self.item_name,
@@ -718,13 +807,10 @@ class BaseTestTool(QObject):
                     targets=self.targets,
                     target=self.target,
                     is_shared=self.is_shared,
+                    on_done=receiver.on_done,
                 )
-                if rel_path:
-                    full_path = os.path.join(self.pm.current_project_path, rel_path)
-                    display_type = "image" if ftype == "img" else "file"
-                    self.view.attachment_list.add_attachment(
-                        full_path, title, display_type
-                    )
+                if rel_path is None:
+                    receiver.deleteLater()
 
     def _on_photo_received(self, item_uid, target, path, title):
         """接收手機照片"""
@@ -742,12 +828,17 @@ class BaseTestTool(QObject):
         # 回填備註
         self.view.set_note(data.get("description", ""))
 
-        # 回填結果
+        # 回填結果 (暫停信號，避免 currentTextChanged 與下方各觸發一次 _update_result_ui)
         saved_res = data.get("result", STATUS_UNCHECKED)
-        if self.view.result_combo:
-            idx = self.view.result_combo.findText(saved_res)
+        combo = self.view.result_combo
+        if combo:
+            idx = combo.findText(saved_res)
             if idx >= 0:
-                self.view.result_combo.setCurrentIndex(idx)
+                combo.blockSignals(True)
+                try:
+                    combo.setCurrentIndex(idx)
+                finally:
+                    combo.blockSignals(False)
             self._update_result_ui(saved_res)
 
         # 回填附件
@@ -0,0 +1,54 @@
+"""
+標題列圖示模組
+應用程式圖標與視窗按鈕圖示的共用快取 (主視窗與對話框標題列共用)
+"""
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QIcon, QPixmap, QPixmapCache, QPainter
+from PySide6.QtSvg import QSvgRenderer
+
+
+# 應用程式圖標點陣快取：(路徑, 裝置像素比例, 尺寸) -> QPixmap
+_APP_ICON_CACHE = {}
+
+# 按鈕圖示在 QPixmapCache 中的鍵值前綴
+_BTN_KEY_PREFIX = "titlebar/"
+
+
+def _render_svg(path: str, icon_size: int, device_pixel_ratio: float) -> QPixmap:
+    """以 QSvgRenderer 將 SVG 渲染為指定邏輯尺寸的點陣圖 (支援高 DPI)"""
+    render_size = int(icon_size * device_pixel_ratio)
+    svg_renderer = QSvgRenderer(path)
+    pixmap = QPixmap(render_size, render_size)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setRenderHint(QPainter.SmoothPixmapTransform)
+    svg_renderer.render(painter)
+    painter.end()
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    return pixmap
+
+
+def get_app_icon_pixmap(path: str, icon_size: int, device_pixel_ratio: float) -> QPixmap:
+    """以 QSvgRenderer 高品質渲染應用程式圖標 (相同檔案、尺寸與 DPI 只渲染一次)"""
+    key = (path, device_pixel_ratio, icon_size)
+    pixmap = _APP_ICON_CACHE.get(key)
+    if pixmap is None:
+        pixmap = _APP_ICON_CACHE[key] = _render_svg(path, icon_size, device_pixel_ratio)
+    return pixmap
+
+
+def get_button_icon(path: str, icon_size: int, device_pixel_ratio: float) -> QIcon:
+    """
+    取得按鈕圖示
+
+    SVG 只在第一次使用時依按鈕尺寸與 DPI 點陣化，結果放入 Qt 全域的 QPixmapCache，
+    所有標題列共用；若被快取淘汰則重新渲染
+    """
+    key = f"{_BTN_KEY_PREFIX}{path}@{icon_size}x{device_pixel_ratio}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = _render_svg(path, icon_size, device_pixel_ratio)
+        QPixmapCache.insert(key, pixmap)
+    return QIcon(pixmap)
@@ -4,11 +4,13 @@ GUI 元件模組
 
 from .attachment import AttachmentItemWidget, AttachmentListWidget
 from .aspect_label import AspectLabel
+from .status_badge_bar import StatusBadgeBar
 from .image_editor import ImageEditorDialog
 
 __all__ = [
     "AttachmentItemWidget",
     "AttachmentListWidget",
     "AspectLabel",
+    "StatusBadgeBar",
     "ImageEditorDialog",
 ]
@@ -16,13 +16,21 @@ class AspectLabel(QLabel):
         super().__init__(parent)
         self.setScaledContents(False)
         self._pixmap = None
+        self._scaled_height = 0  # 目前顯示的縮圖高度，高度不變時不重新縮放
         # 設定 Policy 為 Ignored，表示"我願意被縮小到比我原本內容更小"
         self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Ignored)
 
     def setPixmap(self, pixmap):
         self._pixmap = pixmap
+        self._scaled_height = 0
         self.update_image()
 
+    def setText(self, text):
+        # 改顯示文字時一併清掉圖片，避免 resize 時又把舊圖畫回來
+        self._pixmap = None
+        self._scaled_height = 0
+        super().setText(text)
+
     def resizeEvent(self, event):
         self.update_image()
         super().resizeEvent(event)
@@ -31,6 +39,8 @@ class AspectLabel(QLabel):
         if self._pixmap and not self._pixmap.isNull():
             # 取得當前元件的實際高度 (由 Layout 決定)
             h = self.height()
-            if h > 0:
+            # 只改變寬度的 resize 不需要重新做平滑縮放
+            if h > 0 and h != self._scaled_height:
+                self._scaled_height = h
                 scaled = self._pixmap.scaledToHeight(h, Qt.SmoothTransformation)
                 super().setPixmap(scaled)
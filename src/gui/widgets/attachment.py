@@ -3,30 +3,83 @@
 """
 
 import os
-from PySide6.QtCore import Qt, Signal, QSize
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import (
+    Qt,
+    Signal,
+    QSize,
+    QFileInfo,
+    QTimer,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QPoint,
+)
+from PySide6.QtGui import QPixmap, QColor, QImage, QImageReader
 from PySide6.QtWidgets import (
+    QFileIconProvider,
     QWidget,
-    QHBoxLayout,
-    QVBoxLayout,
     QLabel,
     QLineEdit,
     QPushButton,
     QListWidget,
     QListWidgetItem,
-    QSizePolicy,
 )
 
-from styles import Styles
+from styles import Styles, COLOR_BG_THUMBNAIL
 from .aspect_label import AspectLabel
 from .image_editor.editor_dialog import ImageEditorDialog
 
+# 清單 + 列元件樣式，模組載入時組合一次，所有清單共用同一字串
+_ATTACHMENT_LIST_STYLE = Styles.ATTACHMENT_LIST + Styles.ATTACHMENT_ROW_QSS
+
+
+class _ThumbnailSignals(QObject):
+    """ThumbnailLoader 的信號 (QRunnable 本身不是 QObject)"""
+
+    loaded = Signal(QImage)
+
+
+class ThumbnailLoader(QRunnable):
+    """在背景執行緒解碼縮圖 (QImage 可跨執行緒，QPixmap 需回主執行緒建立)"""
+
+    def __init__(self, file_path: str, height: int):
+        super().__init__()
+        self.file_path = file_path
+        self.height = height
+        self.signals = _ThumbnailSignals()
+
+    def run(self):
+        reader = QImageReader(self.file_path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        # 直接以縮小尺寸解碼，避免解出整張原圖
+        if size.isValid() and size.height() > self.height > 0:
+            reader.setScaledSize(
+                size.scaled(size.width(), self.height, Qt.KeepAspectRatio)
+            )
+        self.signals.loaded.emit(reader.read())
+
 
 class AttachmentItemWidget(QWidget):
     """附件項目元件"""
 
     on_delete = Signal(QWidget)
     on_image_click = Signal(str)  # 圖片點擊信號，傳送檔案路徑
+    on_title_dirty = Signal(QWidget)  # 標題與原始標題不同時發送
+
+    # 非圖片檔的系統圖示 (類別共用，依副檔名快取)
+    _icon_provider = None
+    _type_icon_cache: dict[str, QPixmap] = {}
+
+    # 縮圖載入前的佔位圖 (類別共用，首次使用時建立)
+    _PLACEHOLDER = None
+
+    # 列內版面 (固定像素，於 resizeEvent 直接擺放子元件，不建立 layout)
+    _MARGIN = 5
+    _SPACING = 10
+    _HANDLE_WIDTH = 25
+    _BTN_SIZE = 30
+    _TITLE_MIN_WIDTH = 100
 
     def __init__(
         self, file_path, title="", file_type="image", row_height=90, extra_data=None
@@ -36,9 +89,12 @@ class AttachmentItemWidget(QWidget):
         self.file_type = file_type
         self.row_height = row_height
         self.extra_data = extra_data or {}  # 額外欄位 (e.g. command)
+        self.list_item = None  # 所屬的 QListWidgetItem (由清單設定)
+        self.needs_thumbnail = False  # 是否仍在等待縮圖載入
 
         # 追蹤原始標題（用於判斷是否需要重命名檔案）
         self._original_title = title
+        self._dirty = False
 
         # 強制設定整列的高度 (包含 padding)
         self.setFixedHeight(self.row_height)
@@ -46,74 +102,162 @@ class AttachmentItemWidget(QWidget):
         self._init_ui(title)
 
     def _init_ui(self, title):
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(10)
-
         # --- 1. 拖曳手柄 ---
-        lbl_handle = QLabel("☰")
-        lbl_handle.setStyleSheet("color: #aaa; font-size: 16pt;")
-        lbl_handle.setCursor(Qt.SizeAllCursor)
-        # lbl_handle.setFixedWidth(25)
-        lbl_handle.setAlignment(Qt.AlignCenter)
-        layout.addWidget(lbl_handle)
+        self.lbl_handle = QLabel("☰", self)
+        self.lbl_handle.setObjectName("handle")
+        self.lbl_handle.setCursor(Qt.SizeAllCursor)
+        self.lbl_handle.setAlignment(Qt.AlignCenter)
 
         # --- 2. 圖片 (AspectLabel) ---
-        self.lbl_icon = AspectLabel()
-        self.lbl_icon.setFixedWidth(int(self.row_height * 1.3))
+        self.icon_width = int(self.row_height * 1.3)
+        self.lbl_icon = AspectLabel(self)
         self.lbl_icon.setAlignment(Qt.AlignCenter)
-        self.lbl_icon.setStyleSheet(Styles.THUMBNAIL)
+        self.lbl_icon.setObjectName("thumb")
 
         if self.file_type == "image" and os.path.exists(self.file_path):
-            pix = QPixmap(self.file_path)
-            if not pix.isNull():
-                self.lbl_icon.setPixmap(pix)
-                # 設定游標和工具提示
-                self.lbl_icon.setCursor(Qt.PointingHandCursor)
-                self.lbl_icon.setToolTip("點擊編輯圖片")
-            else:
-                self.lbl_icon.setText("Error")
+            # 先顯示佔位圖，實際縮圖由清單在可見時於背景解碼
+            self.lbl_icon.setPixmap(self._get_placeholder())
+            self.needs_thumbnail = True
         else:
-            self.lbl_icon.setText(self.file_type)
+            pix = self._get_type_icon(self.file_path, self.icon_width)
+            if pix.isNull():
+                self.lbl_icon.setText(self.file_type)
+            else:
+                self.lbl_icon.setPixmap(pix)
 
         # 連接點擊事件
         self.lbl_icon.mousePressEvent = self._on_icon_click
 
-        layout.addWidget(self.lbl_icon)
-
         # --- 3. 資訊區 (單行佈局) ---
         filename = os.path.basename(self.file_path)
 
-        # 標題輸入框
-        self.edit_title = QLineEdit(title if title else filename)
-        self.edit_title.setPlaceholderText("請輸入說明...")
-        self.edit_title.setStyleSheet(Styles.ATTACHMENT_TITLE + " font-size: 9pt;")
-        self.edit_title.setToolTip(f"檔案: {filename}")  # Hover 顯示完整檔名
-
-        layout.addWidget(self.edit_title, 1)
+        # 標題 (平時以 QLabel 顯示，雙擊才建立 QLineEdit 編輯)
+        self._title = title if title else filename
+        self._title_editor = None
+        self.lbl_title = QLabel(self)
+        self.lbl_title.setObjectName("title")
+        self.lbl_title.setToolTip(f"檔案: {filename}")  # Hover 顯示完整檔名
+        self.lbl_title.mouseDoubleClickEvent = self._start_title_edit
+        self._dirty = self._title != self._original_title
 
         # --- 4. 刪除按鈕 ---
-        btn_del = QPushButton("✕")
-        btn_del.setFixedSize(30, 30)
-        btn_del.setCursor(Qt.PointingHandCursor)
-        btn_del.setStyleSheet(Styles.BTN_DANGER)
-        btn_del.clicked.connect(lambda: self.on_delete.emit(self))
-        layout.addWidget(btn_del)
+        self.btn_del = QPushButton("✕", self)
+        self.btn_del.setFixedSize(self._BTN_SIZE, self._BTN_SIZE)
+        self.btn_del.setCursor(Qt.PointingHandCursor)
+        self.btn_del.setObjectName("delete")
+        self.btn_del.clicked.connect(lambda: self.on_delete.emit(self))
+
+    def sizeHint(self) -> QSize:
+        width = (
+            self._MARGIN * 2
+            + self._HANDLE_WIDTH
+            + self.icon_width
+            + self._TITLE_MIN_WIDTH
+            + self._BTN_SIZE
+            + self._SPACING * 3
+        )
+        return QSize(width, self.row_height)
+
+    def _layout_children(self):
+        """依固定像素擺放子元件 (取代 QHBoxLayout)"""
+        m, sp = self._MARGIN, self._SPACING
+        h = self.height() - m * 2
+        x = m
+        self.lbl_handle.setGeometry(x, m, self._HANDLE_WIDTH, h)
+        x += self._HANDLE_WIDTH + sp
+        self.lbl_icon.setGeometry(x, m, self.icon_width, h)
+        x += self.icon_width + sp
+        x_btn = self.width() - m - self._BTN_SIZE
+        self.btn_del.move(x_btn, (self.height() - self._BTN_SIZE) // 2)
+        self.lbl_title.setGeometry(x, m, max(0, x_btn - sp - x), h)
+
+    @classmethod
+    def _get_placeholder(cls) -> QPixmap:
+        """取得共用的縮圖佔位圖"""
+        if cls._PLACEHOLDER is None:
+            cls._PLACEHOLDER = QPixmap(52, 40)
+            cls._PLACEHOLDER.fill(QColor(COLOR_BG_THUMBNAIL))
+        return cls._PLACEHOLDER
+
+    @classmethod
+    def _get_type_icon(cls, file_path: str, size: int) -> QPixmap:
+        """取得檔案類型的系統圖示 (同副檔名共用同一張 pixmap)"""
+        ext = os.path.splitext(file_path)[1].lower()
+        key = f"{ext}:{size}"
+        pix = cls._type_icon_cache.get(key)
+        if pix is None:
+            if cls._icon_provider is None:
+                cls._icon_provider = QFileIconProvider()
+            icon = cls._icon_provider.icon(QFileInfo(file_path))
+            pix = icon.pixmap(size, size) if not icon.isNull() else QPixmap()
+            cls._type_icon_cache[key] = pix
+        return pix
 
     def get_current_title(self) -> str:
         """取得使用者輸入的標題"""
-        return self.edit_title.text()
+        return self._title
+
+    def _update_title_label(self):
+        """依標籤寬度顯示省略中段的標題"""
+        if not self._title:
+            self.lbl_title.setText("請輸入說明...")
+            return
+        self.lbl_title.setText(
+            self.lbl_title.fontMetrics().elidedText(
+                self._title, Qt.ElideMiddle, self.lbl_title.contentsRect().width()
+            )
+        )
+
+    def _start_title_edit(self, event):
+        """雙擊標題：只為目前這列建立編輯框"""
+        if self._title_editor is not None:
+            return
+        editor = QLineEdit(self._title, self)
+        editor.setObjectName("title")
+        editor.setPlaceholderText("請輸入說明...")
+        editor.setGeometry(self.lbl_title.geometry())
+        editor.editingFinished.connect(self._finish_title_edit)
+        self._title_editor = editor
+        self.lbl_title.hide()
+        editor.show()
+        editor.setFocus()
+        editor.selectAll()
+
+    def _finish_title_edit(self):
+        """結束編輯：寫回標籤並釋放編輯框"""
+        editor, self._title_editor = self._title_editor, None
+        if editor is None:
+            return
+        self._title = editor.text()
+        self._update_title_label()
+        self.lbl_title.show()
+        editor.deleteLater()
+        self._mark_dirty()
+
+    def _mark_dirty(self):
+        """標題編輯後更新 dirty 旗標，儲存時不必再逐列比對"""
+        self._dirty = self._title != self._original_title
+        if self._dirty:
+            self.on_title_dirty.emit(self)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._layout_children()
+        self._update_title_label()
+        if self._title_editor is not None:
+            self._title_editor.setGeometry(self.lbl_title.geometry())
 
     def is_title_changed(self) -> bool:
         """檢查標題是否有變更"""
-        return self.get_current_title() != self._original_title
+        return self._dirty
 
     def update_file_path(self, new_path: str):
         """更新檔案路徑（重命名後呼叫）"""
         self.file_path = new_path
         self._original_title = self.get_current_title()
+        self._dirty = False
         # 更新 tooltip
-        self.edit_title.setToolTip(f"檔案: {os.path.basename(new_path)}")
+        self.lbl_title.setToolTip(f"檔案: {os.path.basename(new_path)}")
 
     def _on_icon_click(self, event):
         """圖片縮圖點擊事件"""
@@ -123,15 +267,24 @@ class AttachmentItemWidget(QWidget):
     def refresh_thumbnail(self):
         """重新載入縮圖（編輯後呼叫）"""
         if self.file_type == "image" and os.path.exists(self.file_path):
-            pix = QPixmap(self.file_path)
-            if not pix.isNull():
-                self.lbl_icon.setPixmap(pix)
+            self.set_thumbnail_image(QImage(self.file_path))
+
+    def set_thumbnail_image(self, image: QImage):
+        """套用解碼完成的縮圖"""
+        self.needs_thumbnail = False
+        if image.isNull():
+            self.lbl_icon.setText("Error")
+            return
+        self.lbl_icon.setPixmap(QPixmap.fromImage(image))
+        # 設定游標和工具提示
+        self.lbl_icon.setCursor(Qt.PointingHandCursor)
+        self.lbl_icon.setToolTip("點擊編輯圖片")
 
     def get_data(self):
         data = {
             "type": self.file_type,
             "path": self.file_path,
-            "title": self.edit_title.text(),
+            "title": self._title,
         }
         # 合併額外欄位
         data.update(self.extra_data)
@@ -150,7 +303,10 @@ class AttachmentListWidget(QListWidget):
         self.setSelectionMode(QListWidget.SingleSelection)
         self.setSpacing(2)
         self.setResizeMode(QListWidget.Adjust)
-        self.setStyleSheet(Styles.ATTACHMENT_LIST)
+        # 每列高度固定，讓 view 不必逐列詢問 sizeHint
+        self.setUniformItemSizes(True)
+        # 列元件樣式統一在清單層級解析一次，避免每列各自 setStyleSheet
+        self.setStyleSheet(_ATTACHMENT_LIST_STYLE)
 
         # 一列高度 (包含圖片和多行文字的最大高度)
         self.row_height = 40
@@ -161,27 +317,23 @@ class AttachmentListWidget(QListWidget):
         # 待刪除檔案列表（延遲刪除：儲存時才真正移動）
         self.pending_trash = []
 
+        # 標題已變更的列 (dict 作為有序集合，儲存時才重命名)
+        self._dirty_widgets = {}
+
+        # 縮圖延遲載入：捲動停止後只解碼可見列
+        self._pending_loaders = {}  # widget -> ThumbnailLoader
+        self._load_timer = QTimer(self)
+        self._load_timer.setSingleShot(True)
+        self._load_timer.setInterval(50)
+        self._load_timer.timeout.connect(self._load_visible)
+        self.verticalScrollBar().valueChanged.connect(self._schedule_visible_load)
+
     def set_project_manager(self, pm):
         """設定 ProjectManager 參考"""
         self.pm = pm
 
     def add_attachment(self, file_path, title="", file_type="image"):
-        item = QListWidgetItem(self)
-
-        # 建立 Widget，傳入高度限制
-        widget = AttachmentItemWidget(
-            file_path, title, file_type, row_height=self.row_height
-        )
-
-        self.setItemWidget(item, widget)
-
-        # 設定 Item 的 SizeHint 與 Widget 高度一致
-        item.setSizeHint(QSize(widget.sizeHint().width(), self.row_height))
-
-        widget.on_delete.connect(self.remove_attachment_row)
-        widget.on_image_click.connect(
-            lambda path, w=widget: self._open_image_editor(path, w)
-        )
+        self.add_attachment_with_extra(file_path, title, file_type)
 
     def add_attachment_with_extra(
         self, file_path, title="", file_type="image", extra_data=None
@@ -189,6 +341,7 @@ class AttachmentListWidget(QListWidget):
         """加入附件並附帶額外欄位 (e.g. command)"""
         item = QListWidgetItem(self)
 
+        # 建立 Widget，傳入高度限制
         widget = AttachmentItemWidget(
             file_path,
             title,
@@ -196,25 +349,97 @@ class AttachmentListWidget(QListWidget):
             row_height=self.row_height,
             extra_data=extra_data,
         )
+        # 記住所屬 item，移除時不必逐列比對 itemWidget
+        widget.list_item = item
 
         self.setItemWidget(item, widget)
+
+        # 設定 Item 的 SizeHint 與 Widget 高度一致
         item.setSizeHint(QSize(widget.sizeHint().width(), self.row_height))
+
         widget.on_delete.connect(self.remove_attachment_row)
+        widget.on_title_dirty.connect(self._on_title_dirty)
+        if widget.is_title_changed():
+            self._on_title_dirty(widget)
+        if widget.needs_thumbnail:
+            self._schedule_visible_load()
         widget.on_image_click.connect(
             lambda path, w=widget: self._open_image_editor(path, w)
         )
 
     def remove_attachment_row(self, widget):
         """移除附件列（延遲刪除：只從 UI 移除，儲存時才移動檔案）"""
-        for i in range(self.count()):
-            item = self.item(i)
-            if self.itemWidget(item) == widget:
-                # 將檔案路徑加入待刪除列表（延遲刪除）
-                if hasattr(widget, "file_path") and widget.file_path:
-                    self.pending_trash.append(widget.file_path)
+        item = widget.list_item
+        row = self.row(item) if item is not None else -1
+        if row < 0:
+            return
 
-                self.takeItem(i)
-                break
+        # 將檔案路徑加入待刪除列表（延遲刪除）
+        if widget.file_path:
+            self.pending_trash.append(widget.file_path)
+
+        self._dirty_widgets.pop(widget, None)
+        self._cancel_loader(widget)
+        self.takeItem(row)
+
+    def clear(self):
+        self._dirty_widgets.clear()
+        for widget in list(self._pending_loaders):
+            self._cancel_loader(widget)
+        super().clear()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._schedule_visible_load()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._schedule_visible_load()
+
+    def _schedule_visible_load(self, *_):
+        """合併短時間內的捲動/新增，停止後再載入可見列縮圖"""
+        self._load_timer.start()
+
+    def _visible_row_range(self) -> range:
+        """目前 viewport 內可見的列範圍"""
+        if not self.isVisible() or self.count() == 0:
+            return range(0)
+        top = self.indexAt(QPoint(0, 0))
+        bottom = self.indexAt(QPoint(0, self.viewport().height() - 1))
+        first = top.row() if top.isValid() else 0
+        last = bottom.row() if bottom.isValid() else self.count() - 1
+        return range(first, last + 1)
+
+    def _load_visible(self):
+        """只為可見列送出縮圖解碼，取消已捲出畫面且尚未開始的工作"""
+        pool = QThreadPool.globalInstance()
+        visible = set()
+        for row in self._visible_row_range():
+            widget = self.itemWidget(self.item(row))
+            if widget is None:
+                continue
+            visible.add(widget)
+            if widget.needs_thumbnail and widget not in self._pending_loaders:
+                loader = ThumbnailLoader(widget.file_path, self.row_height)
+                loader.signals.loaded.connect(widget.set_thumbnail_image)
+                self._pending_loaders[widget] = loader
+                pool.start(loader)
+
+        for widget in list(self._pending_loaders):
+            if not widget.needs_thumbnail:
+                del self._pending_loaders[widget]
+            elif widget not in visible:
+                self._cancel_loader(widget)
+
+    def _cancel_loader(self, widget):
+        """取消尚未開始的縮圖工作 (已開始的會自然完成)"""
+        loader = self._pending_loaders.pop(widget, None)
+        if loader is not None:
+            QThreadPool.globalInstance().tryTake(loader)
+
+    def _on_title_dirty(self, widget):
+        """記錄標題已變更的列"""
+        self._dirty_widgets[widget] = None
 
     def flush_pending_trash(self):
         """
@@ -242,21 +467,20 @@ class AttachmentListWidget(QListWidget):
         if not self.pm:
             return
 
-        for i in range(self.count()):
-            item = self.item(i)
-            widget = self.itemWidget(item)
-            if (
-                widget
-                and hasattr(widget, "is_title_changed")
-                and widget.is_title_changed()
-            ):
-                new_title = widget.get_current_title()
-                old_path = widget.file_path
-
-                # 呼叫 ProjectManager 重命名檔案
-                new_path = self.pm.rename_attachment(old_path, new_title)
-                if new_path:
-                    widget.update_file_path(new_path)
+        # 只處理標題有變更的列
+        for widget in list(self._dirty_widgets):
+            if not widget.is_title_changed():
+                del self._dirty_widgets[widget]
+                continue
+
+            new_title = widget.get_current_title()
+            old_path = widget.file_path
+
+            # 呼叫 ProjectManager 重命名檔案
+            new_path = self.pm.rename_attachment(old_path, new_title)
+            if new_path:
+                widget.update_file_path(new_path)
+                del self._dirty_widgets[widget]
 
     def get_all_attachments(self) -> list:
         """取得所有附件資料"""
@@ -3,13 +3,15 @@
 基於 QGraphicsView 實現，支援圖片顯示、縮放、工具繪製
 """
 
-from typing import Optional, TYPE_CHECKING
+from collections import OrderedDict
+from typing import List, Optional, TYPE_CHECKING
 
-from PySide6.QtCore import Qt, Signal, QRectF
+from PySide6.QtCore import Qt, Signal, QRectF, QPoint, QPointF, QTimer, QThreadPool
 from PySide6.QtGui import (
     QPixmap,
     QImage,
     QPainter,
+    QTransform,
     QWheelEvent,
     QMouseEvent,
     QKeyEvent,
@@ -19,8 +21,15 @@ from PySide6.QtWidgets import (
     QGraphicsScene,
     QGraphicsPixmapItem,
     QGraphicsItem,
+    QGraphicsRectItem,
+    QGraphicsEllipseItem,
+    QGraphicsPathItem,
+    QGraphicsItemGroup,
+    QGraphicsEffect,
 )
 
+from .tools.rect_tool import AnnotationRect
+
 try:
     import numpy as np
 
@@ -28,10 +37,58 @@ try:
 except ImportError:
     HAS_NUMPY = False
 
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# 超過此像素數才改用 numba 平行 kernel (小圖的 JIT 呼叫成本不划算)
+NUMBA_MIN_PIXELS = 256 * 1024
+
+# numpy 查表時的分塊大小 (256x256x4 bytes ≈ 256KB，可留在 L2 cache)
+FILTER_TILE_SIZE = 256
+
+if HAS_NUMBA:
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _apply_lut_rgb(arr, lut):
+        """逐列平行套用查找表至 RGB 通道 (alpha 不變)"""
+        for y in prange(arr.shape[0]):
+            for x in range(arr.shape[1]):
+                arr[y, x, 0] = lut[arr[y, x, 0]]
+                arr[y, x, 1] = lut[arr[y, x, 1]]
+                arr[y, x, 2] = lut[arr[y, x, 2]]
+
 if TYPE_CHECKING:
     from .tools.base_tool import BaseTool
 
 
+class _FilterPreviewEffect(QGraphicsEffect):
+    """
+    預覽用濾鏡效果
+
+    繪製時才對可見區域 (裝置座標的點陣) 套用亮度/對比，
+    拖動滑桿期間不需處理整張原圖的像素。
+    """
+
+    def __init__(self, canvas: "ImageCanvas"):
+        super().__init__()
+        self._canvas = canvas
+
+    def draw(self, painter: QPainter):
+        offset = QPoint()
+        pixmap = self.sourcePixmap(Qt.DeviceCoordinates, offset, QGraphicsEffect.NoPad)
+        if pixmap.isNull():
+            return
+
+        painter.save()
+        painter.setWorldTransform(QTransform())
+        painter.drawPixmap(offset, self._canvas._apply_filters(pixmap))
+        painter.restore()
+
+
 class ImageCanvas(QGraphicsView):
     """
     圖片畫布
@@ -43,6 +100,12 @@ class ImageCanvas(QGraphicsView):
     image_changed = Signal()  # 圖片內容變更
     zoom_changed = Signal(float)  # 縮放比例變更
 
+    # 濾鏡結果快取數量
+    FILTER_CACHE_SIZE = 4
+
+    # 濾鏡 kernel 是否已排程預熱 (整個程式只需一次)
+    _filters_warm_scheduled = False
+
     # 縮放常數
     ZOOM_MIN = 0.1
     ZOOM_MAX = 10.0
@@ -63,10 +126,27 @@ class ImageCanvas(QGraphicsView):
         # 濾鏡參數
         self._brightness: int = 0  # -128 到 128
         self._contrast: int = 0  # -128 到 128
+        self._lut = None  # 亮度/對比查找表
+        self._lut_key = None  # 查找表對應的 (brightness, contrast)
+
+        # 剪裁後基礎圖快取 (滑桿調整時不必重新從原圖剪裁)
+        self._cached_base_pixmap: Optional[QPixmap] = None
+        self._cached_crop_key = None
+
+        # 濾鏡結果 LRU 快取 (來回拖動滑桿時直接取用)
+        self._filtered_cache: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+
+        # 預覽模式 (拖動滑桿時改由繪製效果只處理可見區域)
+        self._preview_mode = False
+        self._preview_effect: Optional[_FilterPreviewEffect] = None
 
         # 工具
         self._current_tool: Optional["BaseTool"] = None
 
+        # 標註項目 (頂層 item，控制點為其子項目會自動跟隨)
+        self._annotation_items: List[QGraphicsItem] = []
+        self._annotation_set: set = set()  # 與清單同步，供 O(1) 查詢
+
         # 縮放
         self._zoom_factor = 1.0
 
@@ -78,6 +158,12 @@ class ImageCanvas(QGraphicsView):
         # 狀態標記
         self._is_in_crop_session = False
 
+        # 濾鏡重繪合併計時器 (連續調整時只繪製最後一次)
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(16)
+        self._refresh_timer.timeout.connect(self._refresh_display_now)
+
         # 設定
         self._setup_view()
 
@@ -93,6 +179,10 @@ class ImageCanvas(QGraphicsView):
         # 背景
         self.setBackgroundBrush(Qt.darkGray)
 
+        # 依變更區域重繪；標註以外不需要額外的反鋸齒邊界
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
+
         # 捲軸
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
@@ -132,11 +222,18 @@ class ImageCanvas(QGraphicsView):
         if self._pixmap_item:
             self._scene.removeItem(self._pixmap_item)
 
-        # 儲存原始圖片
-        self._original_pixmap = pixmap.copy()
+        # 儲存原始圖片 (QPixmap 為隱式共享，原圖只讀取不修改，不需深拷貝)
+        self._original_pixmap = QPixmap(pixmap)
+        self._invalidate_display_cache()
 
         # 建立新項目
         self._pixmap_item = QGraphicsPixmapItem(pixmap)
+        # 快取裝置座標的點陣結果，平移/選取重繪時直接貼圖
+        self._pixmap_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        # 預覽效果隨 item 建立 (item 負責釋放)，平時停用
+        self._preview_effect = _FilterPreviewEffect(self)
+        self._preview_effect.setEnabled(False)
+        self._pixmap_item.setGraphicsEffect(self._preview_effect)
         self._scene.addItem(self._pixmap_item)
 
         # 設定場景大小
@@ -153,7 +250,10 @@ class ImageCanvas(QGraphicsView):
         self.reset_zoom()
 
         # 初始顯示 (這會套用預設濾鏡 0,0)
-        self._refresh_display()
+        self._refresh_display_now()
+
+        # 背景預熱濾鏡，讓第一次拖動滑桿不必等待 JIT 編譯
+        self._schedule_filter_warmup()
 
     def get_pixmap(self) -> Optional[QPixmap]:
         """取得目前顯示的圖片"""
@@ -171,19 +271,21 @@ class ImageCanvas(QGraphicsView):
             # 清空場景中所有項目
             self._scene.clear()
             self._pixmap_item = None
+            self._annotation_items.clear()
+            self._annotation_set.clear()
 
-            # 使用副本還原，避免修改到原始備份
-            # 使用副本還原，避免修改到原始備份
-            self.set_pixmap(self._original_pixmap.copy())  # 這會重置 _current_crop_rect
+            # 原圖只會被讀取，直接共用即可
+            self.set_pixmap(self._original_pixmap)  # 這會重置 _current_crop_rect
 
             # 確保完全重置
             self._current_crop_rect = QRectF(self._original_pixmap.rect())
+            self._invalidate_display_cache()
 
             # 重設濾鏡
             self._brightness = 0
             self._contrast = 0
 
-            self._refresh_display()
+            self._refresh_display_now()
 
     def update_pixmap(self, pixmap: QPixmap):
         """
@@ -197,6 +299,33 @@ class ImageCanvas(QGraphicsView):
             self._scene.setSceneRect(QRectF(pixmap.rect()))
             self.image_changed.emit()
 
+    # ===== 標註管理 =====
+
+    @property
+    def annotation_items(self) -> List[QGraphicsItem]:
+        """標註項目清單 (與工具共用同一個 list)"""
+        return self._annotation_items
+
+    def has_annotation(self, item: QGraphicsItem) -> bool:
+        """是否為已記錄的標註"""
+        return item in self._annotation_set
+
+    def add_annotation(self, item: QGraphicsItem):
+        """加入標註至場景並記錄"""
+        if item.scene() is not self._scene:
+            self._scene.addItem(item)
+        if item not in self._annotation_set:
+            self._annotation_set.add(item)
+            self._annotation_items.append(item)
+
+    def remove_annotation(self, item: QGraphicsItem):
+        """自場景移除標註"""
+        if item.scene() is self._scene:
+            self._scene.removeItem(item)
+        if item in self._annotation_set:
+            self._annotation_set.discard(item)
+            self._annotation_items.remove(item)
+
     def set_tool(self, tool: Optional["BaseTool"]):
         """
         設定目前工具
@@ -256,10 +385,10 @@ class ImageCanvas(QGraphicsView):
 
     def wheelEvent(self, event: QWheelEvent):
         """滑鼠滾輪事件（縮放）"""
-        if event.angleDelta().y() > 0:
-            self.zoom_in()
-        else:
-            self.zoom_out()
+        # 依滾動量換算級數 (一格 = 120)，高解析滾輪/觸控板的細碎事件合併為一次縮放
+        steps = event.angleDelta().y() / 120.0
+        if steps:
+            self._apply_zoom(self.ZOOM_STEP**steps)
 
     def mousePressEvent(self, event: QMouseEvent):
         """滑鼠按下事件"""
@@ -387,19 +516,18 @@ class ImageCanvas(QGraphicsView):
             self._refresh_display()
 
     def _refresh_display(self):
+        """排程重新整理顯示 (合併短時間內的多次請求)"""
+        # 已在等待時不重新起算，連續拖動滑桿時仍約每個畫面重繪一次
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _refresh_display_now(self):
         """重新整理顯示 (原圖 -> 剪裁 -> 濾鏡 -> 顯示)"""
+        self._refresh_timer.stop()
         if not self._original_pixmap or not self._pixmap_item:
             return
 
-        # 1. 取得基礎剪裁圖片 (無濾鏡)
-        crop_rect = (
-            self._current_crop_rect
-            if self._current_crop_rect
-            else QRectF(self._original_pixmap.rect())
-        )
-        base_pixmap = self._original_pixmap.copy(crop_rect.toRect())
-
-        # 2. 如果正在剪裁模式，直接顯示無濾鏡的原圖
+        # 1. 如果正在剪裁模式，直接顯示無濾鏡的原圖
         # 但 start_crop_session 已經處理了顯示邏輯 (設為原圖)，這裡只需處理一般狀態
         # 為了避免衝突，如果 is_in_crop_session，我們應該顯示什麼？
         # start_crop_session 會將 pixmap 設為原圖。
@@ -408,14 +536,65 @@ class ImageCanvas(QGraphicsView):
         if self._is_in_crop_session:
             return
 
-        # 3. 套用濾鏡
-        filtered_pixmap = self._apply_filters(base_pixmap)
+        # 2. 取得基礎剪裁圖片 (無濾鏡)
+        base_pixmap = self._get_base_pixmap()
+
+        # 3. 預覽模式：顯示無濾鏡的基礎圖，由效果在繪製時處理可見區域
+        if self._preview_mode:
+            if self._pixmap_item.pixmap().cacheKey() != base_pixmap.cacheKey():
+                self._pixmap_item.setPixmap(base_pixmap)
+                self._scene.setSceneRect(QRectF(base_pixmap.rect()))
+            self._preview_effect.setEnabled(True)
+            self._preview_effect.update()
+            return
+
+        # 4. 套用濾鏡 (相同剪裁與參數直接取用快取)
+        key = (self._cached_crop_key, self._brightness, self._contrast)
+        filtered_pixmap = self._filtered_cache.get(key)
+        if filtered_pixmap is None:
+            filtered_pixmap = self._apply_filters(base_pixmap)
+            self._filtered_cache[key] = filtered_pixmap
+            if len(self._filtered_cache) > self.FILTER_CACHE_SIZE:
+                self._filtered_cache.popitem(last=False)
+        else:
+            self._filtered_cache.move_to_end(key)
 
-        # 4. 更新顯示
+        # 5. 更新顯示
+        self._preview_effect.setEnabled(False)
         self._pixmap_item.setPixmap(filtered_pixmap)
         self._scene.setSceneRect(QRectF(filtered_pixmap.rect()))
         self.image_changed.emit()
 
+    def begin_preview(self):
+        """開始預覽模式 (滑桿按下時呼叫)"""
+        self._preview_mode = True
+
+    def end_preview(self):
+        """結束預覽模式，以全解析度重新套用濾鏡 (滑桿放開時呼叫)"""
+        if not self._preview_mode:
+            return
+        self._preview_mode = False
+        self._refresh_display_now()
+
+    def _get_base_pixmap(self) -> QPixmap:
+        """取得剪裁後的基礎圖 (剪裁區域與原圖未變時沿用快取)"""
+        crop_rect = (
+            self._current_crop_rect
+            if self._current_crop_rect
+            else QRectF(self._original_pixmap.rect())
+        ).toRect()
+        key = (crop_rect.getRect(), self._original_pixmap.cacheKey())
+        if key != self._cached_crop_key:
+            self._cached_base_pixmap = self._original_pixmap.copy(crop_rect)
+            self._cached_crop_key = key
+        return self._cached_base_pixmap
+
+    def _invalidate_display_cache(self):
+        """清除顯示用快取 (原圖或剪裁區域變更時呼叫)"""
+        self._cached_base_pixmap = None
+        self._cached_crop_key = None
+        self._filtered_cache.clear()
+
     def _apply_filters(self, pixmap: QPixmap) -> QPixmap:
         """套用影像處理濾鏡"""
         # print(f"Applying filters: B={self._brightness}, C={self._contrast}, Numpy={HAS_NUMPY}")
@@ -427,44 +606,39 @@ class ImageCanvas(QGraphicsView):
             return pixmap
 
         try:
+            # 查表只處理 RGB 三個通道 (各通道共用同一張表，通道順序不影響)，
+            # 非 premultiplied 的 32-bit 格式 (little-endian 為 BGRA) 可直接處理；
+            # premultiplied 的 RGB 已乘上 alpha，逐通道查表會算錯半透明像素，須先轉換
             image = pixmap.toImage()
-            if image.format() != QImage.Format_ARGB32:
+            if image.format() not in (QImage.Format_ARGB32, QImage.Format_RGB32):
                 image = image.convertToFormat(QImage.Format_ARGB32)
 
             width = image.width()
             height = image.height()
 
-            # 建立 numpy array view/copy
+            # 直接以 numpy view 存取 image 的像素記憶體 (不複製)
+            # PySide6 的 bits() 回傳可寫入的 memoryview，大小已正確
+            # 以 bytesPerLine 作為列距，避免 Qt 對齊填充的掃描線被誤讀
             ptr = image.bits()
-            arr = np.array(ptr).reshape(height, width, 4)
-
-            # 如果 arr 是 copy，修改它不會影響 image。
-            # 所以我們必須在運算後，用 arr 的資料建立新的 QImage
-
-            # 複製 RGB 通道進行處理
-            img_process = arr[:, :, :3].astype(np.float32)
-
-            # 對比 (Contrast)
-            if self._contrast != 0:
-                f = (259 * (self._contrast + 255)) / (255 * (259 - self._contrast))
-                img_process = (img_process - 128) * f + 128
-
-            # 亮度 (Brightness)
-            if self._brightness != 0:
-                img_process = img_process + self._brightness
-
-            # Clip 0-255
-            img_process = np.clip(img_process, 0, 255).astype(np.uint8)
-
-            # 將處理後的數據寫回 arr
-            arr[:, :, :3] = img_process
+            bpl = image.bytesPerLine()
+            buf = np.frombuffer(ptr, dtype=np.uint8, count=bpl * height)
+            arr = np.lib.stride_tricks.as_strided(
+                buf, shape=(height, width, 4), strides=(bpl, 4, 1)
+            )
 
-            # 建立新的 QImage
-            # 注意: QImage 參考 arr.data，必須確保 arr 在 QPixmap 建立完成前不被回收
-            # QPixmap.fromImage 會進行 deep copy
-            new_image = QImage(arr.data, width, height, width * 4, QImage.Format_ARGB32)
+            # 亮度/對比皆為逐像素的 8-bit 映射，以查表一次完成 (就地寫回 image)
+            lut = self._get_lut()
+            if HAS_NUMBA and width * height >= NUMBA_MIN_PIXELS:
+                _apply_lut_rgb(arr, lut)
+            else:
+                # 分塊處理，讓每塊的工作集保持在 cache 內
+                t = FILTER_TILE_SIZE
+                for y0 in range(0, height, t):
+                    for x0 in range(0, width, t):
+                        tile = arr[y0 : y0 + t, x0 : x0 + t, :3]
+                        tile[...] = lut[tile]
 
-            return QPixmap.fromImage(new_image)
+            return QPixmap.fromImage(image)
 
         except Exception as e:
             print(f"Filter error: {e}")
@@ -473,6 +647,45 @@ class ImageCanvas(QGraphicsView):
             traceback.print_exc()
             return pixmap
 
+    @classmethod
+    def _schedule_filter_warmup(cls):
+        """排程背景預熱濾鏡 (只排一次)"""
+        if cls._filters_warm_scheduled or not HAS_NUMPY:
+            return
+        cls._filters_warm_scheduled = True
+        QThreadPool.globalInstance().start(cls._warm_filters)
+
+    @staticmethod
+    def _warm_filters():
+        """以小陣列跑一次查表 (背景執行緒，不觸碰任何 Qt 物件)"""
+        lut = np.arange(256, dtype=np.uint8)
+        tile = np.zeros((8, 8, 4), np.uint8)
+        tile[:, :, :3] = lut[tile[:, :, :3]]
+        if HAS_NUMBA:
+            _apply_lut_rgb(tile, lut)
+
+    def _get_lut(self) -> "np.ndarray":
+        """取得亮度/對比查找表 (數值未變時沿用)"""
+        key = (self._brightness, self._contrast)
+        if self._lut_key != key:
+            # 全程就地運算，只配置一個 float32 陣列
+            x = np.arange(256, dtype=np.float32)
+            offset = np.float32(self._brightness)
+            # 對比 (Contrast)
+            if self._contrast != 0:
+                f = np.float32(
+                    (259 * (self._contrast + 255)) / (255 * (259 - self._contrast))
+                )
+                np.subtract(x, 128, out=x)
+                np.multiply(x, f, out=x)
+                offset += np.float32(128)
+            # 亮度 (Brightness)
+            np.add(x, offset, out=x)
+            np.clip(x, 0, 255, out=x)
+            self._lut = x.astype(np.uint8)
+            self._lut_key = key
+        return self._lut
+
     # ===== 圖片操作 =====
 
     def start_crop_session(self) -> QRectF:
@@ -490,10 +703,9 @@ class ImageCanvas(QGraphicsView):
 
         self._is_in_crop_session = True
 
-        self._is_in_crop_session = True
-
         # 1. 還原顯示原圖 (只更新 Item，不清除 Scene)，且為了剪裁，暫時不套用濾鏡 (顯示 Raw)
         if self._pixmap_item:
+            self._preview_effect.setEnabled(False)
             self._pixmap_item.setPixmap(self._original_pixmap)
             self._scene.setSceneRect(QRectF(self._original_pixmap.rect()))
 
@@ -505,10 +717,8 @@ class ImageCanvas(QGraphicsView):
             else QPointF(0, 0)
         )
 
-        for item in self._scene.items():
-            # 排除 pixmap 本身
-            if item != self._pixmap_item:
-                item.moveBy(offset.x(), offset.y())
+        for item in self._annotation_items:
+            item.moveBy(offset.x(), offset.y())
 
         self.fit_in_view()
         return self._current_crop_rect
@@ -534,26 +744,17 @@ class ImageCanvas(QGraphicsView):
         self._current_crop_rect = final_rect.intersected(
             QRectF(self._original_pixmap.rect())
         )
+        self._invalidate_display_cache()
 
-        # 1. 產生剪裁圖
-        cropped = self._original_pixmap.copy(self._current_crop_rect.toRect())
+        # 1. 更新顯示 (透過 refresh_display 剪裁並套用濾鏡，會設定 pixmap 和 scene rect)
+        self._refresh_display_now()
 
-        # 2. 更新顯示 (透過 refresh_display 套用濾鏡)
-        self._refresh_display()
-        # _refresh_display 已經會設定 pixmap 和 scene rect
-
-        # 移除舊的手動設定
-        # if self._pixmap_item:
-        #     self._pixmap_item.setPixmap(cropped)
-        #     self._scene.setSceneRect(QRectF(cropped.rect()))
-
-        # 3. 反向偏移標註：將標註從 "原圖空間" 移回 "剪裁空間"
+        # 2. 反向偏移標註：將標註從 "原圖空間" 移回 "剪裁空間"
         # 標註原本在 (x', y')，現在應該在 (x' - final_crop.x, y' - final_crop.y)
         offset = self._current_crop_rect.topLeft()
 
-        for item in self._scene.items():
-            if item != self._pixmap_item:
-                item.moveBy(-offset.x(), -offset.y())
+        for item in self._annotation_items:
+            item.moveBy(-offset.x(), -offset.y())
 
         self.fit_in_view()
         # self.image_changed.emit() # refresh_display 會 emit
@@ -565,31 +766,8 @@ class ImageCanvas(QGraphicsView):
         if not self._pixmap_item:
             return QPixmap()
 
-        # ... (可以使用 start/end session 重構，但這裡維持原樣)
-        # 為了避免混淆，若使用此方法直接裁切，視為破壞性
-        # 我們假設外部只會呼叫 end_crop_session
-        return QPixmap()  # Placeholder or Deprecated warning?
-        # 為了安全，保留原邏輯但標記 Deprecated
-        # 實際上 crop_tool 會調用上面的 session 方法，所以這個舊方法可能不會被用到了
-        # 但為了不破壞既有邏輯，暫時不動它下面的實作?
-        # 下面原有的實作:
-
-        # 將場景座標轉換為 Item 座標（即圖片像素座標）
-        # 使用 mapFromScene 取代直接假設
-        polygon = self._pixmap_item.mapFromScene(rect)
-        item_rect = polygon.boundingRect().toRect()
-
-        pixmap = self._pixmap_item.pixmap()
-
-        # 確保裁切區域在圖片範圍內
-        image_rect = QRectF(pixmap.rect()).toRect()
-        crop_rect = item_rect.intersected(image_rect)
-
-        if crop_rect.isEmpty():
-            return QPixmap()
-
-        cropped = pixmap.copy(crop_rect)
-        return cropped
+        # 剪裁一律透過 start/end_crop_session，此方法不再直接裁切
+        return QPixmap()
 
     def render_to_image(self) -> QImage:
         """
@@ -601,44 +779,51 @@ class ImageCanvas(QGraphicsView):
         if not self._pixmap_item:
             return QImage()
 
+        # 若仍有尚未繪製的濾鏡變更或預覽效果，先以全解析度同步套用
+        if self._refresh_timer.isActive() or self._preview_mode:
+            self._preview_mode = False
+            self._refresh_display_now()
+
         pixmap = self._pixmap_item.pixmap()
-        image = QImage(pixmap.size(), QImage.Format_ARGB32)
+        # premultiplied 格式可走 QPainter 的快速合成路徑
+        image = QImage(pixmap.size(), QImage.Format_ARGB32_Premultiplied)
         image.fill(Qt.transparent)
 
         # 暫時隱藏所有選取控制點、剪裁 UI
-        from .tools.rect_tool import AnnotationRect, SelectionHandle
-        from PySide6.QtWidgets import QGraphicsRectItem, QGraphicsEllipseItem
-
         hidden_items = []
-        annotation_rects = []
+        annotation_rects = [
+            item for item in self._annotation_items if isinstance(item, AnnotationRect)
+        ]
 
+        # 框選工具的控制點：每個標註只需隱藏控制點根項目
+        for item in annotation_rects:
+            item._rendering = True
+            root = item.handle_root
+            if root.isVisible():
+                hidden_items.append(root)
+                root.hide()
+
+        # 剪裁工具的控制點群組、選取框 (矩形) 與遮罩 (路徑)：皆為頂層且非標註
         for item in self._scene.items():
-            # 隱藏框選工具的控制點
-            if isinstance(item, SelectionHandle):
-                if item.isVisible():
-                    hidden_items.append(item)
-                    item.hide()
-            # 隱藏剪裁工具的控制點 (圓形) 與遮罩/選取框 (矩形，但不是標註)
-            elif isinstance(item, QGraphicsEllipseItem) and not isinstance(
-                item, SelectionHandle
-            ):
-                # 剪裁工具的控制點 (非 AnnotationRect 的子物件)
-                if item.parentItem() is None and item.isVisible():
-                    hidden_items.append(item)
-                    item.hide()
-            elif isinstance(item, QGraphicsRectItem) and not isinstance(
-                item, AnnotationRect
+            if (
+                item.parentItem() is None
+                and isinstance(
+                    item,
+                    (
+                        QGraphicsItemGroup,
+                        QGraphicsEllipseItem,
+                        QGraphicsRectItem,
+                        QGraphicsPathItem,
+                    ),
+                )
+                and not self.has_annotation(item)
+                and item.isVisible()
             ):
-                # 剪裁工具的選取框或遮罩 (非 AnnotationRect)
-                # 也排除 pixmap item
-                if item != self._pixmap_item and item.isVisible():
-                    hidden_items.append(item)
-                    item.hide()
-            elif isinstance(item, AnnotationRect):
-                annotation_rects.append(item)
-                item._rendering = True
+                hidden_items.append(item)
+                item.hide()
 
         painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
         self._scene.render(painter)
         painter.end()
 
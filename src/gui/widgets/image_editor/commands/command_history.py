@@ -3,7 +3,8 @@
 管理撤銷/重做堆疊
 """
 
-from typing import List, Optional
+from collections import deque
+from typing import Deque, Optional
 
 from PySide6.QtCore import QObject, Signal
 
@@ -32,8 +33,13 @@ class CommandHistory(QObject):
         """
         super().__init__(parent)
         self._max_history = max_history
-        self._undo_stack: List[BaseCommand] = []
-        self._redo_stack: List[BaseCommand] = []
+        # deque(maxlen) 超出上限時自動捨棄最舊的紀錄 (O(1))
+        self._undo_stack: Deque[BaseCommand] = deque(maxlen=max_history)
+        self._redo_stack: Deque[BaseCommand] = deque()
+
+        # 上次發送的狀態 (未改變時不重複發送)
+        self._last_can_undo = False
+        self._last_can_redo = False
 
     @property
     def can_undo(self) -> bool:
@@ -58,11 +64,6 @@ class CommandHistory(QObject):
         if command.execute():
             self._undo_stack.append(command)
             self._redo_stack.clear()  # 執行新命令時清空重做堆疊
-
-            # 限制歷史紀錄數量
-            while len(self._undo_stack) > self._max_history:
-                self._undo_stack.pop(0)
-
             self._emit_changes()
             return True
         return False
@@ -126,7 +127,15 @@ class CommandHistory(QObject):
         return ""
 
     def _emit_changes(self):
-        """發送狀態變更信號"""
+        """發送狀態變更信號 (可撤銷/重做狀態只在改變時發送)"""
         self.history_changed.emit()
-        self.can_undo_changed.emit(self.can_undo)
-        self.can_redo_changed.emit(self.can_redo)
+
+        can_undo = self.can_undo
+        if can_undo != self._last_can_undo:
+            self._last_can_undo = can_undo
+            self.can_undo_changed.emit(can_undo)
+
+        can_redo = self.can_redo
+        if can_redo != self._last_can_redo:
+            self._last_can_redo = can_redo
+            self.can_redo_changed.emit(can_redo)
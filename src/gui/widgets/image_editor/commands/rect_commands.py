@@ -1,4 +1,3 @@
-from PySide6.QtWidgets import QGraphicsScene
 from PySide6.QtCore import QRectF, QPointF
 from .base_command import BaseCommand
 
@@ -6,24 +5,18 @@ from .base_command import BaseCommand
 class AddAnnotationCommand(BaseCommand):
     """新增標註命令"""
 
-    def __init__(self, scene: QGraphicsScene, annotation, annotation_list: list):
+    def __init__(self, canvas, annotation):
         super().__init__()
-        self._scene = scene
+        self._canvas = canvas
         self._annotation = annotation
-        self._list = annotation_list
 
     def execute(self):
-        if self._annotation not in self._scene.items():
-            self._scene.addItem(self._annotation)
-        if self._annotation not in self._list:
-            self._list.append(self._annotation)
+        # 畫布以 set 追蹤標註，不需掃描整個場景
+        self._canvas.add_annotation(self._annotation)
         return True
 
     def undo(self):
-        if self._annotation in self._scene.items():
-            self._scene.removeItem(self._annotation)
-        if self._annotation in self._list:
-            self._list.remove(self._annotation)
+        self._canvas.remove_annotation(self._annotation)
         return True
 
 
@@ -4,36 +4,94 @@
 """
 
 import os
+from functools import partial
 from typing import Optional
 
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QPixmap, QColor, QKeySequence, QShortcut
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QImage, QColor, QKeySequence, QShortcut
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
     QToolBar,
     QToolButton,
-    QWidget,
     QLabel,
     QSlider,
-    QSpinBox,
     QPushButton,
     QColorDialog,
-    QGroupBox,
     QMessageBox,
-    QSplitter,
-    QSplitter,
     QFrame,
-    QGraphicsDropShadowEffect,
 )
 
 from .canvas import ImageCanvas
 from .commands import CommandHistory
+from .floating_bar import FloatingBar
 from .tools.crop_tool import CropTool
 from .tools.rect_tool import RectTool, AnnotationRect
 
 
+# ===== 樣式表 (靜態部分於模組載入時組好，避免每次開啟對話框重組字串) =====
+
+_TOOLBAR_QSS = "QToolBar { spacing: 5px; }"
+
+_ZOOM_LABEL_QSS = "padding: 0 10px;"
+
+_SAVE_BTN_QSS = (
+    "background-color: #4CAF50; color: white; font-weight: bold; padding: 8px 30px;"
+)
+
+_CROP_BAR_QSS = """
+    QPushButton {
+        border-radius: 15px;
+        font-weight: bold;
+        font-size: 14px;
+        padding: 5px;
+    }
+    QPushButton:hover {
+        background-color: #f0f0f0;
+    }
+    QPushButton#confirm {
+        color: #4CAF50;
+        border: 2px solid #4CAF50;
+        font-size: 16px;
+    }
+    QPushButton#cancel {
+        color: #F44336;
+        border: 2px solid #F44336;
+        font-size: 16px;
+    }
+"""
+
+_ANNOT_BAR_QSS = """
+    QLabel {
+        font-weight: bold;
+        color: #333;
+    }
+"""
+
+# 顏色按鈕只有底色會變動
+_COLOR_BTN_TEMPLATE = "background-color: %s; border: 1px solid #ccc; border-radius: 15px;"
+
+
+class _ImageSaveSignals(QObject):
+    """_ImageSaver 的信號 (QRunnable 本身不是 QObject)"""
+
+    finished = Signal(str, bool)  # 儲存路徑, 是否成功
+
+
+class _ImageSaver(QRunnable):
+    """在背景執行緒編碼並寫入圖片 (QImage 可跨執行緒使用)"""
+
+    def __init__(self, image: QImage, save_path: str):
+        super().__init__()
+        self.image = image
+        self.save_path = save_path
+        self.signals = _ImageSaveSignals()
+
+    def run(self):
+        self.signals.finished.emit(self.save_path, self.image.save(self.save_path))
+
+
 class ImageEditorDialog(QDialog):
     """
     圖片編輯器對話框
@@ -65,6 +123,8 @@ class ImageEditorDialog(QDialog):
         self._image_path = image_path
         self._output_path = output_path
         self._pm = project_manager
+        self._backup_done = False  # 原圖已備份 (或已存在) 則不再重複檢查
+        self._saver: Optional[_ImageSaver] = None  # 進行中的背景儲存
 
         # 命令歷史
         self._history = CommandHistory(parent=self)
@@ -78,18 +138,30 @@ class ImageEditorDialog(QDialog):
         self._crop_tool = None
         self._rect_tool = None
 
-        # 濾鏡防抖計時器
-        self._filter_timer = QTimer(self)
-        self._filter_timer.setSingleShot(True)
-        self._filter_timer.setInterval(100)  # 100ms 延遲
-        self._filter_timer.timeout.connect(self._apply_filter_values)
+        # 浮動動作列於第一次使用時才建立
+        self._crop_actions_widget: Optional[FloatingBar] = None
+        self._annotation_actions_widget: Optional[FloatingBar] = None
+        # 上次處理選取變更時的標註 (剪裁模式下重設為 None)
+        self._last_selected_annotation: Optional[AnnotationRect] = None
 
         # 設定對話框
         self._setup_dialog()
         self._setup_ui()
+        # 畫布的場景在其生命週期內不變，快取以免事件處理時重複查詢
+        self._scene = self._canvas.scene()
+
+        # 工具名稱 -> 按鈕 / 啟用方法
+        self._tool_buttons = (
+            ("select", self._btn_select),
+            ("crop", self._btn_crop),
+            ("rect", self._btn_rect),
+        )
+        self._tool_activators = {
+            "select": self._activate_select,
+            "crop": self._activate_crop,
+            "rect": self._activate_rect,
+        }
 
-        self._create_crop_actions_bar()
-        self._create_annotation_actions_bar()  # 新增
         self._setup_shortcuts()
         self._connect_signals()
 
@@ -102,7 +174,7 @@ class ImageEditorDialog(QDialog):
             line_width=self._current_line_width,
             rotation=self._current_rotation,
         )
-        self._rect_tool.drawing_finished.connect(lambda: self._select_tool("select"))
+        self._rect_tool.drawing_finished.connect(self._switch_to_select)
 
         # 載入圖片
         self._load_image()
@@ -123,12 +195,13 @@ class ImageEditorDialog(QDialog):
         layout.setContentsMargins(5, 5, 5, 5)
         layout.setSpacing(5)
 
+        # 畫布 (先建立，工具列的縮放按鈕直接連接畫布方法)
+        self._canvas = ImageCanvas()
+
         # 工具列
         self._toolbar = self._create_toolbar()
         layout.addWidget(self._toolbar)
 
-        # 畫布
-        self._canvas = ImageCanvas()
         layout.addWidget(self._canvas, 1)
 
         # 底部按鈕
@@ -139,7 +212,7 @@ class ImageEditorDialog(QDialog):
         """建立工具列"""
         toolbar = QToolBar()
         toolbar.setMovable(False)
-        toolbar.setStyleSheet("QToolBar { spacing: 5px; }")
+        toolbar.setStyleSheet(_TOOLBAR_QSS)
 
         # 選擇工具
         self._btn_select = QToolButton()
@@ -197,24 +270,24 @@ class ImageEditorDialog(QDialog):
         self._btn_zoom_in = QToolButton()
         self._btn_zoom_in.setText("🔍+")
         self._btn_zoom_in.setToolTip("放大")
-        self._btn_zoom_in.clicked.connect(lambda: self._canvas.zoom_in())
+        self._btn_zoom_in.clicked.connect(self._canvas.zoom_in)
         toolbar.addWidget(self._btn_zoom_in)
 
         self._btn_zoom_out = QToolButton()
         self._btn_zoom_out.setText("🔍-")
         self._btn_zoom_out.setToolTip("縮小")
-        self._btn_zoom_out.clicked.connect(lambda: self._canvas.zoom_out())
+        self._btn_zoom_out.clicked.connect(self._canvas.zoom_out)
         toolbar.addWidget(self._btn_zoom_out)
 
         self._btn_fit = QToolButton()
         self._btn_fit.setText("📐 適應")
         self._btn_fit.setToolTip("適應視窗")
-        self._btn_fit.clicked.connect(lambda: self._canvas.fit_in_view())
+        self._btn_fit.clicked.connect(self._canvas.fit_in_view)
         toolbar.addWidget(self._btn_fit)
 
         # 縮放比例顯示
         self._lbl_zoom = QLabel("100%")
-        self._lbl_zoom.setStyleSheet("padding: 0 10px;")
+        self._lbl_zoom.setStyleSheet(_ZOOM_LABEL_QSS)
         toolbar.addWidget(self._lbl_zoom)
 
         toolbar.addSeparator()
@@ -228,6 +301,8 @@ class ImageEditorDialog(QDialog):
         self._slider_brightness.setValue(0)
         self._slider_brightness.setFixedWidth(100)
         self._slider_brightness.valueChanged.connect(self._on_adjustment_changed)
+        self._slider_brightness.sliderPressed.connect(self._on_slider_pressed)
+        self._slider_brightness.sliderReleased.connect(self._on_slider_released)
         toolbar.addWidget(self._slider_brightness)
 
         self._lbl_brightness = QLabel("0")
@@ -244,6 +319,8 @@ class ImageEditorDialog(QDialog):
         self._slider_contrast.setValue(0)
         self._slider_contrast.setFixedWidth(100)
         self._slider_contrast.valueChanged.connect(self._on_adjustment_changed)
+        self._slider_contrast.sliderPressed.connect(self._on_slider_pressed)
+        self._slider_contrast.sliderReleased.connect(self._on_slider_released)
         toolbar.addWidget(self._slider_contrast)
 
         self._lbl_contrast = QLabel("0")
@@ -273,9 +350,7 @@ class ImageEditorDialog(QDialog):
 
         # 儲存
         self._btn_save = QPushButton("儲存")
-        self._btn_save.setStyleSheet(
-            "background-color: #4CAF50; color: white; font-weight: bold; padding: 8px 30px;"
-        )
+        self._btn_save.setStyleSheet(_SAVE_BTN_QSS)
         self._btn_save.clicked.connect(self._on_save)
         layout.addWidget(self._btn_save)
 
@@ -288,9 +363,9 @@ class ImageEditorDialog(QDialog):
         # 重做
         QShortcut(QKeySequence.Redo, self, self._on_redo)
         # 工具切換
-        QShortcut(QKeySequence("V"), self, lambda: self._select_tool("select"))
-        QShortcut(QKeySequence("C"), self, lambda: self._select_tool("crop"))
-        QShortcut(QKeySequence("R"), self, lambda: self._select_tool("rect"))
+        QShortcut(QKeySequence(Qt.Key_V), self, self._switch_to_select)
+        QShortcut(QKeySequence(Qt.Key_C), self, self._switch_to_crop)
+        QShortcut(QKeySequence(Qt.Key_R), self, self._switch_to_rect)
 
     def _connect_signals(self):
         """連接信號"""
@@ -302,15 +377,15 @@ class ImageEditorDialog(QDialog):
         self._canvas.zoom_changed.connect(self._on_zoom_changed)
 
         # 工具按鈕
-        self._btn_select.clicked.connect(lambda: self._select_tool("select"))
-        self._btn_crop.clicked.connect(lambda: self._select_tool("crop"))
-        self._btn_rect.clicked.connect(lambda: self._select_tool("rect"))
-
-        # 場景選取
-        if self._canvas.scene():
-            self._canvas.scene().selectionChanged.connect(
-                self._on_editor_selection_changed
-            )
+        self._btn_select.clicked.connect(self._switch_to_select)
+        self._btn_crop.clicked.connect(self._switch_to_crop)
+        self._btn_rect.clicked.connect(self._switch_to_rect)
+
+        # 場景選取 (排入事件佇列，框選拖曳時同一輪事件內的多次變更於之後才處理，
+        # 處理時讀取的是最終選取狀態，重複的呼叫會被相同標註的判斷略過)
+        self._scene.selectionChanged.connect(
+            self._on_editor_selection_changed, Qt.QueuedConnection
+        )
 
     def _load_image(self):
         """載入圖片"""
@@ -327,38 +402,55 @@ class ImageEditorDialog(QDialog):
     def _select_tool(self, tool_name: str):
         """選擇工具"""
         # 清除選取以隱藏標註設定列
-        if self._canvas.scene():
-            self._canvas.scene().clearSelection()
+        self._scene.clearSelection()
 
         # 更新按鈕狀態
-        self._btn_select.setChecked(tool_name == "select")
-        self._btn_crop.setChecked(tool_name == "crop")
-        self._btn_rect.setChecked(tool_name == "rect")
-
-        # 控制浮動動作列
-        if hasattr(self, "_crop_actions_widget"):
-            if tool_name == "crop":
-                self._crop_actions_widget.show()
-                self._update_crop_actions_pos()
-                self._crop_actions_widget.raise_()
-            else:
-                self._crop_actions_widget.hide()
+        for name, btn in self._tool_buttons:
+            btn.setChecked(name == tool_name)
+
+        # 離開剪裁工具時隱藏浮動動作列
+        if tool_name != "crop" and self._crop_actions_widget is not None:
+            self._crop_actions_widget.hide()
 
         # 設定畫布工具
-        if tool_name == "select":
-            self._canvas.set_tool(None)
-        elif tool_name == "crop":
-            # 1. 啟動剪裁會話 (還原全圖)
-            current_crop = self._canvas.start_crop_session()
+        self._tool_activators[tool_name]()
+
+    def _activate_select(self):
+        """啟用選擇模式 (畫布不掛工具)"""
+        self._canvas.set_tool(None)
+
+    def _activate_crop(self):
+        """啟用剪裁工具"""
+        if self._crop_actions_widget is None:
+            self._create_crop_actions_bar()
+        self._crop_actions_widget.show()
+        self._update_crop_actions_pos()
+        self._crop_actions_widget.raise_()
+
+        # 1. 啟動剪裁會話 (還原全圖)
+        current_crop = self._canvas.start_crop_session()
+
+        # 2. 設定工具
+        self._canvas.set_tool(self._crop_tool)
+
+        # 3. 設定工具初始範圍
+        self._crop_tool.set_crop_rect(current_crop)
 
-            # 2. 設定工具
-            self._canvas.set_tool(self._crop_tool)
+    def _activate_rect(self):
+        """啟用框選工具"""
+        self._canvas.set_tool(self._rect_tool)
 
-            # 3. 設定工具初始範圍
-            self._crop_tool.set_crop_rect(current_crop)
+    def _switch_to_select(self):
+        """切換至選擇工具"""
+        self._select_tool("select")
+
+    def _switch_to_crop(self):
+        """切換至剪裁工具"""
+        self._select_tool("crop")
 
-        elif tool_name == "rect":
-            self._canvas.set_tool(self._rect_tool)
+    def _switch_to_rect(self):
+        """切換至框選工具"""
+        self._select_tool("rect")
 
     def _confirm_crop(self):
         """確認剪裁"""
@@ -386,11 +478,10 @@ class ImageEditorDialog(QDialog):
         self._lbl_zoom.setText(f"{int(factor * 100)}%")
 
         # 更新所有標註的控制點位置（因為旋轉控制點距離需要根據縮放調整）
-        scene = self._canvas.scene()
-        if scene:
-            for item in scene.items():
-                if isinstance(item, AnnotationRect):
-                    item._update_handle_positions()
+        # 只走訪畫布記錄的標註，不必掃描整個場景
+        for item in self._canvas.annotation_items:
+            if isinstance(item, AnnotationRect):
+                item._update_handle_positions()
 
     def _on_pick_color(self):
         """選擇顏色"""
@@ -404,9 +495,7 @@ class ImageEditorDialog(QDialog):
 
     def _update_color_button(self):
         """更新顏色按鈕"""
-        self._btn_color.setStyleSheet(
-            f"background-color: {self._current_color.name()}; border: 1px solid #ccc;"
-        )
+        self._btn_color.setStyleSheet(_COLOR_BTN_TEMPLATE % self._current_color.name())
 
     def _on_width_changed(self, value: int):
         """線寬變更"""
@@ -417,7 +506,7 @@ class ImageEditorDialog(QDialog):
             self._rect_tool.set_line_width(value)
 
     def _on_adjustment_changed(self):
-        """濾鏡調整變更 (使用防抖機制)"""
+        """濾鏡調整變更 (重繪由畫布的計時器合併，這裡直接傳入數值)"""
         brightness = self._slider_brightness.value()
         contrast = self._slider_contrast.value()
 
@@ -425,19 +514,38 @@ class ImageEditorDialog(QDialog):
         self._lbl_brightness.setText(str(brightness))
         self._lbl_contrast.setText(str(contrast))
 
-        # 重設計時器 (防抖)
-        self._filter_timer.start()
+        self._apply_filter_values()
 
     def _apply_filter_values(self):
-        """實際套用濾鏡值 (由計時器觸發)"""
+        """將滑桿數值套用到畫布"""
         self._canvas.set_brightness(self._slider_brightness.value())
         self._canvas.set_contrast(self._slider_contrast.value())
 
+    def _on_slider_pressed(self):
+        """開始拖動濾鏡滑桿：以低解析度預覽"""
+        self._canvas.begin_preview()
+
+    def _on_slider_released(self):
+        """放開濾鏡滑桿：套用最後數值並以全解析度重繪"""
+        self._apply_filter_values()
+        self._canvas.end_preview()
+
     def _on_reset_adjustments(self):
         """重設調整"""
-        # 這會觸發 valueChanged -> _on_adjustment_changed
-        self._slider_brightness.setValue(0)
-        self._slider_contrast.setValue(0)
+        if self._slider_brightness.value() == 0 and self._slider_contrast.value() == 0:
+            return
+
+        # 暫停信號，避免兩次 valueChanged 各自套用，改為最後直接套用一次
+        for slider, label in (
+            (self._slider_brightness, self._lbl_brightness),
+            (self._slider_contrast, self._lbl_contrast),
+        ):
+            slider.blockSignals(True)
+            slider.setValue(0)
+            slider.blockSignals(False)
+            label.setText("0")
+
+        self._apply_filter_values()
 
     def _on_reset_all(self):
         """重設全圖"""
@@ -470,77 +578,71 @@ class ImageEditorDialog(QDialog):
             if self._pm:
                 self._backup_original()
 
-            # 渲染並儲存
+            # 渲染需存取場景，在 UI 執行緒完成；編碼與寫檔交給背景執行緒
             image = self._canvas.render_to_image()
             if not image.isNull():
                 save_path = self._output_path if self._output_path else self._image_path
-                image.save(save_path)
-                self.image_saved.emit(save_path)
-                self.accept()
+                self._btn_save.setEnabled(False)
+                self._saver = _ImageSaver(image, save_path)
+                self._saver.signals.finished.connect(self._on_save_finished)
+                QThreadPool.globalInstance().start(self._saver)
             else:
                 QMessageBox.warning(self, "錯誤", "無法儲存圖片")
         except Exception as e:
             QMessageBox.warning(self, "錯誤", f"儲存失敗: {e}")
 
+    def _on_save_finished(self, save_path: str, success: bool):
+        """背景儲存完成 (回到 UI 執行緒)"""
+        self._saver = None
+        if success:
+            self.image_saved.emit(save_path)
+            self.accept()
+        else:
+            self._btn_save.setEnabled(True)
+            QMessageBox.warning(self, "錯誤", f"儲存失敗: {save_path}")
+
     def _backup_original(self):
         """備份原圖到檔案所在資料夾的 rawdatas 子資料夾"""
+        if self._backup_done:
+            return
         if not self._pm or not self._pm.current_project_path:
             return
 
-        # 取得圖片所在資料夾 (測項資料夾)
-        image_dir = os.path.dirname(self._image_path)
+        original = self._canvas.get_original_pixmap()
+        if not original or original.isNull():
+            return
 
-        # 在測項資料夾內建立 rawdatas
+        # 取得圖片所在資料夾 (測項資料夾)，在其內建立 rawdatas
+        image_dir = os.path.dirname(self._image_path)
         rawdatas_dir = os.path.join(image_dir, "rawdatas")
-        os.makedirs(rawdatas_dir, exist_ok=True)
+        backup_path = os.path.join(rawdatas_dir, os.path.basename(self._image_path))
 
-        # 檢查是否已備份
-        filename = os.path.basename(self._image_path)
-        backup_path = os.path.join(rawdatas_dir, filename)
+        # QPixmap 只能在 UI 執行緒使用，先轉為 QImage 再交給背景執行緒寫檔
+        QThreadPool.globalInstance().start(
+            partial(self._write_backup, original.toImage(), rawdatas_dir, backup_path)
+        )
+        self._backup_done = True
 
+    @staticmethod
+    def _write_backup(image: QImage, rawdatas_dir: str, backup_path: str):
+        """寫入原圖備份 (背景執行緒，已存在則不覆蓋)"""
+        os.makedirs(rawdatas_dir, exist_ok=True)
         if not os.path.exists(backup_path):
-            # 複製原圖
-            original = self._canvas.get_original_pixmap()
-            if original and not original.isNull():
-                original.save(backup_path)
+            image.save(backup_path)
 
     def _create_crop_actions_bar(self):
         """建立浮動剪裁動作列"""
-        self._crop_actions_widget = QFrame(self._canvas)
-        self._crop_actions_widget.setStyleSheet(
-            """
-            QFrame {
-                background-color: white;
-                border-radius: 20px;
-                border: 1px solid #ddd;
-            }
-            QPushButton {
-                border-radius: 15px;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 5px;
-            }
-            QPushButton:hover {
-                background-color: #f0f0f0;
-            }
-            """
-        )
-
-        # 陰影效果
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 60))
-        shadow.setOffset(0, 5)
-        self._crop_actions_widget.setGraphicsEffect(shadow)
+        self._crop_actions_widget = FloatingBar(self._canvas)
+        self._crop_actions_widget.setStyleSheet(_CROP_BAR_QSS)
 
         layout = QHBoxLayout(self._crop_actions_widget)
-        layout.setContentsMargins(10, 5, 10, 5)
+        self._crop_actions_widget.set_content_margins(layout, 10, 5, 10, 5)
         layout.setSpacing(15)
 
         # 確認按鈕
         btn_confirm = QPushButton("✓")
         btn_confirm.setFixedSize(30, 30)
-        btn_confirm.setStyleSheet("color: #4CAF50; border: 2px solid #4CAF50; font-weight: bold; font-size: 16px;")
+        btn_confirm.setObjectName("confirm")
         btn_confirm.setToolTip("確認剪裁")
         btn_confirm.setCursor(Qt.PointingHandCursor)
         btn_confirm.clicked.connect(self._confirm_crop)
@@ -549,7 +651,7 @@ class ImageEditorDialog(QDialog):
         # 取消按鈕
         btn_cancel = QPushButton("✕")
         btn_cancel.setFixedSize(30, 30)
-        btn_cancel.setStyleSheet("color: #F44336; border: 2px solid #F44336; font-weight: bold; font-size: 16px;")
+        btn_cancel.setObjectName("cancel")
         btn_cancel.setToolTip("取消剪裁")
         btn_cancel.setCursor(Qt.PointingHandCursor)
         btn_cancel.clicked.connect(self._cancel_crop)
@@ -561,7 +663,7 @@ class ImageEditorDialog(QDialog):
     def _update_crop_actions_pos(self):
         """更新動作列位置 (置中於上方)"""
         if (
-            hasattr(self, "_crop_actions_widget")
+            self._crop_actions_widget is not None
             and self._crop_actions_widget.isVisible()
         ):
             # 寬度
@@ -570,7 +672,7 @@ class ImageEditorDialog(QDialog):
             canvas_w = self._canvas.width()
 
             x = (canvas_w - w) // 2
-            y = 20  # 距離上方 20px
+            y = 20 - FloatingBar.MARGIN  # 面板距離上方 20px (扣除陰影空間)
 
             self._crop_actions_widget.move(x, y)
             self._crop_actions_widget.raise_()
@@ -590,39 +692,18 @@ class ImageEditorDialog(QDialog):
 
     def _create_annotation_actions_bar(self):
         """建立浮動標註設定列 (顏色/線寬)"""
-        self._annotation_actions_widget = QFrame(self._canvas)
-        self._annotation_actions_widget.setStyleSheet(
-            """
-            QFrame {
-                background-color: white;
-                border-radius: 20px;
-                border: 1px solid #ddd;
-            }
-            QLabel {
-                font-weight: bold;
-                color: #333;
-            }
-            """
-        )
-
-        # 陰影效果
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 60))
-        shadow.setOffset(0, 5)
-        self._annotation_actions_widget.setGraphicsEffect(shadow)
+        self._annotation_actions_widget = FloatingBar(self._canvas)
+        self._annotation_actions_widget.setStyleSheet(_ANNOT_BAR_QSS)
 
         layout = QHBoxLayout(self._annotation_actions_widget)
-        layout.setContentsMargins(15, 8, 15, 8)
+        self._annotation_actions_widget.set_content_margins(layout, 15, 8, 15, 8)
         layout.setSpacing(15)
 
         # 顏色
         layout.addWidget(QLabel("顏色:"))
         self._btn_color = QPushButton()
         self._btn_color.setFixedSize(30, 30)
-        self._btn_color.setStyleSheet(
-            f"background-color: {self._current_color.name()}; border: 1px solid #ccc; border-radius: 15px;"
-        )
+        self._update_color_button()
         self._btn_color.setToolTip("更改顏色")
         self._btn_color.clicked.connect(self._on_pick_color)
         layout.addWidget(self._btn_color)
@@ -653,7 +734,7 @@ class ImageEditorDialog(QDialog):
     def _update_annotation_actions_pos(self):
         """更新標註設定列位置 (置中於上方)"""
         if (
-            hasattr(self, "_annotation_actions_widget")
+            self._annotation_actions_widget is not None
             and self._annotation_actions_widget.isVisible()
         ):
             w = self._annotation_actions_widget.width()
@@ -661,49 +742,54 @@ class ImageEditorDialog(QDialog):
             canvas_w = self._canvas.width()
 
             x = (canvas_w - w) // 2
-            y = 20  # 距離上方 20px
+            y = 20 - FloatingBar.MARGIN  # 面板距離上方 20px (扣除陰影空間)
 
             self._annotation_actions_widget.move(x, y)
             self._annotation_actions_widget.raise_()
 
     def _on_editor_selection_changed(self):
         """當編輯器內的選取項目改變時"""
-        if not self._annotation_actions_widget:
+        # 剪裁模式下不顯示標註設定列，不需走訪選取項目
+        if self._btn_crop.isChecked():
+            self._last_selected_annotation = None
+            if self._annotation_actions_widget is not None:
+                self._annotation_actions_widget.hide()
+            return
+
+        # 取第一個選取的 AnnotationRect
+        annotation = next(
+            (i for i in self._scene.selectedItems() if isinstance(i, AnnotationRect)),
+            None,
+        )
+
+        # 與上次處理的標註相同 (例如拖曳或框選時重複發出信號) 則不需重設 UI
+        if annotation is self._last_selected_annotation:
             return
+        self._last_selected_annotation = annotation
 
-        scene = self._canvas.scene()
-        if not scene:
+        if annotation is None:
+            if self._annotation_actions_widget is not None:
+                self._annotation_actions_widget.hide()
             return
 
-        selected_items = scene.selectedItems()
+        # 更新 UI 顯示目前選取項目的屬性
+        self._current_color = annotation.annotation_color
+        self._current_line_width = annotation.line_width
 
-        # 檢查是否有選取 AnnotationRect
-        has_annotation = False
-        for item in selected_items:
-            if isinstance(item, AnnotationRect):
-                has_annotation = True
-                # 更新 UI 顯示目前選取項目的屬性 (取第一個)
-                self._current_color = item.annotation_color
-                self._current_line_width = item.line_width
-
-                # 更新控制項
-                self._update_color_button()
-                # 暫時斷開信號以避免迴圈更新
-                self._slider_width.blockSignals(True)
-                self._slider_width.setValue(self._current_line_width)
-                self._slider_width.blockSignals(False)
-                self._lbl_width.setText(f"{self._current_line_width}px")
-                break
-
-        # 只有在非裁切模式下才顯示
-        is_cropping = self._btn_crop.isChecked()
-
-        if has_annotation and not is_cropping:
-            self._annotation_actions_widget.show()
-            self._annotation_actions_widget.adjustSize()
-            self._update_annotation_actions_pos()
+        if self._annotation_actions_widget is None:
+            # 第一次選取標註時才建立設定列 (直接採用目前數值)
+            self._create_annotation_actions_bar()
         else:
-            self._annotation_actions_widget.hide()
+            self._update_color_button()
+            # 暫時斷開信號以避免迴圈更新
+            self._slider_width.blockSignals(True)
+            self._slider_width.setValue(self._current_line_width)
+            self._slider_width.blockSignals(False)
+            self._lbl_width.setText(f"{self._current_line_width}px")
+
+        self._annotation_actions_widget.show()
+        self._annotation_actions_widget.adjustSize()
+        self._update_annotation_actions_pos()
 
     # ===== 公開屬性 =====
 
@@ -0,0 +1,108 @@
+"""
+浮動動作列
+畫布上方的圓角白色工具列，陰影預先繪製並快取
+"""
+
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import (
+    QPixmap,
+    QPixmapCache,
+    QPainter,
+    QPainterPath,
+    QColor,
+    QPen,
+    QBrush,
+)
+from PySide6.QtWidgets import QFrame, QGraphicsScene, QGraphicsDropShadowEffect
+
+
+class FloatingBar(QFrame):
+    """
+    浮動動作列
+
+    外框與陰影只以 QGraphicsDropShadowEffect 離屏渲染一張最小尺寸的圖，
+    放入 QPixmapCache 後以九宮格方式貼出任意尺寸，重繪時不做模糊運算。
+    """
+
+    # 陰影參數
+    SHADOW_BLUR = 20
+    SHADOW_COLOR = QColor(0, 0, 0, 60)
+    SHADOW_OFFSET = 5
+
+    # 外框參數
+    BORDER_RADIUS = 20
+    BORDER_COLOR = QColor("#ddd")
+
+    # 陰影佔用的外圍空間 (內容需向內縮排)
+    MARGIN = SHADOW_BLUR // 2 + SHADOW_OFFSET
+
+    # 九宮格角落大小 (陰影 + 圓角)
+    CORNER = MARGIN + BORDER_RADIUS
+
+    _TILE_KEY = "image_editor_floating_bar_tile"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+
+    def set_content_margins(self, layout, left: int, top: int, right: int, bottom: int):
+        """設定內容邊距 (自動加上陰影空間)"""
+        m = self.MARGIN
+        layout.setContentsMargins(left + m, top + m, right + m, bottom + m)
+
+    def paintEvent(self, event):
+        tile = self._get_tile()
+        # 九宮格繪製：四角原樣貼上，四邊與中央拉伸，任何尺寸共用同一張圖
+        c = self.CORNER
+        w, h = self.width(), self.height()
+        mid = tile.width() - 2 * c
+        # (目標位置, 目標長度, 來源位置, 來源長度)
+        cols = ((0, c, 0, c), (c, w - 2 * c, c, mid), (w - c, c, c + mid, c))
+        rows = ((0, c, 0, c), (c, h - 2 * c, c, mid), (h - c, c, c + mid, c))
+
+        painter = QPainter(self)
+        for dy, dh, sy, sh in rows:
+            for dx, dw, sx, sw in cols:
+                painter.drawPixmap(dx, dy, dw, dh, tile, sx, sy, sw, sh)
+        painter.end()
+
+    @classmethod
+    def _get_tile(cls) -> QPixmap:
+        """取得面板九宮格來源圖 (整個程式只模糊運算一次)"""
+        pixmap = QPixmapCache.find(cls._TILE_KEY)
+        if pixmap is None or pixmap.isNull():
+            pixmap = cls._render_tile()
+            QPixmapCache.insert(cls._TILE_KEY, pixmap)
+        return pixmap
+
+    @classmethod
+    def _render_tile(cls) -> QPixmap:
+        """離屏繪製最小尺寸的面板與陰影"""
+        c = cls.CORNER
+        size = 2 * c + 1
+        m = cls.MARGIN
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.transparent)
+
+        path = QPainterPath()
+        path.addRoundedRect(
+            QRectF(m + 0.5, m + 0.5, size - 2 * m - 1, size - 2 * m - 1),
+            cls.BORDER_RADIUS,
+            cls.BORDER_RADIUS,
+        )
+
+        scene = QGraphicsScene()
+        scene.setSceneRect(QRectF(0, 0, size, size))
+        item = scene.addPath(path, QPen(cls.BORDER_COLOR), QBrush(Qt.white))
+
+        shadow = QGraphicsDropShadowEffect()
+        shadow.setBlurRadius(cls.SHADOW_BLUR)
+        shadow.setColor(cls.SHADOW_COLOR)
+        shadow.setOffset(0, cls.SHADOW_OFFSET)
+        item.setGraphicsEffect(shadow)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        scene.render(painter)
+        painter.end()
+        return pixmap
@@ -5,8 +5,6 @@
 import sys
 import os
 
-# 確保可以匯入 src 模組
-current_dir = os.path.dirname(os.path.abspath(__file__))
 # 確保可以匯入 src 模組
 current_dir = os.path.dirname(os.path.abspath(__file__))
 # Current: .../src/gui/widgets/image_editor
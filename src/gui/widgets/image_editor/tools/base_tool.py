@@ -3,10 +3,9 @@
 使用 Strategy Pattern 設計，所有工具繼承此類
 """
 
-from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Optional
 
-from PySide6.QtCore import QObject, Signal, QPointF
+from PySide6.QtCore import QObject, Signal, QPointF, QTimer
 from PySide6.QtGui import QMouseEvent
 from PySide6.QtWidgets import QGraphicsScene
 
@@ -18,13 +17,17 @@ class BaseTool(QObject):
     """
     工具基類
 
-    所有繪圖工具必須繼承此類並實作滑鼠事件處理方法。
+    所有繪圖工具必須繼承此類並實作滑鼠事件處理方法 (未實作時呼叫會拋出
+    NotImplementedError)。
     這是一個 Strategy Pattern 的實現。
     """
 
     # 繪圖完成信號（用於切換回選擇模式）
     drawing_finished = Signal()
 
+    # 拖曳更新的合併間隔 (約一個畫面)
+    MOVE_INTERVAL = 16
+
     def __init__(self, canvas: "ImageCanvas"):
         """
         初始化工具
@@ -37,6 +40,13 @@ class BaseTool(QObject):
         self._is_active = False
         self._start_pos: Optional[QPointF] = None
 
+        # 拖曳中的滑鼠移動先記錄最新位置，每個畫面只套用一次
+        self._pending_pos: Optional[QPointF] = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(self.MOVE_INTERVAL)
+        self._move_timer.timeout.connect(self._flush_move)
+
     @property
     def canvas(self) -> "ImageCanvas":
         """取得畫布實例"""
@@ -61,6 +71,8 @@ class BaseTool(QObject):
         """停用工具"""
         self._is_active = False
         self._start_pos = None
+        self._move_timer.stop()
+        self._pending_pos = None
         self.on_deactivate()
 
     def on_activate(self):
@@ -71,7 +83,6 @@ class BaseTool(QObject):
         """停用時的額外處理（子類可覆寫）"""
         pass
 
-    @abstractmethod
     def on_mouse_press(self, event: QMouseEvent, scene_pos: QPointF):
         """
         滑鼠按下事件
@@ -80,9 +91,8 @@ class BaseTool(QObject):
             event: 滑鼠事件
             scene_pos: 場景座標
         """
-        pass
+        raise NotImplementedError(self.get_name())
 
-    @abstractmethod
     def on_mouse_move(self, event: QMouseEvent, scene_pos: QPointF):
         """
         滑鼠移動事件
@@ -91,9 +101,8 @@ class BaseTool(QObject):
             event: 滑鼠事件
             scene_pos: 場景座標
         """
-        pass
+        raise NotImplementedError(self.get_name())
 
-    @abstractmethod
     def on_mouse_release(self, event: QMouseEvent, scene_pos: QPointF):
         """
         滑鼠釋放事件
@@ -102,6 +111,30 @@ class BaseTool(QObject):
             event: 滑鼠事件
             scene_pos: 場景座標
         """
+        raise NotImplementedError(self.get_name())
+
+    def _schedule_move(self, scene_pos: QPointF):
+        """記錄拖曳位置並排程套用 (同一畫面內的多次移動只套用最後一次)"""
+        self._pending_pos = scene_pos
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+
+    def _flush_move(self):
+        """立即套用尚未處理的拖曳位置 (放開滑鼠前需先呼叫)"""
+        self._move_timer.stop()
+        if self._pending_pos is None:
+            return
+        scene_pos = self._pending_pos
+        self._pending_pos = None
+        self._apply_move(scene_pos)
+
+    def _apply_move(self, scene_pos: QPointF):
+        """
+        套用合併後的拖曳位置（使用 _schedule_move 的子類覆寫）
+
+        Args:
+            scene_pos: 場景座標
+        """
         pass
 
     def get_name(self) -> str:
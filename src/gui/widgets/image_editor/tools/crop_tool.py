@@ -5,9 +5,12 @@
 from typing import Optional, Dict
 
 from PySide6.QtCore import Qt, QPointF, QRectF
-from PySide6.QtGui import QMouseEvent, QPen, QColor, QBrush, QCursor
+from PySide6.QtGui import QMouseEvent, QPen, QColor, QBrush, QCursor, QPainterPath
 from PySide6.QtWidgets import (
     QGraphicsRectItem,
+    QGraphicsEllipseItem,
+    QGraphicsPathItem,
+    QGraphicsItemGroup,
     QGraphicsItem,
 )
 
@@ -27,30 +30,64 @@ class CropTool(BaseTool):
 
     HANDLE_SIZE = 10  # 控制點大小
     MIN_SIZE = 20  # 最小選取尺寸
+    OVERLAY_COLOR = QColor(0, 0, 0, 120)  # 選取範圍外的遮罩顏色
+    RECT_EPSILON = 0.5  # 選取範圍變化量低於此值視為未變 (場景座標)
+
+    # 選取框畫筆 (共用同一物件)；寬度 0 即 cosmetic 畫筆，縮放時固定 1 像素
+    _SELECTION_PEN = QPen(QBrush(Qt.white), 0, Qt.DashLine)
+
+    # 8 個控制點的方位
+    _HANDLE_POSITIONS = ("tl", "t", "tr", "r", "br", "b", "bl", "l")
+
+    # 控制點名稱 -> 游標
+    _CURSOR_MAP = {
+        "tl": Qt.SizeFDiagCursor,
+        "br": Qt.SizeFDiagCursor,
+        "tr": Qt.SizeBDiagCursor,
+        "bl": Qt.SizeBDiagCursor,
+        "t": Qt.SizeVerCursor,
+        "b": Qt.SizeVerCursor,
+        "l": Qt.SizeHorCursor,
+        "r": Qt.SizeHorCursor,
+    }
+
+    # (水平位置, 垂直位置) -> 控制點名稱，中央 ("c", "c") 沒有控制點
+    _HANDLE_AT = {
+        ("l", "t"): "tl",
+        ("c", "t"): "t",
+        ("r", "t"): "tr",
+        ("r", "c"): "r",
+        ("r", "b"): "br",
+        ("c", "b"): "b",
+        ("l", "b"): "bl",
+        ("l", "c"): "l",
+    }
 
     def __init__(self, canvas):
         super().__init__(canvas)
         self._selection_rect: Optional[QGraphicsRectItem] = None
-        self._overlay_items = []
+        self._overlay_item: Optional[QGraphicsPathItem] = None
         self._handles: Dict[str, QGraphicsRectItem] = {}
+        # 控制點的共同父項目 (位於選取框左上角，平移時只需移動群組)
+        self._handle_group: Optional[QGraphicsItemGroup] = None
 
         # 狀態
         self._state = "idle"  # idle, creating, moving, resizing
         self._active_handle = None
         self._last_pos = None
 
+        # 圖片範圍 (啟用或設定剪裁範圍時更新，拖曳時直接使用)
+        self._image_rect: Optional[QRectF] = None
+
     def on_activate(self):
         """啟用時設定"""
         self._canvas.viewport().setCursor(Qt.ArrowCursor)
 
         # 預設選取整張圖片
-        pixmap = self._canvas.get_pixmap()
-        if pixmap:
-            rect = QRectF(pixmap.rect())
-            # 留一點邊距 (例如 90% 大小) 以便觀察
-            # rect = rect.adjusted(...)
+        self._refresh_image_rect()
+        if self._image_rect is not None:
             # 這裡直接選全圖比較直觀
-            self._create_selection(rect)
+            self._create_selection(self._image_rect)
 
     def on_deactivate(self):
         """停用時清除"""
@@ -59,8 +96,14 @@ class CropTool(BaseTool):
 
     def set_crop_rect(self, rect: QRectF):
         """設定剪裁範圍"""
+        self._refresh_image_rect()
         self._create_selection(rect)
 
+    def _refresh_image_rect(self):
+        """重新取得目前圖片範圍"""
+        pixmap = self._canvas.get_pixmap()
+        self._image_rect = QRectF(pixmap.rect()) if pixmap else None
+
     def on_mouse_press(self, event: QMouseEvent, scene_pos: QPointF):
         """滑鼠按下"""
         if not self._canvas.get_pixmap():
@@ -98,6 +141,10 @@ class CropTool(BaseTool):
             self._update_cursor(scene_pos)
             return
 
+        self._schedule_move(scene_pos)
+
+    def _apply_move(self, scene_pos: QPointF):
+        """套用拖曳 (每個畫面最多一次)"""
         if self._state == "creating":
             rect = QRectF(self._start_pos, scene_pos).normalized()
             self._update_selection_rect(rect)
@@ -105,8 +152,7 @@ class CropTool(BaseTool):
         elif self._state == "moving":
             if self._selection_rect and self._last_pos:
                 delta = scene_pos - self._last_pos
-                rect = self._selection_rect.rect().translated(delta)
-                self._update_selection_rect(rect)
+                self._translate_selection(delta.x(), delta.y())
                 self._last_pos = scene_pos
 
         elif self._state == "resizing":
@@ -118,6 +164,8 @@ class CropTool(BaseTool):
 
     def on_mouse_release(self, event: QMouseEvent, scene_pos: QPointF):
         """滑鼠釋放"""
+        self._flush_move()
+
         if self._state == "creating":
             # 檢查是否太小
             if self._selection_rect:
@@ -141,107 +189,153 @@ class CropTool(BaseTool):
         # 建立主矩形
         self._selection_rect = QGraphicsRectItem()
         # Windows 風格：白線 + 虛線邊框
-        self._selection_rect.setPen(QPen(Qt.white, 1, Qt.SolidLine))
+        self._selection_rect.setPen(self._SELECTION_PEN)
         self._selection_rect.setBrush(Qt.NoBrush)
         self.scene.addItem(self._selection_rect)
 
+        # 建立遮罩 (單一路徑項目，拖曳時只更新路徑)
+        self._overlay_item = QGraphicsPathItem()
+        self._overlay_item.setBrush(QBrush(self.OVERLAY_COLOR))
+        self._overlay_item.setPen(Qt.NoPen)
+        # 快取點陣結果 (setPath 時 Qt 會自動使快取失效)
+        self._overlay_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self.scene.addItem(self._overlay_item)
+
         # 建立控制點
         self._create_handles()
 
-        # 更新位置
-        self._update_selection_rect(rect)
+        # 更新位置 (新建項目必須完整套用一次)
+        self._update_selection_rect(rect, force=True)
 
     def _create_handles(self):
         """建立 8 個控制點"""
-        from PySide6.QtWidgets import QGraphicsEllipseItem
-
-        positions = ["tl", "t", "tr", "r", "br", "b", "bl", "l"]
         hs = self.HANDLE_SIZE
 
-        for pos in positions:
+        self._handle_group = QGraphicsItemGroup()
+        self._handle_group.setZValue(100)  # 確保在最上層
+        self.scene.addItem(self._handle_group)
+
+        for pos in self._HANDLE_POSITIONS:
             # 使用圓形控制點，與 rect_tool 一致
             item = QGraphicsEllipseItem(-hs / 2, -hs / 2, hs, hs)
             item.setBrush(QBrush(Qt.white))
             item.setPen(QPen(Qt.black, 1))
-            item.setZValue(100)  # 確保在最上層
             # 忽略縮放，保持固定畫面大小
             item.setFlag(QGraphicsItem.ItemIgnoresTransformations, True)
-            self.scene.addItem(item)
+            # 外觀固定，點陣化一次後直接貼圖
+            item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+            self._handle_group.addToGroup(item)
             self._handles[pos] = item
 
-    def _update_selection_rect(self, rect: QRectF):
-        """更新選取範圍與控制點"""
+    def _update_selection_rect(self, rect: QRectF, force: bool = False):
+        """更新選取範圍與控制點 (force=True 時不略過未變的範圍)"""
         if not self._selection_rect:
             return
 
         # 限制在圖片範圍內
-        pixmap = self._canvas.get_pixmap()
-        if pixmap:
-            image_rect = QRectF(0, 0, pixmap.width(), pixmap.height())
-            rect = rect.intersected(image_rect)
+        if self._image_rect is not None:
+            rect = rect.intersected(self._image_rect)
+
+        # 拖出圖片範圍時裁切結果常與上一幀相同，略過重設矩形、控制點與遮罩
+        last = self._selection_rect.rect()
+        if not force and (
+            abs(rect.x() - last.x())
+            + abs(rect.y() - last.y())
+            + abs(rect.width() - last.width())
+            + abs(rect.height() - last.height())
+            < self.RECT_EPSILON
+        ):
+            return
 
         self._selection_rect.setRect(rect)
         self._update_handle_positions(rect)
         self._update_overlay(rect)
 
+    def _translate_selection(self, dx: float, dy: float):
+        """平移選取範圍 (大小不變，控制點直接跟著位移)"""
+        if not self._selection_rect:
+            return
+
+        rect = self._selection_rect.rect()
+
+        # 限制在圖片範圍內：平移時保持大小，改為限制位移量
+        if self._image_rect is not None:
+            bounds = self._image_rect
+            dx = max(bounds.left() - rect.left(), min(dx, bounds.right() - rect.right()))
+            dy = max(bounds.top() - rect.top(), min(dy, bounds.bottom() - rect.bottom()))
+        if dx == 0 and dy == 0:
+            return
+
+        rect.translate(dx, dy)
+        self._selection_rect.setRect(rect)
+        if self._handle_group:
+            self._handle_group.moveBy(dx, dy)
+        # 遮罩外框 (圖片範圍) 固定不動，只有挖空的位置改變，需更新路徑
+        self._update_overlay(rect)
+
     def _update_handle_positions(self, rect: QRectF):
         """更新控制點位置"""
-        # 因為圓形控制點是以中心為原點定義，setPos 直接設定目標位置即可
-        coords = {
-            "tl": rect.topLeft(),
-            "t": QPointF(rect.center().x(), rect.top()),
-            "tr": rect.topRight(),
-            "r": QPointF(rect.right(), rect.center().y()),
-            "br": rect.bottomRight(),
-            "b": QPointF(rect.center().x(), rect.bottom()),
-            "bl": rect.bottomLeft(),
-            "l": QPointF(rect.left(), rect.center().y()),
-        }
-
-        for name, item in self._handles.items():
-            if name in coords:
-                item.setPos(coords[name])
+        if not self._handle_group:
+            return
+
+        # 群組放在選取框左上角，控制點以相對座標排列
+        # (圓形控制點以中心為原點定義，setPos 直接設定目標位置即可)
+        self._handle_group.setPos(rect.topLeft())
+        handles = self._handles
+        w, h = rect.width(), rect.height()
+        cx, cy = w / 2, h / 2
+        handles["tl"].setPos(0, 0)
+        handles["t"].setPos(cx, 0)
+        handles["tr"].setPos(w, 0)
+        handles["r"].setPos(w, cy)
+        handles["br"].setPos(w, h)
+        handles["b"].setPos(cx, h)
+        handles["bl"].setPos(0, h)
+        handles["l"].setPos(0, cy)
 
     def _update_cursor(self, scene_pos: QPointF):
         """根據位置更新游標"""
         handle = self._hit_test_handles(scene_pos)
         if handle:
-            cursors = {
-                "tl": Qt.SizeFDiagCursor,
-                "br": Qt.SizeFDiagCursor,
-                "tr": Qt.SizeBDiagCursor,
-                "bl": Qt.SizeBDiagCursor,
-                "t": Qt.SizeVerCursor,
-                "b": Qt.SizeVerCursor,
-                "l": Qt.SizeHorCursor,
-                "r": Qt.SizeHorCursor,
-            }
-            self._canvas.viewport().setCursor(cursors.get(handle, Qt.ArrowCursor))
+            self._canvas.viewport().setCursor(self._CURSOR_MAP[handle])
         elif self._selection_rect and self._selection_rect.contains(scene_pos):
             self._canvas.viewport().setCursor(Qt.SizeAllCursor)
         else:
             self._canvas.viewport().setCursor(Qt.CrossCursor)
 
     def _hit_test_handles(self, scene_pos: QPointF) -> Optional[str]:
-        """檢查是否碰到控制點"""
-        # 計算動態容差：控制點大小 + 基礎容差，並根據縮放調整
-        base_tolerance = self.HANDLE_SIZE / 2 + 5  # 螢幕像素
-        tolerance = base_tolerance
-
-        # 根據縮放因子調整容差（將螢幕像素轉換為場景座標）
-        views = self._canvas.scene().views() if self._canvas.scene() else []
-        if views:
-            zoom_factor = views[0].transform().m11()
-            if zoom_factor > 0:
-                tolerance = base_tolerance / zoom_factor
-
-        for name, item in self._handles.items():
-            # 使用距離檢測而非 contains，更可靠
-            handle_center = item.pos()
-            distance = (scene_pos - handle_center).manhattanLength()
-            if distance <= tolerance:
-                return name
-        return None
+        """檢查是否碰到控制點 (直接比對選取框座標，不逐一走訪控制點)"""
+        if not self._selection_rect:
+            return None
+
+        # 計算動態容差：控制點大小 + 基礎容差 (螢幕像素)，依縮放轉換為場景座標
+        tolerance = self.HANDLE_SIZE / 2 + 5
+        zoom_factor = self._canvas.zoom_factor
+        if zoom_factor > 0:
+            tolerance /= zoom_factor
+
+        rect = self._selection_rect.rect()
+        x, y = scene_pos.x(), scene_pos.y()
+
+        if abs(x - rect.left()) <= tolerance:
+            col = "l"
+        elif abs(x - rect.center().x()) <= tolerance:
+            col = "c"
+        elif abs(x - rect.right()) <= tolerance:
+            col = "r"
+        else:
+            return None
+
+        if abs(y - rect.top()) <= tolerance:
+            row = "t"
+        elif abs(y - rect.center().y()) <= tolerance:
+            row = "c"
+        elif abs(y - rect.bottom()) <= tolerance:
+            row = "b"
+        else:
+            return None
+
+        return self._HANDLE_AT.get((col, row))
 
     def _calculate_resize(self, rect: QRectF, handle: str, pos: QPointF) -> QRectF:
         """根據拖曳控制點計算新矩形"""
@@ -257,75 +351,38 @@ class CropTool(BaseTool):
         if "b" in handle:
             b = y
 
-        # 處理翻轉
-        return QRectF(QPointF(l, t), QPointF(r, b)).normalized()
+        # 處理翻轉 (直接交換座標，只建立一個 QRectF)
+        if r < l:
+            l, r = r, l
+        if b < t:
+            t, b = b, t
+        return QRectF(l, t, r - l, b - t)
 
     def _update_overlay(self, selection_rect: QRectF):
-        """更新遮罩"""
-        self._clear_overlay()  # 清除舊的 (或可優化為更新舊的)
-
-        pixmap = self._canvas.get_pixmap()
-        if not pixmap:
+        """更新遮罩 (圖片範圍挖去選取範圍)"""
+        if not self._overlay_item or self._image_rect is None:
             return
 
-        image_rect = QRectF(0, 0, pixmap.width(), pixmap.height())
-        overlay_color = QColor(0, 0, 0, 120)
-
-        # 簡單一點：使用 Path 製作鏤空遮罩可能更好，但這裡沿用 4-rect 方法
-        # 上
-        if selection_rect.top() > 0:
-            self._add_overlay_rect(
-                0, 0, image_rect.width(), selection_rect.top(), overlay_color
-            )
-        # 下
-        if selection_rect.bottom() < image_rect.height():
-            self._add_overlay_rect(
-                0,
-                selection_rect.bottom(),
-                image_rect.width(),
-                image_rect.height() - selection_rect.bottom(),
-                overlay_color,
-            )
-        # 左
-        if selection_rect.left() > 0:
-            self._add_overlay_rect(
-                0,
-                selection_rect.top(),
-                selection_rect.left(),
-                selection_rect.height(),
-                overlay_color,
-            )
-        # 右
-        if selection_rect.right() < image_rect.width():
-            self._add_overlay_rect(
-                selection_rect.right(),
-                selection_rect.top(),
-                image_rect.width() - selection_rect.right(),
-                selection_rect.height(),
-                overlay_color,
-            )
-
-    def _add_overlay_rect(self, x, y, w, h, color):
-        item = QGraphicsRectItem(x, y, w, h)
-        item.setBrush(QBrush(color))
-        item.setPen(Qt.NoPen)
-        self.scene.addItem(item)
-        self._overlay_items.append(item)
-
-    def _clear_overlay(self):
-        for item in self._overlay_items:
-            self.scene.removeItem(item)
-        self._overlay_items.clear()
+        # 奇偶填色規則：兩個矩形重疊的部分 (選取範圍) 不填色
+        path = QPainterPath()
+        path.setFillRule(Qt.OddEvenFill)
+        path.addRect(self._image_rect)
+        path.addRect(selection_rect)
+        self._overlay_item.setPath(path)
 
     def _clear_selection(self):
         """清除所有項目"""
-        self._clear_overlay()
+        if self._overlay_item:
+            self.scene.removeItem(self._overlay_item)
+            self._overlay_item = None
         if self._selection_rect:
             self.scene.removeItem(self._selection_rect)
             self._selection_rect = None
 
-        for item in self._handles.values():
-            self.scene.removeItem(item)
+        # 移除群組會一併移除所有控制點
+        if self._handle_group:
+            self.scene.removeItem(self._handle_group)
+            self._handle_group = None
         self._handles.clear()
 
         self._start_pos = None
@@ -3,9 +3,9 @@
 """
 
 import math
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Set, Callable
 
-from PySide6.QtCore import Qt, QPointF, QRectF, Signal, QObject
+from PySide6.QtCore import Qt, QPointF, QRectF
 from PySide6.QtGui import (
     QMouseEvent,
     QPen,
@@ -14,11 +14,13 @@ from PySide6.QtGui import (
     QCursor,
     QTransform,
     QPainter,
+    QPixmap,
+    QGuiApplication,
 )
 from PySide6.QtWidgets import (
     QGraphicsRectItem,
     QGraphicsItem,
-    QGraphicsEllipseItem,
+    QGraphicsPixmapItem,
     QGraphicsLineItem,
     QGraphicsSceneMouseEvent,
     QStyleOptionGraphicsItem,
@@ -28,31 +30,75 @@ from PySide6.QtWidgets import (
 from .base_tool import BaseTool
 from ..commands.rect_commands import AddAnnotationCommand, TransformAnnotationCommand
 
+# 弧度轉角度係數
+_RAD2DEG = 180.0 / math.pi
 
-class AnnotationSignals(QObject):
+# 旋轉吸附：接近 45 度倍數時自動吸附
+_SNAP_INTERVAL = 45
+_SNAP_INV = 1.0 / _SNAP_INTERVAL
+_SNAP_THRESHOLD = 5
+
+# 旋轉角度變化低於此值時不重設 (度)
+_ROTATION_EPSILON = 0.1
+
+# 旋轉中心變化低於此值時不重設 (場景座標)
+_ORIGIN_EPSILON = 1e-3
+
+
+class _HandleRoot(QGraphicsItem):
     """
-    用於在 QGraphicsItem 中使用 Signal
+    控制點的共同父項目 (本身不繪製)
+
+    不使用 QGraphicsItemGroup：群組會攔截子項目的滑鼠事件，控制點將無法拖曳
     """
 
-    # (self, old_state, new_state)
-    modification_finished = Signal(object, dict, dict)
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setFlag(QGraphicsItem.ItemHasNoContents, True)
+
+    def boundingRect(self) -> QRectF:
+        return QRectF()
+
+    def paint(self, painter, option, widget=None):
+        pass
 
 
-class SelectionHandle(QGraphicsEllipseItem):
+class SelectionHandle(QGraphicsPixmapItem):
     """
     選取控制點
+
+    外觀 (白色圓點，黑色邊框) 只繪製一次，所有標註的控制點共用同一張點陣圖
     """
 
     SIZE = 10
 
+    # 共用的控制點點陣圖 (第一次建立控制點時繪製)
+    _PIXMAP: Optional[QPixmap] = None
+
+    # 控制點類型 -> 游標
+    _CURSOR_MAP = {
+        "tl": Qt.SizeFDiagCursor,
+        "br": Qt.SizeFDiagCursor,
+        "tr": Qt.SizeBDiagCursor,
+        "bl": Qt.SizeBDiagCursor,
+        "t": Qt.SizeVerCursor,
+        "b": Qt.SizeVerCursor,
+        "l": Qt.SizeHorCursor,
+        "r": Qt.SizeHorCursor,
+        "rotate": Qt.PointingHandCursor,  # 旋轉游標
+    }
+
     def __init__(self, parent, handle_type: str):
-        # 預設位置 (0,0)，大小 10x10
-        super().__init__(-self.SIZE / 2, -self.SIZE / 2, self.SIZE, self.SIZE, parent)
+        # 掛在標註的控制點根項目下，事件仍回報給標註本身
+        super().__init__(self._get_pixmap(), parent._handle_root)
+        self._owner = parent
         self._handle_type = handle_type
 
-        # 樣式 (白色圓點，黑色邊框)
-        self.setBrush(QBrush(Qt.white))
-        self.setPen(QPen(Qt.black, 1))
+        # 以 (0,0) 為中心 (含 1 像素邊框)
+        half = (self.SIZE + 1) / 2
+        self.setOffset(-half, -half)
+        # 以外框判定點擊，不必從點陣圖計算遮罩
+        self.setShapeMode(QGraphicsPixmapItem.BoundingRectShape)
 
         # 互動設定
         self.setCursor(self._get_cursor())
@@ -64,19 +110,28 @@ class SelectionHandle(QGraphicsEllipseItem):
         )  # 忽略縮放，保持固定大小
         self.setAcceptHoverEvents(True)
 
+    @classmethod
+    def _get_pixmap(cls) -> QPixmap:
+        """取得共用控制點點陣圖 (依螢幕像素比例繪製一次)"""
+        if cls._PIXMAP is None:
+            screen = QGuiApplication.primaryScreen()
+            dpr = screen.devicePixelRatio() if screen else 1.0
+            size = cls.SIZE + 1  # 外加 1 像素邊框
+            pixmap = QPixmap(round(size * dpr), round(size * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setBrush(QBrush(Qt.white))
+            painter.setPen(QPen(Qt.black, 1))
+            painter.drawEllipse(QRectF(0.5, 0.5, cls.SIZE, cls.SIZE))
+            painter.end()
+            cls._PIXMAP = pixmap
+        return cls._PIXMAP
+
     def _get_cursor(self) -> QCursor:
-        cursors = {
-            "tl": Qt.SizeFDiagCursor,
-            "br": Qt.SizeFDiagCursor,
-            "tr": Qt.SizeBDiagCursor,
-            "bl": Qt.SizeBDiagCursor,
-            "t": Qt.SizeVerCursor,
-            "b": Qt.SizeVerCursor,
-            "l": Qt.SizeHorCursor,
-            "r": Qt.SizeHorCursor,
-            "rotate": Qt.PointingHandCursor,  # 旋轉游標
-        }
-        return cursors.get(self._handle_type, Qt.ArrowCursor)
+        return self._CURSOR_MAP.get(self._handle_type, Qt.ArrowCursor)
 
     @property
     def handle_type(self):
@@ -85,17 +140,17 @@ class SelectionHandle(QGraphicsEllipseItem):
     def mousePressEvent(self, event: QGraphicsSceneMouseEvent):
         # print(f"Handle Press: {self._handle_type}")
         # 標記開始互動，並通知 Parent
-        self.parentItem().handle_press(self, event.scenePos())
+        self._owner.handle_press(self, event.scenePos())
         event.accept()  # 明確接受事件
 
     def mouseMoveEvent(self, event: QGraphicsSceneMouseEvent):
         # print(f"Handle Move: {self._handle_type}")
         # 通知 Parent 進行調整
-        self.parentItem().handle_move(self, event.scenePos())
+        self._owner.handle_move(self, event.scenePos())
 
     def mouseReleaseEvent(self, event: QGraphicsSceneMouseEvent):
         # print(f"Handle Release: {self._handle_type}")
-        self.parentItem().handle_release(self)
+        self._owner.handle_release(self)
 
 
 class AnnotationRect(QGraphicsRectItem):
@@ -105,16 +160,38 @@ class AnnotationRect(QGraphicsRectItem):
 
     MIN_SIZE = 10
 
+    # 縮放時的固定錨點 (Local 座標系中的相對位置 0~1)
+    # 例如：拖曳左上(TL)，固定點為右下(BR) -> (1, 1)
+    _ANCHOR_MAP = {
+        "tl": (1, 1),
+        "t": (0.5, 1),
+        "tr": (0, 1),
+        "l": (1, 0.5),
+        "r": (0, 0.5),
+        "bl": (1, 0),
+        "b": (0.5, 0),
+        "br": (0, 0),
+    }
+
     def __init__(
-        self, rect: QRectF, color: QColor, line_width: int, rotation: float = 0
+        self,
+        rect: QRectF,
+        color: QColor,
+        line_width: int,
+        rotation: float = 0,
+        on_modified: Optional[Callable[["AnnotationRect", dict, dict], None]] = None,
+        on_selection_changed: Optional[Callable[["AnnotationRect", bool], None]] = None,
     ):
         super().__init__(rect)
+        # get_data 快取 (None 表示需重建；幾何或樣式改變時清除)
+        self._data_cache: Optional[dict] = None
         self._color = color
         self._line_width = line_width
         # Rotation 透過 setRotation 處理，這裡只是初始參數
 
-        # 設定樣式
-        self.setPen(QPen(color, line_width))
+        # 設定樣式 (保留一支畫筆，變更顏色/寬度時直接修改後套用)
+        self._pen = QPen(color, line_width)
+        self.setPen(self._pen)
         self.setBrush(QBrush(Qt.transparent))
 
         # 可選取、可移動
@@ -122,6 +199,10 @@ class AnnotationRect(QGraphicsRectItem):
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
 
+        # 目前套用的旋轉中心 (NaN 表示尚未設定，第一次必定套用)
+        self._origin_x = math.nan
+        self._origin_y = math.nan
+
         # 控制點
         self._handles: Dict[str, SelectionHandle] = {}
         self._create_handles()
@@ -131,15 +212,18 @@ class AnnotationRect(QGraphicsRectItem):
         self._is_resizing = False
         self._start_rect = QRectF()
         self._start_pos = QPointF()
+        self._start_item_pos = QPointF()
         self._start_rotation = 0.0
+        self._start_state: Optional[dict] = None
 
-        # 套用初始旋轉
+        # 套用初始旋轉 (旋轉中心已由 _update_handle_positions 設定)
         if rotation != 0:
-            self.setTransformOriginPoint(rect.center())
             self.setRotation(rotation)
 
-        # 信號代理
-        self.signals = AnnotationSignals()
+        # 變形完成回呼 (self, old_state, new_state)，直接呼叫不經 Qt 信號
+        self._on_modified = on_modified
+        # 選取狀態改變回呼 (self, selected)，讓工具自行追蹤選取的標註
+        self._on_selection_changed = on_selection_changed
 
         # 渲染標記（用於儲存時不繪製連接線）
         self._rendering = False
@@ -171,12 +255,19 @@ class AnnotationRect(QGraphicsRectItem):
             self._update_handles_visibility(selected=bool(value))
         elif change == QGraphicsItem.ItemPositionHasChanged:
             # 位置變更時觸發重繪，確保連接線正確
+            self._data_cache = None
             self.update()
+        elif change == QGraphicsItem.ItemRotationHasChanged:
+            self._data_cache = None
+        elif change == QGraphicsItem.ItemSelectedHasChanged:
+            if self._on_selection_changed:
+                self._on_selection_changed(self, bool(value))
         return super().itemChange(change, value)
 
     def setRect(self, rect: QRectF):
         """覆寫 setRect 以更新控制點位置"""
         super().setRect(rect)
+        self._data_cache = None
         self._update_handle_positions()
 
     def boundingRect(self) -> QRectF:
@@ -190,7 +281,14 @@ class AnnotationRect(QGraphicsRectItem):
                 rect.setTop(rotate_pos.y() - 10)
         return rect
 
+    @property
+    def handle_root(self) -> QGraphicsItem:
+        """所有控制點的共同父項目 (位於 Item 原點，切換可見性即可顯示/隱藏全部控制點)"""
+        return self._handle_root
+
     def _create_handles(self):
+        # 位於 Item 座標原點，控制點座標即為 Item 座標
+        self._handle_root = _HandleRoot(self)
         directions = ["tl", "t", "tr", "r", "br", "b", "bl", "l", "rotate"]
         for d in directions:
             handle = SelectionHandle(self, d)
@@ -199,8 +297,8 @@ class AnnotationRect(QGraphicsRectItem):
         self._update_handle_positions()
 
     def _update_handles_visibility(self, selected: bool = False):
-        for handle in self._handles.values():
-            handle.setVisible(selected)
+        # 只切換根項目，Qt 會一次略過整個子樹
+        self._handle_root.setVisible(selected)
         # 連接線在 paint 中繪製，會自動跟隨選取狀態
 
     def _update_handle_positions(self):
@@ -219,29 +317,31 @@ class AnnotationRect(QGraphicsRectItem):
                 # 將螢幕像素轉換為場景座標
                 rotate_offset = 50 / zoom_factor
 
-        top_center = QPointF(rect.center().x(), rect.top())
-        rotate_pos = QPointF(rect.center().x(), rect.top() - rotate_offset)
-
-        pos_map = {
-            "tl": rect.topLeft(),
-            "t": top_center,
-            "tr": rect.topRight(),
-            "r": QPointF(rect.right(), rect.center().y()),
-            "br": rect.bottomRight(),
-            "b": QPointF(rect.center().x(), rect.bottom()),
-            "bl": rect.bottomLeft(),
-            "l": QPointF(rect.left(), rect.center().y()),
-            "rotate": rotate_pos,
-        }
-
-        for name, handle in self._handles.items():
-            if name in pos_map:
-                handle.setPos(pos_map[name])
+        # 直接以座標設定位置，不必每次建立對照表與 QPointF
+        l, t, r, b = rect.left(), rect.top(), rect.right(), rect.bottom()
+        center = rect.center()
+        cx, cy = center.x(), center.y()
+        handles = self._handles
+        handles["tl"].setPos(l, t)
+        handles["t"].setPos(cx, t)
+        handles["tr"].setPos(r, t)
+        handles["r"].setPos(r, cy)
+        handles["br"].setPos(r, b)
+        handles["b"].setPos(cx, b)
+        handles["bl"].setPos(l, b)
+        handles["l"].setPos(l, cy)
+        handles["rotate"].setPos(cx, t - rotate_offset)
 
         # 連接線在 paint 中繪製，不需要在這裡更新
 
-        # 更新旋轉中心 (保持在中心)
-        self.setTransformOriginPoint(rect.center())
+        # 更新旋轉中心 (保持在中心)，中心未移動時不重設以免重算變換矩陣
+        # (NaN 與任何值比較皆為 False，第一次必定套用)
+        if not (
+            abs(cx - self._origin_x) < _ORIGIN_EPSILON
+            and abs(cy - self._origin_y) < _ORIGIN_EPSILON
+        ):
+            self._origin_x, self._origin_y = cx, cy
+            self.setTransformOriginPoint(center)
 
     # ===== Handle callbacks =====
 
@@ -252,6 +352,7 @@ class AnnotationRect(QGraphicsRectItem):
         # 記錄 Local 座標的點 (更方便計算 Resize)
         self._start_pos = self.mapFromScene(scene_pos)
         self._start_scene_pos = scene_pos
+        self._start_item_pos = self.pos()
         self._start_rotation = self.rotation()
 
         # 記錄完整初始狀態 (用於 Undo)
@@ -267,35 +368,23 @@ class AnnotationRect(QGraphicsRectItem):
         if h_type == "rotate":
             center = self.mapToScene(self.rect().center())
             delta = scene_pos - center
-            angle = math.degrees(math.atan2(delta.y(), delta.x())) + 90
+            angle = math.atan2(delta.y(), delta.x()) * _RAD2DEG + 90
 
             # --- 吸附邏輯 (Snapping) ---
             # 當角度接近 45, 90, 135... 時自動吸附
-            SNAP_INTERVAL = 45
-            SNAP_THRESHOLD = 5
-
-            nearest_multiple = round(angle / SNAP_INTERVAL) * SNAP_INTERVAL
-            if abs(angle - nearest_multiple) < SNAP_THRESHOLD:
+            nearest_multiple = round(angle * _SNAP_INV) * _SNAP_INTERVAL
+            if abs(angle - nearest_multiple) < _SNAP_THRESHOLD:
                 angle = nearest_multiple
 
-            self.setRotation(angle)
+            # 吸附後角度常維持不變，略過重設
+            if abs(angle - self.rotation()) >= _ROTATION_EPSILON:
+                self.setRotation(angle)
             return
 
         # --- 縮放處理 (錨點補償) ---
 
         # 1. 決定固定錨點 (Anchor) - 在 Local 座標系中的相對位置 (0~1)
-        # 例如：拖曳左上(TL)，固定點為右下(BR) -> (1, 1)
-        anchor_map = {
-            "tl": (1, 1),
-            "t": (0.5, 1),
-            "tr": (0, 1),
-            "l": (1, 0.5),
-            "r": (0, 0.5),
-            "bl": (1, 0),
-            "b": (0.5, 0),
-            "br": (0, 0),
-        }
-        ax, ay = anchor_map.get(h_type, (0.5, 0.5))
+        ax, ay = self._ANCHOR_MAP[h_type]
 
         curr_rect = self.rect()
         anchor_local = QPointF(
@@ -338,49 +427,19 @@ class AnnotationRect(QGraphicsRectItem):
         delta = anchor_scene - new_anchor_scene
         self.moveBy(delta.x(), delta.y())
 
-    # Signal: (self, old_state, new_state)
-    # modification_finished = Signal(object, dict, dict) # Removed: use self.signals proxy
-
     def handle_release(self, handle: SelectionHandle):
         self._is_resizing = False
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
 
-        # 檢查是否有變更
-        new_state = self.get_data()
-
-        # 簡單比較 (如果不一樣則發送信號)
-        # 比較 rect, rotation, pos
-        changed = False
-
-        # 比較 Rect
-        current_rect = self.rect()
-        if (
-            abs(current_rect.x() - self._start_rect.x()) > 0.1
-            or abs(current_rect.y() - self._start_rect.y()) > 0.1
-            or abs(current_rect.width() - self._start_rect.width()) > 0.1
-            or abs(current_rect.height() - self._start_rect.height()) > 0.1
-        ):
-            changed = True
-
-        # 比較 Rotation
-        if abs(self.rotation() - self._start_rotation) > 0.1:
-            changed = True
-
-        # 比較 Pos (start_pos 是 Local, 但我們應該比較 Scene Pos?
-        # get_data 返回的是 Scene Pos)
-        # 不過 handle_press 沒有記錄初始的 Scene Pos 完整的狀態
-        # 為了簡化，我們在 handle_press 應該記錄完整的 state dict
-
-        # 修正: 在 handle_press 記錄完整 state
-        if hasattr(self, "_start_state") and self._start_state:
-            # 比較各個數值
-            for k in ["rect", "rotation", "pos"]:
-                if self._start_state[k] != new_state[k]:
-                    changed = True
-                    break
+        # 逐項比較 rect / rotation / pos，未變更時不必建立新狀態
+        changed = (
+            self.rect() != self._start_rect
+            or self.rotation() != self._start_rotation
+            or self.pos() != self._start_item_pos
+        )
 
-        if changed and hasattr(self, "_start_state"):
-            self.signals.modification_finished.emit(self, self._start_state, new_state)
+        if changed and self._start_state is not None and self._on_modified:
+            self._on_modified(self, self._start_state, self.get_data())
 
     # ===== Properties =====
 
@@ -390,8 +449,13 @@ class AnnotationRect(QGraphicsRectItem):
 
     @annotation_color.setter
     def annotation_color(self, color: QColor):
+        # 數值未變時不重設畫筆 (setPen 會觸發重繪)
+        if color == self._color:
+            return
         self._color = color
-        self.setPen(QPen(color, self._line_width))
+        self._data_cache = None
+        self._pen.setColor(color)
+        self.setPen(self._pen)
 
     @property
     def line_width(self) -> int:
@@ -399,23 +463,31 @@ class AnnotationRect(QGraphicsRectItem):
 
     @line_width.setter
     def line_width(self, width: int):
+        if width == self._line_width:
+            return
         self._line_width = width
-        self.setPen(QPen(self._color, width))
+        self._data_cache = None
+        self._pen.setWidth(width)
+        self.setPen(self._pen)
 
     def get_data(self) -> dict:
-        """取得標註資料"""
-        return {
-            "rect": [
-                self.rect().x(),
-                self.rect().y(),
-                self.rect().width(),
-                self.rect().height(),
-            ],
-            "color": self._color.name(),
-            "line_width": self._line_width,
-            "rotation": self.rotation(),
-            "pos": [self.pos().x(), self.pos().y()],
-        }
+        """
+        取得標註資料
+
+        結果會快取至下次幾何或樣式改變；回傳的 dict 不可修改
+        (重建時會產生新的 dict，先前取得的狀態不受影響)
+        """
+        if self._data_cache is None:
+            rect = self.rect()
+            pos = self.pos()
+            self._data_cache = {
+                "rect": [rect.x(), rect.y(), rect.width(), rect.height()],
+                "color": self._color.name(),
+                "line_width": self._line_width,
+                "rotation": self.rotation(),
+                "pos": [pos.x(), pos.y()],
+            }
+        return self._data_cache
 
 
 class RectTool(BaseTool):
@@ -438,7 +510,10 @@ class RectTool(BaseTool):
         self._rotation = rotation
 
         self._current_rect: Optional[AnnotationRect] = None
-        self._annotations: List[AnnotationRect] = []
+        # 與畫布共用標註清單 (剪裁時由畫布統一偏移)
+        self._annotations: List[AnnotationRect] = canvas.annotation_items
+        # 目前選取的標註 (由標註的 itemChange 回報維護，不必掃描整個場景)
+        self._selected_annotations: Set[AnnotationRect] = set()
 
     def on_activate(self):
         self._canvas.setCursor(Qt.CrossCursor)
@@ -461,29 +536,45 @@ class RectTool(BaseTool):
         # 更新選取項目 (注意：這會強制覆蓋個別旋轉)
         self.update_selected(rotation=rotation)
 
+    def _on_annotation_selection_changed(self, annotation: AnnotationRect, selected: bool):
+        """標註選取狀態改變 (Callback)"""
+        if selected:
+            self._selected_annotations.add(annotation)
+        else:
+            self._selected_annotations.discard(annotation)
+
+    def selected_annotations(self) -> List[AnnotationRect]:
+        """
+        取得場景中選取的標註
+
+        移出場景的項目仍保留選取旗標 (復原時會恢復選取)，因此只回傳仍在場景中的項目
+        """
+        scene = self.scene
+        return [item for item in self._selected_annotations if item.scene() is scene]
+
     def update_selected(self, color=None, width=None, rotation=None):
         """更新場景中所有選取的 AnnotationRect"""
-        for item in self.scene.selectedItems():
-            if isinstance(item, AnnotationRect):
-                if color is not None:
-                    item.annotation_color = color
-                if width is not None:
-                    item.line_width = width
-                if rotation is not None:
-                    item.setRotation(rotation)
+        for item in self.selected_annotations():
+            if color is not None:
+                item.annotation_color = color
+            if width is not None:
+                item.line_width = width
+            if rotation is not None and item.rotation() != rotation:
+                item.setRotation(rotation)
 
     def on_mouse_press(self, event: QMouseEvent, scene_pos: QPointF):
         """開始繪製"""
         self._start_pos = scene_pos
 
         rect = QRectF(scene_pos, scene_pos)
+        # 變形完成時直接回呼 (支援撤銷)
         self._current_rect = AnnotationRect(
-            rect, self._color, self._line_width, self._rotation
-        )
-
-        # 連接變形信號
-        self._current_rect.signals.modification_finished.connect(
-            self._on_annotation_modified
+            rect,
+            self._color,
+            self._line_width,
+            self._rotation,
+            on_modified=self._on_annotation_modified,
+            on_selection_changed=self._on_annotation_selection_changed,
         )
 
         self.scene.addItem(self._current_rect)
@@ -494,6 +585,13 @@ class RectTool(BaseTool):
         if not self._is_active or not self._current_rect or not self._start_pos:
             return
 
+        self._schedule_move(scene_pos)
+
+    def _apply_move(self, scene_pos: QPointF):
+        """套用拖曳 (每個畫面最多一次)"""
+        if not self._current_rect or not self._start_pos:
+            return
+
         rect = QRectF(self._start_pos, scene_pos).normalized()
         self._current_rect.setRect(rect)
         # 繪製過程中，暫時不需要 Handles
@@ -502,6 +600,7 @@ class RectTool(BaseTool):
 
     def on_mouse_release(self, event: QMouseEvent, scene_pos: QPointF):
         """完成繪製"""
+        self._flush_move()
         self._is_active = False
 
         if self._current_rect:
@@ -510,14 +609,12 @@ class RectTool(BaseTool):
                 # 有效矩形
                 if self._command_history:
                     # 使用 Command 處理 (支援撤銷)
-                    cmd = AddAnnotationCommand(
-                        self.scene, self._current_rect, self._annotations
-                    )
+                    cmd = AddAnnotationCommand(self._canvas, self._current_rect)
                     # CommandHistory.execute 會呼叫 cmd.execute()
                     self._command_history.execute(cmd)
                 else:
                     # Fallback (如果要支援無 History 模式)
-                    self._annotations.append(self._current_rect)
+                    self._canvas.add_annotation(self._current_rect)
 
                 # 自動選取剛畫好的 (這樣就可以直接編輯)
                 self._current_rect.setSelected(True)
@@ -536,15 +633,13 @@ class RectTool(BaseTool):
     def remove_selected(self):
         """移除選取的標註"""
         # 注意：使用 list() 複製，因為會在迴圈中 modify
-        for item in list(self.scene.selectedItems()):
-            if isinstance(item, AnnotationRect) and item in self._annotations:
-                self._annotations.remove(item)
-                self.scene.removeItem(item)
+        for item in self.selected_annotations():
+            if self._canvas.has_annotation(item):
+                self._canvas.remove_annotation(item)
 
     def clear_all(self):
-        for item in self._annotations:
-            self.scene.removeItem(item)
-        self._annotations.clear()
+        for item in list(self._annotations):
+            self._canvas.remove_annotation(item)
 
     def _on_annotation_modified(self, annotation, old_state, new_state):
         """標註變形完成 (Callback)"""
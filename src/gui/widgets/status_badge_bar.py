@@ -0,0 +1,84 @@
+"""
+測項狀態標籤列
+以單一元件直接繪製各目標的狀態標籤，取代每個目標一個 QLabel
+"""
+
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QPainter, QColor, QFont
+from PySide6.QtWidgets import QWidget, QSizePolicy
+
+from constants import (
+    COLOR_BG_DEFAULT,
+    COLOR_BG_PASS,
+    COLOR_BG_FAIL,
+    COLOR_BG_NA,
+    COLOR_TEXT_GRAY,
+    COLOR_TEXT_PASS,
+    COLOR_TEXT_FAIL,
+)
+
+# 狀態 -> (背景色, 文字色)；顏色物件於模組載入時建立一次
+_BADGE_COLORS = {
+    "Pass": (QColor(COLOR_BG_PASS), QColor(COLOR_TEXT_PASS)),
+    "Fail": (QColor(COLOR_BG_FAIL), QColor(COLOR_TEXT_FAIL)),
+    "N/A": (QColor(COLOR_BG_NA), QColor(COLOR_TEXT_GRAY)),
+}
+_DEFAULT_COLORS = (QColor(COLOR_BG_DEFAULT), QColor(COLOR_TEXT_GRAY))
+
+
+class StatusBadgeBar(QWidget):
+    """
+    測項狀態標籤列
+
+    每個目標畫成一個圓角標籤 (等寬平分)，狀態未變更時不重繪
+    """
+
+    BADGE_HEIGHT = 30
+    BADGE_SPACING = 6
+    BORDER_RADIUS = 4
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # [(顯示文字, 狀態)]
+        self._entries = []
+        self.setFixedHeight(self.BADGE_HEIGHT)
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+
+    def set_entries(self, entries):
+        """設定各標籤的 (顯示文字, 狀態)，內容相同時不重繪"""
+        entries = list(entries)
+        if entries != self._entries:
+            self._entries = entries
+            self.update()
+
+    def paintEvent(self, event):
+        if not self._entries:
+            return
+        n = len(self._entries)
+        spacing = self.BADGE_SPACING
+        w = (self.width() - spacing * (n - 1)) / n
+        h = self.height()
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        font = QFont(self.font())
+        font.setBold(True)
+        painter.setFont(font)
+        metrics = painter.fontMetrics()
+        painter.setPen(Qt.NoPen)
+
+        x = 0.0
+        for text, state in self._entries:
+            bg, fg = _BADGE_COLORS.get(state, _DEFAULT_COLORS)
+            rect = QRectF(x, 0, w, h)
+            painter.setBrush(bg)
+            painter.drawRoundedRect(rect, self.BORDER_RADIUS, self.BORDER_RADIUS)
+            painter.setPen(fg)
+            painter.drawText(
+                rect,
+                Qt.AlignCenter,
+                metrics.elidedText(text, Qt.ElideRight, int(w) - 4),
+            )
+            painter.setPen(Qt.NoPen)
+            x += w + spacing
+        painter.end()
@@ -5,7 +5,7 @@
 import os
 from functools import partial
 
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import Qt, Slot, QSize, QTimer
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -24,7 +24,7 @@ from PySide6.QtWidgets import (
     QDialog,
     QApplication,
 )
-from PySide6.QtGui import QShortcut, QKeySequence
+from PySide6.QtGui import QShortcut, QKeySequence, QIcon
 from PySide6.QtCore import QUrl
 
 from constants import *
@@ -38,6 +38,23 @@ from pages.test_page import UniversalTestPage
 from pages.quick_selector import QuickTestSelector
 from pages.project_form import ProjectFormController
 from windows.bordered_window import BorderedMainWindow
+from widgets.status_badge_bar import StatusBadgeBar
+
+# 測項列樣式 (設定在各分頁容器上只解析一次；按鈕以 tested 屬性切換顏色，
+# 狀態標籤由 StatusBadgeBar 直接繪製)
+_SECTION_ITEMS_QSS = f"""
+QPushButton[tested="true"] {{ background-color: {COLOR_BTN_ACTIVE}; color: white; font-weight: bold; }}
+"""
+
+# 資料變更後延遲刷新主畫面的時間 (毫秒)，期間內的變更合併為一次刷新
+_REFRESH_DELAY_MS = 100
+
+
+def _repolish(widget):
+    """動態屬性變更後重新套用樣式 (不重新解析樣式表)"""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
 
 
 class MainApp(BorderedMainWindow):
@@ -47,12 +64,31 @@ class MainApp(BorderedMainWindow):
         super().__init__()
         self.config_mgr = config_mgr
         self.pm = ProjectManager()
+        self.overview = None
         self.test_ui_elements = {}
+        # 上次套用的狀態摘要：uid -> summary
+        self._applied_status = {}
+        # 尚未建立內容的檢測分類分頁：tab index -> (分頁, section 設定)
+        self._pending_sections = {}
+        # 檢測分類分頁資訊 (tab index, section_id, 啟用標題, 停用標題)，重建分頁時產生一次
+        self._tab_meta = []
+        # 各分頁上次套用的啟用狀態，未改變時不呼叫 setTabEnabled / setTabText
+        self._tab_enabled = {}
         self.test_windows = {}  # 追蹤已開啟的檢測視窗 {uid: window}
         self.mobile_helper_win = None  # 追蹤手機助手視窗
+        # 已建立的專案表單 {id(欄位定義): ProjectFormController}
+        # 控制器持有 full_config，保存期間欄位定義物件不會被回收，id 不會重複使用
+        self._project_forms = {}
         self.current_font_size = 10
 
         self.pm.photo_received.connect(self.on_photo_received)
+        # 資料變更通知在短時間內合併為一次 UI 刷新
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(_REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        self.pm.data_changed.connect(self._schedule_refresh)
+        self.pm.test_updated.connect(self._refresh_one)
 
         self.config = self._get_initial_config()
 
@@ -60,10 +96,6 @@ class MainApp(BorderedMainWindow):
         self.resize(900, 850)
 
         # 設定應用程式圖標
-        import os
-        from PySide6.QtGui import QIcon
-        from PySide6.QtCore import QSize
-
         icon = QIcon(ICON_PATH)
         # 設定較大的可用尺寸以確保清晰度
         icon.addFile(ICON_PATH, QSize(64, 64))
@@ -82,6 +114,7 @@ class MainApp(BorderedMainWindow):
         self._init_menu()
 
         self.tabs = QTabWidget()
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         self.main_l.addWidget(self.tabs)
         self._init_zoom()
 
@@ -119,6 +152,10 @@ class MainApp(BorderedMainWindow):
 
         self.tabs.clear()
         self.test_ui_elements = {}
+        self._applied_status = {}
+        self._pending_sections = {}
+        self._tab_meta = []
+        self._tab_enabled = {}
         self.pm.set_standard_config(self.config)
 
         self.overview = OverviewPage(self.pm, self.config)
@@ -144,52 +181,69 @@ class MainApp(BorderedMainWindow):
 
         self.tabs.clear()
         self.test_ui_elements = {}
+        self._applied_status = {}
+        self._pending_sections = {}
+        self._tab_meta = []
+        self._tab_enabled = {}
 
         self.overview = OverviewPage(self.pm, self.config)
         self.tabs.addTab(self.overview, "總覽 Overview")
-        self.tabs.currentChanged.connect(
-            lambda i: self.overview.refresh_data() if i == 0 else None
-        )
-        self.pm.data_changed.connect(self.refresh_ui)
 
+        # 檢測分類分頁先放空白頁，第一次切換到該分頁時才建立測項列
         for sec in self.config.get("test_standards", []):
             p = QWidget()
-            v = QVBoxLayout(p)
-            v.addWidget(QLabel(f"<h3>{sec['section_name']}</h3>"))
-            scr = QScrollArea()
-            scr.setWidgetResizable(True)
-            scr.setFrameShape(QFrame.NoFrame)
-            v.addWidget(scr)
-            cont = QWidget()
-            cv = QVBoxLayout(cont)
-            scr.setWidget(cont)
-
-            for item in sec["items"]:
-                row = QWidget()
-                rh = QHBoxLayout(row)
-                rh.setContentsMargins(0, 5, 0, 5)
-
-                btn = QPushButton(f"{item['id']} {item['name']}")
-                btn.setFixedHeight(40)
-                btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-                btn.clicked.connect(partial(self.open_test, item))
-
-                st_cont = QWidget()
-                st_l = QHBoxLayout(st_cont)
-                st_l.setContentsMargins(0, 0, 0, 0)
-                st_cont.setFixedWidth(240)
-                rh.addWidget(btn)
-                rh.addWidget(st_cont)
-                cv.addWidget(row)
-
-                uid = item.get("uid", item.get("id"))
-                self.test_ui_elements[uid] = (btn, st_l, item, row)
-
-            cv.addStretch()
-            # 顯示 id + name
-            self.tabs.addTab(p, f"{sec['section_id']} {sec['section_name']}")
+            title = f"{sec['section_id']} {sec['section_name']}"
+            t_idx = self.tabs.addTab(p, title)
+            self._pending_sections[t_idx] = (p, sec)
+            self._tab_meta.append((t_idx, sec["section_id"], title, title + " (未啟用)"))
         self.update_font()
 
+    def _on_tab_changed(self, index):
+        if index == 0:
+            # 總覽只在離開期間有資料變更時才重新整理
+            if self.overview is not None:
+                self.overview.refresh_if_dirty()
+            return
+        pending = self._pending_sections.pop(index, None)
+        if pending is not None:
+            self._build_section_tab(*pending)
+
+    def _build_section_tab(self, p, sec):
+        """建立檢測分類分頁內容 (測項按鈕與狀態列)"""
+        v = QVBoxLayout(p)
+        v.addWidget(QLabel(f"<h3>{sec['section_name']}</h3>"))
+        scr = QScrollArea()
+        scr.setWidgetResizable(True)
+        scr.setFrameShape(QFrame.NoFrame)
+        v.addWidget(scr)
+        cont = QWidget()
+        cont.setStyleSheet(_SECTION_ITEMS_QSS)
+        cv = QVBoxLayout(cont)
+        scr.setWidget(cont)
+
+        for item in sec["items"]:
+            row = QWidget()
+            rh = QHBoxLayout(row)
+            rh.setContentsMargins(0, 5, 0, 5)
+
+            btn = QPushButton(f"{item['id']} {item['name']}")
+            btn.setFixedHeight(40)
+            btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+            btn.clicked.connect(partial(self.open_test, item))
+
+            badges = StatusBadgeBar()
+            badges.setFixedWidth(240)
+            rh.addWidget(btn)
+            rh.addWidget(badges)
+            cv.addWidget(row)
+
+            uid = item.get("uid", item.get("id"))
+            elements = (btn, badges, item, row)
+            self.test_ui_elements[uid] = elements
+            self._update_item_status(uid, elements)
+
+        cv.addStretch()
+
     def _init_menu(self):
         mb = self.menuBar()
 
@@ -239,10 +293,26 @@ class MainApp(BorderedMainWindow):
             self.update_font()
 
     def update_font(self):
-        font_family = '"Microsoft JhengHei", "Segoe UI", sans-serif'
-        QApplication.instance().setStyleSheet(
-            f"QWidget {{ font-size: {self.current_font_size}pt; font-family: {font_family}; }}"
-        )
+        # 以全域字型調整字級，不覆蓋全域樣式表，也不觸發所有元件重新套用樣式
+        font = QApplication.font()
+        if font.pointSize() == self.current_font_size:
+            return
+        font.setPointSize(self.current_font_size)
+        QApplication.setFont(font)
+
+    def _project_form(self, full_config, existing_data=None):
+        """取得同一欄位定義的既有表單並重新填值，沒有時才建立"""
+        # 沒有欄位定義的規範改以規範本身區分 (暫時建立的空 list 其 id 可能重複)
+        schema = full_config.get("project_meta_schema")
+        key = id(schema if schema is not None else full_config)
+        controller = self._project_forms.get(key)
+        if controller is None:
+            controller = self._project_forms[key] = ProjectFormController(
+                self, full_config, existing_data
+            )
+        else:
+            controller.reset(existing_data)
+        return controller
 
     def on_new(self):
         sel_dialog = VersionSelectionDialog(self.config_mgr, self)
@@ -251,7 +321,7 @@ class MainApp(BorderedMainWindow):
 
         selected_config = sel_dialog.selected_config
 
-        c = ProjectFormController(self, selected_config)
+        c = self._project_form(selected_config)
         d = c.run()
         if d:
             if self.mobile_helper_win:
@@ -268,45 +338,46 @@ class MainApp(BorderedMainWindow):
                 QMessageBox.warning(self, "建立失敗", r)
 
     def on_open(self):
-        dialog = QFileDialog(self, "選專案")
-        dialog.setFileMode(QFileDialog.Directory)
-        dialog.setOption(QFileDialog.DontUseNativeDialog, True)
-        dialog.setDirectory(DEFAULT_DESKTOP_PATH)
-
-        if dialog.exec() == QDialog.Accepted:
-            selected = dialog.selectedFiles()
-            if selected:
-                folder_path = selected[0]
-                proj_std = self.pm.peek_project_standard(folder_path)
-
-                if proj_std:
-                    target_config = self.config_mgr.find_config_by_name(proj_std)
-                    if target_config:
-                        self.config = target_config
-                        self.rebuild_ui_from_config()
-                    else:
-                        ret = QMessageBox.question(
-                            self,
-                            "規範遺失",
-                            f"專案使用規範：{proj_std}\n系統找不到此規範檔。\n是否嘗試使用目前載入的規範開啟？",
-                            QMessageBox.Yes | QMessageBox.No,
-                        )
-                        if ret == QMessageBox.No:
-                            return
-                else:
-                    QMessageBox.warning(
-                        self, "警告", "無法識別專案規範版本，將使用目前版本開啟。"
-                    )
+        # 使用系統原生的資料夾選擇視窗 (大量檔案的資料夾開啟較快)
+        folder_path = QFileDialog.getExistingDirectory(
+            self,
+            "選專案",
+            DEFAULT_DESKTOP_PATH,
+            QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks,
+        )
+        if not folder_path:
+            return
 
-                ok, m = self.pm.load_project(folder_path)
-                if ok:
-                    if self.mobile_helper_win:
-                        self.mobile_helper_win.close()
-                        self.mobile_helper_win = None
-                    self.pm.stop_server()  # 停止舊伺服器
-                    self.project_ready()
-                else:
-                    QMessageBox.warning(self, "載入失敗", m)
+        proj_std = self.pm.peek_project_standard(folder_path)
+
+        if proj_std:
+            target_config = self.config_mgr.find_config_by_name(proj_std)
+            if target_config:
+                self.config = target_config
+                self.rebuild_ui_from_config()
+            else:
+                ret = QMessageBox.question(
+                    self,
+                    "規範遺失",
+                    f"專案使用規範：{proj_std}\n系統找不到此規範檔。\n是否嘗試使用目前載入的規範開啟？",
+                    QMessageBox.Yes | QMessageBox.No,
+                )
+                if ret == QMessageBox.No:
+                    return
+        else:
+            QMessageBox.warning(
+                self, "警告", "無法識別專案規範版本，將使用目前版本開啟。"
+            )
+
+        ok, m = self.pm.load_project(folder_path)
+        if ok:
+            if self.mobile_helper_win:
+                self.mobile_helper_win.close()
+                self.mobile_helper_win = None
+            self.pm.stop_server()  # 停止舊伺服器
+            self.project_ready()
+        else:
+            QMessageBox.warning(self, "載入失敗", m)
 
     def on_adhoc(self):
         QMessageBox.information(
@@ -348,8 +419,8 @@ class MainApp(BorderedMainWindow):
         if p_type == PROJECT_TYPE_ADHOC:
             self.edit_adhoc_items()
         else:
-            c = ProjectFormController(
-                self, self.config, self.pm.project_data.get("info", {})
+            c = self._project_form(
+                self.config, self.pm.project_data.get("info", {})
             )
             d = c.run()
             if d and self.pm.update_info(d):
@@ -544,9 +615,16 @@ class MainApp(BorderedMainWindow):
             )
 
     def project_ready(self):
-        self._set_ui_locked(False)
+        # 程式切回總覽分頁時不觸發 currentChanged，總覽由下方 refresh_ui 統一刷新一次
+        self.tabs.blockSignals(True)
+        try:
+            self._set_ui_locked(False)
+            self.tabs.setCurrentIndex(0)
+        finally:
+            self.tabs.blockSignals(False)
+        # 直接刷新，不必再等待排程中的刷新
+        self._refresh_timer.stop()
         self.refresh_ui()
-        self.tabs.setCurrentIndex(0)
 
         std_name = self.config.get("standard_name", "Unknown")
         proj_name = self.pm.project_data.get("info", {}).get("project_name", "未命名")
@@ -559,10 +637,40 @@ class MainApp(BorderedMainWindow):
         else:
             self.setWindowTitle(f"無人機資安檢測工具 - {proj_name} [{std_name}]")
 
+    def _schedule_refresh(self):
+        """排程 UI 刷新 (延遲期間內的多次通知只刷新一次)"""
+        # 計時中不重新起算，連續變更時仍會定期刷新
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _do_refresh(self):
+        if self.overview is not None:
+            self.refresh_ui()
+
+    def _refresh_one(self, uid):
+        """單一測項變更：只更新該列狀態與總覽進度"""
+        elements = self.test_ui_elements.get(uid)
+        if elements is not None:
+            self._update_item_status(uid, elements)
+        # 總覽不在前景時只標記，切換回總覽分頁時才整頁刷新
+        if self.overview is not None:
+            if self.tabs.currentIndex() == 0:
+                self.overview.refresh_progress()
+            else:
+                self.overview.mark_dirty()
+
     def refresh_ui(self):
-        self.overview.refresh_data()
-        self.update_status()
-        self.update_tab_visibility()
+        # 批次更新總覽、測項狀態與分頁期間暫停重繪，結束後只重繪一次
+        self.tabs.setUpdatesEnabled(False)
+        try:
+            if self.tabs.currentIndex() == 0:
+                self.overview.refresh_data()
+            else:
+                self.overview.mark_dirty()
+            self.update_status()
+            self.update_tab_visibility()
+        finally:
+            self.tabs.setUpdatesEnabled(True)
 
         has_proj = self.pm.current_project_path is not None
         p_type = self.pm.get_current_project_type()
@@ -584,58 +692,50 @@ class MainApp(BorderedMainWindow):
             self.a_edit.setText("編輯專案資訊")
 
     def update_status(self):
-        for uid, (btn, layout, conf, row) in self.test_ui_elements.items():
-            target_id = conf.get("uid", conf.get("id"))
-
-            if not self.pm.is_item_visible(target_id):
-                row.hide()
-                continue
-            row.show()
-
-            status_map = self.pm.get_test_status_detail(conf)
-            is_all_tested = all(s != STATUS_NOT_TESTED for s in status_map.values())
-            if is_all_tested:
-                btn.setStyleSheet(
-                    f"QPushButton {{ background-color: {COLOR_BTN_ACTIVE}; color: white; font-weight: bold; }}"
-                )
-            else:
-                btn.setStyleSheet("")
-
-            while layout.count():
-                layout.takeAt(0).widget().deleteLater()
-            for t, s in status_map.items():
-                lbl = QLabel(f"{t}: {s}" if len(status_map) > 1 else s)
-                lbl.setAlignment(Qt.AlignCenter)
-                lbl.setFixedHeight(30)
-                c = COLOR_BG_DEFAULT
-                tc = COLOR_TEXT_GRAY
-                if s == "Pass":
-                    c = COLOR_BG_PASS
-                    tc = COLOR_TEXT_PASS
-                elif s == "Fail":
-                    c = COLOR_BG_FAIL
-                    tc = COLOR_TEXT_FAIL
-                elif s == "N/A":
-                    c = COLOR_BG_NA
-                    tc = COLOR_TEXT_GRAY
-
-                lbl.setStyleSheet(
-                    f"background-color:{c}; color:{tc}; border-radius:4px; font-weight:bold;"
-                )
-                layout.addWidget(lbl)
+        # 只更新已建立內容的分頁；其餘分頁建立時才計算狀態
+        for uid, elements in self.test_ui_elements.items():
+            self._update_item_status(uid, elements)
+
+    def _update_item_status(self, uid, elements):
+        btn, badges, conf, row = elements
+        target_id = conf.get("uid", conf.get("id"))
+
+        if not self.pm.is_item_visible(target_id):
+            row.hide()
+            return
+        row.show()
+
+        # 狀態摘要依資料版本快取；與上次套用的是同一物件時，表示該測項沒有變化
+        summary = self.pm.get_test_status_summary(conf)
+        if self._applied_status.get(uid) is summary:
+            return
+        self._applied_status[uid] = summary
+        status_map, is_all_tested = summary
+        if btn.property("tested") != is_all_tested:
+            btn.setProperty("tested", is_all_tested)
+            _repolish(btn)
+
+        multi = len(status_map) > 1
+        badges.set_entries(
+            (f"{t}: {st}" if multi else st, st) for t, st in status_map.items()
+        )
 
     def update_tab_visibility(self):
         if not self.pm.current_project_path:
             return
-        for i, sec in enumerate(self.config.get("test_standards", [])):
-            t_idx = i + 1
-            sec_id = sec["section_id"]
-            is_visible = self.pm.is_section_visible(sec_id)
-            self.tabs.setTabEnabled(t_idx, is_visible)
-            sec_title = f"{sec['section_id']} {sec['section_name']}"
-            self.tabs.setTabText(
-                t_idx, sec_title + (" (未啟用)" if not is_visible else "")
-            )
+        # 批次更新期間暫停分頁列重繪，且只在狀態實際改變時才修改分頁
+        bar = self.tabs.tabBar()
+        bar.setUpdatesEnabled(False)
+        try:
+            for t_idx, sec_id, title_on, title_off in self._tab_meta:
+                is_visible = self.pm.is_section_visible(sec_id)
+                if self._tab_enabled.get(t_idx) == is_visible:
+                    continue
+                self._tab_enabled[t_idx] = is_visible
+                self.tabs.setTabEnabled(t_idx, is_visible)
+                self.tabs.setTabText(t_idx, title_on if is_visible else title_off)
+        finally:
+            bar.setUpdatesEnabled(True)
 
     def open_test(self, item):
         uid = item.get("uid", item.get("id"))
@@ -672,7 +772,7 @@ class MainApp(BorderedMainWindow):
         self.statusBar().showMessage(msg, 5000)
 
         if item_uid in TARGETS:
-            self.refresh_ui()
+            self._schedule_refresh()
 
     def on_standard_editor(self):
         """開啟規範 JSON 編輯器 (使用系統瀏覽器)"""
@@ -695,4 +795,6 @@ class MainApp(BorderedMainWindow):
             if win:
                 win.close()
         self.test_windows.clear()
+        # 檢測視窗關閉時可能仍有延遲中的儲存
+        self.pm.flush()
         super().closeEvent(event)
@@ -2,8 +2,9 @@
 自訂標題列模組
 """
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSize
 from PySide6.QtWidgets import (
+    QApplication,
     QWidget,
     QHBoxLayout,
     QLabel,
@@ -12,11 +13,15 @@ from PySide6.QtWidgets import (
 
 from styles import Styles
 from gui.constants import ICON_PATH, CLOSE_ICON_PATH, MAXIMIZE_ICON_PATH, MINIMIZE_ICON_PATH 
+from gui.title_bar_icons import get_app_icon_pixmap, get_button_icon
 
 
 class CustomTitleBar(QWidget):
     """自訂標題列"""
 
+    # 已格式化的樣式表快取：(標題文字色, 按鈕文字色, 按鈕懸停色) -> 標題列樣式表
+    _STYLE_CACHE = {}
+
     def __init__(self, parent_window):
         super().__init__(parent_window)
         self.parent_window = parent_window
@@ -25,6 +30,7 @@ class CustomTitleBar(QWidget):
 
         # 標題 Label (獨立層，不加入 Layout)
         self.title_label = QLabel("MainWindow", self)
+        self.title_label.setObjectName("TitleText")
         self.title_label.setAlignment(Qt.AlignCenter)
         self.title_label.setAttribute(Qt.WA_TransparentForMouseEvents)
 
@@ -33,33 +39,13 @@ class CustomTitleBar(QWidget):
         layout.setContentsMargins(8, 0, 8, 0)
         layout.setSpacing(0)
 
-        # 視窗控制按鈕 (使用 SVG 圖示)
-        import os
-        from PySide6.QtGui import QIcon, QPixmap, QPainter
-        from PySide6.QtCore import QSize
-        from PySide6.QtSvg import QSvgRenderer
-
         # 應用程式圖標 (最左側) - 使用 QSvgRenderer 高品質渲染，支援高 DPI
         self.app_icon_label = QLabel(self)
 
         # 取得螢幕 DPI 縮放比例
-        from PySide6.QtWidgets import QApplication
-
         device_pixel_ratio = QApplication.primaryScreen().devicePixelRatio()
-        icon_size = 24
-        render_size = int(icon_size * device_pixel_ratio)
-
-        svg_renderer = QSvgRenderer(ICON_PATH)
-        app_icon_pixmap = QPixmap(render_size, render_size)
-        app_icon_pixmap.fill(Qt.transparent)
-        painter = QPainter(app_icon_pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-        svg_renderer.render(painter)
-        painter.end()
-        app_icon_pixmap.setDevicePixelRatio(device_pixel_ratio)
-
-        self.app_icon_label.setPixmap(app_icon_pixmap)
+
+        self.app_icon_label.setPixmap(get_app_icon_pixmap(ICON_PATH, 24, device_pixel_ratio))
         self.app_icon_label.setFixedSize(28, 28)
         self.app_icon_label.setAlignment(Qt.AlignCenter)
         self.app_icon_label.setStyleSheet("background: transparent;")
@@ -71,10 +57,12 @@ class CustomTitleBar(QWidget):
         self.btn_min = QPushButton()
         self.btn_max = QPushButton()
         self.btn_close = QPushButton()
+        self.btn_close.setObjectName("TitleClose")
 
-        self.btn_min.setIcon(QIcon(MINIMIZE_ICON_PATH))
-        self.btn_max.setIcon(QIcon(MAXIMIZE_ICON_PATH))
-        self.btn_close.setIcon(QIcon(CLOSE_ICON_PATH))
+        # 視窗控制按鈕 (使用 SVG 圖示)
+        self.btn_min.setIcon(get_button_icon(MINIMIZE_ICON_PATH, 16, device_pixel_ratio))
+        self.btn_max.setIcon(get_button_icon(MAXIMIZE_ICON_PATH, 16, device_pixel_ratio))
+        self.btn_close.setIcon(get_button_icon(CLOSE_ICON_PATH, 16, device_pixel_ratio))
 
         self.buttons = [self.btn_min, self.btn_max, self.btn_close]
 
@@ -94,15 +82,22 @@ class CustomTitleBar(QWidget):
         super().resizeEvent(event)
         self.title_label.setGeometry(0, 0, self.width(), self.height())
 
+    @classmethod
+    def _get_style(cls, theme) -> str:
+        """取得主題對應的樣式表 (只依實際用到的顏色快取，相同配色只格式化一次)"""
+        key = (theme["title_text"], theme["btn_text"], theme["btn_hover"])
+        style = cls._STYLE_CACHE.get(key)
+        if style is None:
+            style = cls._STYLE_CACHE[key] = (
+                Styles.TITLE_BAR.format(**theme)
+                + Styles.TITLE_BTN.format(**theme)
+                + Styles.TITLE_BAR_CLOSE
+            )
+        return style
+
     def update_theme(self, theme):
-        self.setStyleSheet("background-color: transparent;")
-        self.title_label.setStyleSheet(
-            f"font-weight:bold; background:transparent; color: {theme['title_text']};"
-        )
-        btn_style = Styles.TITLE_BTN.format(**theme)
-        for b in self.buttons:
-            b.setStyleSheet(btn_style)
-        self.btn_close.setStyleSheet(btn_style + Styles.TITLE_BTN_CLOSE)
+        # 子元件不各自設定樣式表，切換主題只重算一次樣式
+        self.setStyleSheet(self._get_style(theme))
 
     def mousePressEvent(self, event):
         if event.button() != Qt.LeftButton:
@@ -1,6 +1,18 @@
 import subprocess
 import os
 import shutil
+import threading
+import time
+from collections import deque
+
+# hackrf_info 偵測結果的有效時間 (秒)，期間內重複查詢不再啟動子進程
+DEVICE_CHECK_TTL = 2.0
+# hackrf_info 最長等待時間 (秒)，避免裝置異常時呼叫端無限期卡住
+DEVICE_CHECK_TIMEOUT = 5.0
+# is_running 沿用上次 poll() 結果的時間 (秒)
+RUNNING_POLL_INTERVAL = 0.05
+# 擷取子進程輸出時最多保留的行數 (超過時捨棄最舊的)
+OUTPUT_BUFFER_LINES = 1024
 
 class HackRFCLI:
     def __init__(self):
@@ -11,35 +23,73 @@ class HackRFCLI:
         self.transfer_exec = "hackrf_transfer"
         self.sweep_exec = "hackrf_sweep"
         self.process = None
+        # 執行檔是否存在在執行期間不會改變，只查詢一次
+        self._installed = None
+        # (查詢時間, 是否連接)
+        self._connected_cache = (None, False)
+        # 最近的子進程輸出 (只有 capture_output=True 時才擷取)
+        self.output_lines = deque(maxlen=OUTPUT_BUFFER_LINES)
+        # (查詢時間, 查詢的子進程, 是否執行中)
+        self._last_poll = (0.0, None, False)
 
     def is_installed(self):
         """檢查必要指令是否存在"""
-        t_check = shutil.which(self.transfer_exec) is not None
-        s_check = shutil.which(self.sweep_exec) is not None
-        return t_check and s_check
+        if self._installed is None:
+            t_check = shutil.which(self.transfer_exec) is not None
+            s_check = shutil.which(self.sweep_exec) is not None
+            self._installed = t_check and s_check
+        return self._installed
+
+    def is_device_connected(self, refresh=False):
+        """
+        透過 hackrf_info 檢查連接
+        :param refresh: True 時忽略快取，重新偵測
+        """
+        checked_at, connected = self._connected_cache
+        now = time.monotonic()
+        if not refresh and checked_at is not None and now - checked_at < DEVICE_CHECK_TTL:
+            return connected
 
-    def is_device_connected(self):
-        """透過 hackrf_info 檢查連接"""
         try:
-            result = subprocess.run(["hackrf_info"], capture_output=True, text=True)
-            return "Found HackRF" in result.stdout
-        except FileNotFoundError:
-            return False
+            result = subprocess.run(
+                ["hackrf_info"], capture_output=True, text=True,
+                timeout=DEVICE_CHECK_TIMEOUT
+            )
+            connected = "Found HackRF" in result.stdout
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            connected = False
+        self._connected_cache = (time.monotonic(), connected)
+        return connected
 
-    def _start_process(self, cmd_args):
-        """(內部方法) 啟動子進程"""
+    def _start_process(self, cmd_args, capture_output=False):
+        """
+        (內部方法) 啟動子進程
+        :param capture_output: True 時以背景執行緒持續讀取輸出到 output_lines；
+                               False 時丟棄輸出，避免管線寫滿後子進程卡住
+        """
         if self.is_running():
             print("[Warning] 上一個任務尚未結束，正在強制停止...")
             self.stop()
 
         try:
             # 使用 Popen 啟動 (非阻塞)
-            self.process = subprocess.Popen(
-                cmd_args,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            if capture_output:
+                self.output_lines.clear()
+                self.process = subprocess.Popen(
+                    cmd_args,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True
+                )
+                threading.Thread(
+                    target=self._drain, args=(self.process.stdout,), daemon=True
+                ).start()
+            else:
+                self.process = subprocess.Popen(
+                    cmd_args,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
             return True
         except FileNotFoundError as e:
             print(f"[Error] 找不到執行檔: {e.filename}，請確認已安裝 hackrf 套件。")
@@ -48,6 +98,13 @@ class HackRFCLI:
             print(f"[Error] 啟動失敗: {e}")
             return False
 
+    def _drain(self, stream):
+        """(背景執行緒) 持續讀取子進程輸出，直到子進程結束"""
+        lines = self.output_lines
+        with stream:
+            for line in stream:
+                lines.append(line.rstrip("\n"))
+
     def start_tx(self, filename, freq_hz, sample_rate_hz=2600000, amp=False, tx_gain=0, repeat=False):
         """
         [hackrf_transfer] 定頻發射 (GPS模擬用這個)
@@ -126,8 +183,19 @@ class HackRFCLI:
         return self._start_process(cmd)
 
     def is_running(self):
-        if self.process is None: return False
-        return self.process.poll() is None
+        """
+        子進程是否仍在執行
+        同一個子進程在 RUNNING_POLL_INTERVAL 內重複查詢時沿用上次的 poll() 結果
+        """
+        process = self.process
+        if process is None: return False
+        now = time.monotonic()
+        checked_at, polled, running = self._last_poll
+        if polled is process and now - checked_at < RUNNING_POLL_INTERVAL:
+            return running
+        running = process.poll() is None
+        self._last_poll = (now, process, running)
+        return running
 
     def stop(self):
         if self.is_running():